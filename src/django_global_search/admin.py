@@ -1,7 +1,11 @@
 """Global Search Admin."""
 
+from functools import update_wrapper
+
+from asgiref.sync import sync_to_async
 from django.contrib import admin
-from django.urls import path
+from django.urls import path, reverse
+from django.utils.cache import add_never_cache_headers
 
 from django_global_search.settings import GlobalSearchAdminSiteSettings
 
@@ -15,19 +19,52 @@ class GlobalSearchAdminSiteMixin:
 
     def get_urls(self):
         """Get admin URLs with global search."""
-        from django_global_search.views import GlobalSearchView
+        from django_global_search.views import (
+            AsyncGlobalSearchStreamView,
+            AsyncGlobalSearchView,
+            GlobalSearchStreamView,
+            GlobalSearchView,
+        )
 
         urls = super().get_urls()
 
+        if self.get_global_search_settings().async_enabled:
+            search_view = self.async_admin_view(AsyncGlobalSearchView.as_view(admin_site=self))
+            stream_view = self.async_admin_view(
+                AsyncGlobalSearchStreamView.as_view(admin_site=self)
+            )
+        else:
+            search_view = self.admin_view(GlobalSearchView.as_view(admin_site=self))
+            stream_view = self.admin_view(GlobalSearchStreamView.as_view(admin_site=self))
+
         custom_urls = [
-            path(
-                "global-search/",
-                self.admin_view(GlobalSearchView.as_view(admin_site=self)),
-                name="global_search",
-            ),
+            path("global-search/", search_view, name="global_search"),
+            path("global-search/stream/", stream_view, name="global_search_stream"),
         ]
         return custom_urls + urls
 
+    def async_admin_view(self, view):
+        """Async counterpart of ``AdminSite.admin_view``.
+
+        ``admin_view`` only wraps sync views, so the permission check runs through
+        ``sync_to_async`` here. The view must only handle safe methods (no CSRF check).
+        """
+
+        async def inner(request, *args, **kwargs):
+            if not await sync_to_async(self.has_permission)(request):
+                # Inner import, same as admin_view: auth views import auth models
+                from django.contrib.auth.views import redirect_to_login
+
+                return redirect_to_login(
+                    request.get_full_path(),
+                    reverse("admin:login", current_app=self.name),
+                )
+            response = await view(request, *args, **kwargs)
+            add_never_cache_headers(response)
+            return response
+
+        return update_wrapper(inner, view)
+
 
 def inject_default_admin_site():
     """Inject GlobalSearchAdminSiteMixin into default AdminSite."""
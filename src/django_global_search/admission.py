@@ -0,0 +1,191 @@
+"""Admission control of concurrent searches."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Seconds clients are asked to wait before retrying a rejected search (Retry-After header)
+SEARCH_REJECTED_RETRY_AFTER = 1
+
+# Added to the namespace of the admission controller of degraded searches
+DEGRADED_NAMESPACE_SUFFIX = ":degraded"
+
+
+class SearchRejectedError(Exception):
+    """Raised when too many searches are running to admit another one."""
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Admission metrics since the controller was created."""
+
+    running: int
+    """Searches running now."""
+    queued: int
+    """Searches waiting for a slot now."""
+    admitted: int
+    """Searches admitted."""
+    rejected: int
+    """Searches rejected."""
+    queue_wait_ms_total: int
+    """Time admitted searches waited in the queue, in milliseconds."""
+    queue_wait_ms_max: int
+    """Longest time an admitted search waited in the queue, in milliseconds."""
+
+
+class SearchAdmissionController:
+    """Limit the number of searches running at the same time in this process.
+
+    A search runs when less than ``max_searches`` searches run and its user runs
+    less than ``max_searches_per_user`` searches. Otherwise it waits in a queue
+    of at most ``max_queued`` searches, for at most ``queue_timeout`` seconds,
+    and is admitted in arrival order. Searches beyond the queue, past the queue
+    timeout, or beyond the per-user limit are rejected right away.
+    """
+
+    def __init__(
+        self,
+        max_searches: int | None = None,
+        max_searches_per_user: int | None = None,
+        max_queued: int = 0,
+        queue_timeout: float = 1.0,
+    ):
+        """Initialize controller.
+
+        :param max_searches: Maximum number of searches running at the same time, or None
+        :param max_searches_per_user: Maximum number of searches of a user, or None
+        :param max_queued: Maximum number of searches waiting for a slot
+        :param queue_timeout: Maximum time a search waits for a slot, in seconds
+        """
+        self.max_searches = max_searches
+        self.max_searches_per_user = max_searches_per_user
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+
+        self._condition = threading.Condition()
+        self._running = 0
+        self._running_per_user: dict[object, int] = {}
+        self._queue: deque[object] = deque()
+        self._admitted = 0
+        self._rejected = 0
+        self._queue_wait_ms_total = 0
+        self._queue_wait_ms_max = 0
+
+    def acquire(self, user_key) -> None:
+        """Wait for a slot to run a search of the user.
+
+        :param user_key: Key identifying the user (e.g. primary key)
+        :raises SearchRejectedError: If the search can't be admitted
+        """
+        start_time = time.perf_counter()
+        with self._condition:
+            if (
+                self.max_searches_per_user is not None
+                and self._running_per_user.get(user_key, 0) >= self.max_searches_per_user
+            ):
+                self._reject("per-user limit reached", start_time)
+
+            if not self._queue and self._has_free_slot():
+                self._admit(user_key, start_time)
+                return
+
+            if len(self._queue) >= self.max_queued:
+                self._reject("queue full", start_time)
+
+            ticket = object()
+            self._queue.append(ticket)
+            deadline = start_time + self.queue_timeout
+            try:
+                while self._queue[0] is not ticket or not self._has_free_slot():
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0 or not self._condition.wait(timeout):
+                        self._reject("queue timeout", start_time)
+            finally:
+                self._queue.remove(ticket)
+                # The next search in the queue may take the slot (or its turn) now
+                self._condition.notify_all()
+
+            self._admit(user_key, start_time)
+
+    def release(self, user_key) -> None:
+        """Free the slot of a finished search of the user."""
+        with self._condition:
+            self._running -= 1
+            remaining = self._running_per_user[user_key] - 1
+            if remaining:
+                self._running_per_user[user_key] = remaining
+            else:
+                del self._running_per_user[user_key]
+            self._condition.notify_all()
+
+    def get_stats(self) -> AdmissionStats:
+        """Get admission metrics."""
+        with self._condition:
+            return AdmissionStats(
+                running=self._running,
+                queued=len(self._queue),
+                admitted=self._admitted,
+                rejected=self._rejected,
+                queue_wait_ms_total=self._queue_wait_ms_total,
+                queue_wait_ms_max=self._queue_wait_ms_max,
+            )
+
+    def _has_free_slot(self) -> bool:
+        return self.max_searches is None or self._running < self.max_searches
+
+    def _admit(self, user_key, start_time: float) -> None:
+        wait_ms = int((time.perf_counter() - start_time) * 1000)
+        self._running += 1
+        self._running_per_user[user_key] = self._running_per_user.get(user_key, 0) + 1
+        self._admitted += 1
+        self._queue_wait_ms_total += wait_ms
+        self._queue_wait_ms_max = max(self._queue_wait_ms_max, wait_ms)
+        if wait_ms:
+            logger.debug("Search admitted after waiting %d ms", wait_ms)
+
+    def _reject(self, reason: str, start_time: float) -> None:
+        self._rejected += 1
+        wait_ms = int((time.perf_counter() - start_time) * 1000)
+        logger.warning("Search rejected (%s) after waiting %d ms", reason, wait_ms)
+        raise SearchRejectedError(reason)
+
+
+_controllers: dict[tuple, SearchAdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_admission_controller(
+    namespace: str,
+    max_searches: int | None = None,
+    max_searches_per_user: int | None = None,
+    max_queued: int = 0,
+    queue_timeout: float = 1.0,
+) -> SearchAdmissionController:
+    """Get the admission controller shared by all searches of the process.
+
+    :param namespace: Namespace of the searches (e.g. admin site name)
+    :param max_searches: Maximum number of searches running at the same time, or None
+    :param max_searches_per_user: Maximum number of searches of a user, or None
+    :param max_queued: Maximum number of searches waiting for a slot
+    :param queue_timeout: Maximum time a search waits for a slot, in seconds
+    """
+    key = (namespace, max_searches, max_searches_per_user, max_queued, queue_timeout)
+    with _controllers_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            controller = _controllers[key] = SearchAdmissionController(
+                max_searches, max_searches_per_user, max_queued, queue_timeout
+            )
+        return controller
+
+
+def clear_admission_controllers() -> None:
+    """Forget the admission controllers and their metrics."""
+    with _controllers_lock:
+        _controllers.clear()
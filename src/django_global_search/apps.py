@@ -1,9 +1,12 @@
 """Django Global Search AppConfig."""
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+from django.test.signals import setting_changed
 from django.utils.translation import gettext_lazy as _
 
 from django_global_search.admin import inject_default_admin_site
+from django_global_search.admin_urls import clear_url_templates_on_urlconf_change
 
 
 class DjangoGlobalSearchConfig(AppConfig):  # noqa: D101
@@ -12,8 +15,28 @@ class DjangoGlobalSearchConfig(AppConfig):  # noqa: D101
     verbose_name = _("Django Global Search")
 
     def ready(self):  # noqa: D102
+        from django_global_search.hydration import clear_hydration_plans
+        from django_global_search.registry import clear_search_registries
         from django_global_search.settings import global_search_settings
 
+        setting_changed.connect(
+            clear_url_templates_on_urlconf_change,
+            dispatch_uid="django_global_search.clear_url_templates",
+        )
+        setting_changed.connect(
+            clear_search_registries, dispatch_uid="django_global_search.clear_search_registries"
+        )
+        setting_changed.connect(
+            clear_hydration_plans, dispatch_uid="django_global_search.clear_hydration_plans"
+        )
+        # Content types get new ids when a test flushes the database
+        post_migrate.connect(
+            clear_search_registries, dispatch_uid="django_global_search.clear_search_registries"
+        )
+        post_migrate.connect(
+            clear_hydration_plans, dispatch_uid="django_global_search.clear_hydration_plans"
+        )
+
         if not global_search_settings.inject_default_admin_site_enabled:
             return
 
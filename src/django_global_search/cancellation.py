@@ -0,0 +1,81 @@
+"""Cancellation of searches superseded by a newer search of the same user."""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+from django.core.cache import caches
+
+# Minimum time between two cache lookups of the same token, in seconds
+CANCELLATION_CHECK_INTERVAL = 0.1
+
+# How long the latest search token of a user is kept in the cache, in seconds
+SEARCH_TOKEN_CACHE_TIMEOUT = 60 * 60
+
+SEARCH_TOKEN_CACHE_KEY_PREFIX = "global_search:search_token"  # noqa: S105
+
+
+class SearchCancelledError(Exception):
+    """Raised when a newer search of the same user supersedes a running search."""
+
+
+class SearchToken:
+    """Token of a running search, cancelled as soon as the user starts another search.
+
+    The latest token of each user is stored in the Django cache, so searches
+    running in other threads or processes see it.
+    """
+
+    def __init__(self, cache_alias: str, cache_key: str, token: str):
+        """Initialize token.
+
+        :param cache_alias: Django cache alias the latest token is stored in
+        :param cache_key: Cache key of the latest token of the user
+        :param token: Token of this search
+        """
+        self.cache_alias = cache_alias
+        self.cache_key = cache_key
+        self.token = token
+        self._cancelled = False
+        self._last_check = time.perf_counter()
+
+    @classmethod
+    def start(cls, cache_alias: str, namespace: str, user_pk) -> SearchToken:
+        """Start a search, cancelling the running searches of the same user.
+
+        :param cache_alias: Django cache alias the latest token is stored in
+        :param namespace: Namespace of the tokens (e.g. admin site name)
+        :param user_pk: Primary key of the user running the search
+        """
+        cache_key = f"{SEARCH_TOKEN_CACHE_KEY_PREFIX}:{namespace}:{user_pk}"
+        token = uuid.uuid4().hex
+        caches[cache_alias].set(cache_key, token, SEARCH_TOKEN_CACHE_TIMEOUT)
+        return cls(cache_alias, cache_key, token)
+
+    def is_cancelled(self) -> bool:
+        """Whether a newer search of the same user was started.
+
+        The cache is looked up at most every ``CANCELLATION_CHECK_INTERVAL`` seconds,
+        so this is cheap enough to call before every query.
+        """
+        if self._cancelled:
+            return True
+
+        now = time.perf_counter()
+        if now - self._last_check < CANCELLATION_CHECK_INTERVAL:
+            return False
+        self._last_check = now
+
+        latest_token = caches[self.cache_alias].get(self.cache_key)
+        # A token evicted from the cache doesn't cancel the search
+        self._cancelled = latest_token is not None and latest_token != self.token
+        return self._cancelled
+
+    def check(self) -> None:
+        """Raise if a newer search of the same user was started.
+
+        :raises SearchCancelledError: If the search was superseded
+        """
+        if self.is_cancelled():
+            raise SearchCancelledError
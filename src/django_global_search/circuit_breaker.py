@@ -0,0 +1,114 @@
+"""Circuit breaker skipping models whose searches keep failing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Circuit:
+    """Circuit of a model."""
+
+    failure_times: deque[float] = field(default_factory=deque)
+    opened_at: float | None = None
+    """When the circuit opened, None while closed."""
+    probe_started_at: float | None = None
+    """When the probe search of the half-open circuit started, None if no probe runs."""
+
+
+class CircuitBreaker:
+    """Skip the searches of models that time out or error repeatedly.
+
+    After ``failure_threshold`` failures within ``window`` seconds, the circuit
+    of a model opens and its searches are skipped for ``cooldown`` seconds.
+    The circuit then half-opens: a single search probes the model, closing the
+    circuit on success and opening it again on failure. A probe that doesn't
+    report back within ``cooldown`` seconds (e.g. cancelled search) is replaced.
+
+    Circuits are kept in process memory.
+    """
+
+    def __init__(self, failure_threshold: int, window: float, cooldown: float):
+        """Initialize circuit breaker.
+
+        :param failure_threshold: Number of failures opening the circuit
+        :param window: Time window failures are counted in, in seconds
+        :param cooldown: Time searches are skipped once the circuit opens, in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, model_label: str) -> bool:
+        """Whether the model may be searched now.
+
+        Allowing the search of a half-open circuit makes it the probe.
+
+        :param model_label: Model label (e.g. ``app_label.model_name``)
+        """
+        now = time.perf_counter()
+        with self._lock:
+            circuit = self._circuits.get(model_label)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            if now - circuit.opened_at < self.cooldown:
+                return False
+            probe_started_at = circuit.probe_started_at
+            if probe_started_at is not None and now - probe_started_at < self.cooldown:
+                return False
+            circuit.probe_started_at = now
+            return True
+
+    def record_success(self, model_label: str) -> None:
+        """Record a successful search of the model, closing its circuit."""
+        with self._lock:
+            self._circuits.pop(model_label, None)
+
+    def record_failure(self, model_label: str) -> None:
+        """Record a timed out or failed search of the model."""
+        now = time.perf_counter()
+        with self._lock:
+            circuit = self._circuits.setdefault(model_label, _Circuit())
+            if circuit.opened_at is not None:
+                if circuit.probe_started_at is not None:
+                    # The probe failed: skip the model for another cool-down
+                    circuit.opened_at = now
+                    circuit.probe_started_at = None
+                # Otherwise a search started before the circuit opened: already counted
+                return
+
+            circuit.failure_times.append(now)
+            while circuit.failure_times and now - circuit.failure_times[0] > self.window:
+                circuit.failure_times.popleft()
+            if len(circuit.failure_times) >= self.failure_threshold:
+                circuit.opened_at = now
+                circuit.failure_times.clear()
+
+
+_circuit_breakers: dict[tuple, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    namespace: str, failure_threshold: int, window: float, cooldown: float
+) -> CircuitBreaker:
+    """Get the circuit breaker shared by all searches of the process.
+
+    :param namespace: Namespace of the circuits (e.g. admin site name)
+    :param failure_threshold: Number of failures opening the circuit
+    :param window: Time window failures are counted in, in seconds
+    :param cooldown: Time searches are skipped once the circuit opens, in seconds
+    """
+    key = (namespace, failure_threshold, window, cooldown)
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(key)
+        if circuit_breaker is None:
+            circuit_breaker = _circuit_breakers[key] = CircuitBreaker(
+                failure_threshold, window, cooldown
+            )
+        return circuit_breaker
@@ -0,0 +1,293 @@
+"""Single-flight coalescing of identical concurrent searches."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, TypeVar
+
+from django.core.cache import caches
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+T = TypeVar("T")
+
+# How often followers in other processes look for the leader's result, in seconds
+COALESCING_POLL_INTERVAL = 0.05
+
+# How long followers wait for the leader after the search timeout, in seconds
+COALESCING_GRACE_PERIOD = 1.0
+
+# How long a shared result is kept for the followers of other processes, in seconds
+COALESCED_RESULT_TIMEOUT = 10
+
+COALESCING_CACHE_KEY_PREFIX = "global_search:coalescing"
+
+
+def get_permission_fingerprint(request: HttpRequest) -> str:
+    """Get a fingerprint of the permissions of the requesting user.
+
+    Users with the same permissions share it, whoever they are.
+    """
+    user = request.user
+    return f"{user.is_superuser}:{','.join(sorted(user.get_all_permissions()))}"
+
+
+def get_user_fingerprint(request: HttpRequest) -> str:
+    """Get a fingerprint of the requesting user, the default coalescing fingerprint.
+
+    Only searches of the same user share results, since ``ModelAdmin.get_queryset()``
+    may show each user other rows.
+    """
+    return f"{request.user.pk}:{get_permission_fingerprint(request)}"
+
+
+def get_coalescing_key(
+    namespace: str,
+    query: str,
+    content_type_ids: Iterable[int] | None,
+    fingerprint: str,
+) -> str:
+    """Get the key identifying identical searches.
+
+    :param namespace: Namespace of the searches (e.g. admin site name)
+    :param query: Normalized search query
+    :param content_type_ids: Selected content type IDs, or None
+    :param fingerprint: Permission fingerprint of the requesting user
+    """
+    content_types = ",".join(map(str, sorted(set(content_type_ids or []))))
+    key_data = "\n".join([namespace, query, content_types, fingerprint])
+    return hashlib.sha256(key_data.encode()).hexdigest()
+
+
+class _Flight:
+    """Search in progress in this process.
+
+    Followers wait for it from threads (:attr:`done`) or event loops (:meth:`wait`).
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+
+    def finish(self) -> None:
+        """Mark the flight done, waking up the followers of threads and event loops."""
+        with self._lock:
+            self.done.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_future_done, future)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the flight on the running event loop.
+
+        :param timeout: Maximum time to wait, in seconds
+        :return: Whether the flight is done
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.done.is_set():
+                return True
+            self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+def _set_future_done(future: asyncio.Future) -> None:
+    # The follower may have stopped waiting meanwhile
+    if not future.done():
+        future.set_result(None)
+
+
+class SearchCoalescer:
+    """Run identical concurrent searches once and share the result.
+
+    The first search of a key (the leader) runs; identical searches started
+    while it runs (the followers) wait for its result. Across processes, the
+    leader holds a lock in the Django cache and publishes its result there.
+
+    Followers run their own search when the leader fails or is still running
+    ``COALESCING_GRACE_PERIOD`` seconds after the search timeout.
+
+    Sync searches (:meth:`run`) and async searches (:meth:`arun`) of the same key
+    share their flights.
+    """
+
+    def __init__(self, cache_alias: str | None = None):
+        """Initialize coalescer.
+
+        :param cache_alias: Django cache alias to coalesce searches across processes, or None
+        """
+        self.cache_alias = cache_alias
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, search: Callable[[], T], timeout: float) -> T:
+        """Run ``search``, or wait for the result of an identical running search.
+
+        :param key: Key identifying identical searches
+        :param search: Callable running the search
+        :param timeout: Search timeout in seconds
+        :return: Search result
+        """
+        timeout += COALESCING_GRACE_PERIOD
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+            if flight.done.wait(timeout) and not flight.failed:
+                return flight.result
+            return search()
+
+        try:
+            flight.result = self._run_leader(key, search, timeout)
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.finish()
+        return flight.result
+
+    async def arun(self, key: str, search: Callable[[], Awaitable[T]], timeout: float) -> T:
+        """Run ``search``, or wait for the result of an identical running search, see :meth:`run`.
+
+        :param key: Key identifying identical searches
+        :param search: Async callable running the search
+        :param timeout: Search timeout in seconds
+        :return: Search result
+        """
+        timeout += COALESCING_GRACE_PERIOD
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+            if await flight.wait(timeout) and not flight.failed:
+                return flight.result
+            return await search()
+
+        try:
+            flight.result = await self._arun_leader(key, search, timeout)
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.finish()
+        return flight.result
+
+    def _run_leader(self, key: str, search: Callable[[], T], timeout: float) -> T:
+        """Run the search of this process, coalesced with other processes through the cache."""
+        if self.cache_alias is None:
+            return search()
+
+        cache = caches[self.cache_alias]
+        lock_key = f"{COALESCING_CACHE_KEY_PREFIX}:lock:{key}"
+        token = uuid.uuid4().hex
+
+        if cache.add(lock_key, token, math.ceil(timeout) + 1):
+            try:
+                result = search()
+                cache.set(
+                    f"{COALESCING_CACHE_KEY_PREFIX}:result:{key}:{token}",
+                    result,
+                    COALESCED_RESULT_TIMEOUT,
+                )
+                return result
+            finally:
+                cache.delete(lock_key)
+
+        # Another process runs the same search: wait for its result
+        leader_token = cache.get(lock_key)
+        result_key = f"{COALESCING_CACHE_KEY_PREFIX}:result:{key}:{leader_token}"
+        deadline = time.perf_counter() + timeout
+        while leader_token is not None and time.perf_counter() < deadline:
+            result = cache.get(result_key)
+            if result is not None:
+                return result
+            if cache.get(lock_key) != leader_token:
+                # The leader finished (its result may have been published meanwhile) or failed
+                result = cache.get(result_key)
+                if result is not None:
+                    return result
+                break
+            time.sleep(COALESCING_POLL_INTERVAL)
+
+        return search()
+
+    async def _arun_leader(self, key: str, search: Callable[[], Awaitable[T]], timeout: float) -> T:
+        """Run the search of this process, see :meth:`_run_leader`."""
+        if self.cache_alias is None:
+            return await search()
+
+        cache = caches[self.cache_alias]
+        lock_key = f"{COALESCING_CACHE_KEY_PREFIX}:lock:{key}"
+        token = uuid.uuid4().hex
+
+        if await cache.aadd(lock_key, token, math.ceil(timeout) + 1):
+            try:
+                result = await search()
+                await cache.aset(
+                    f"{COALESCING_CACHE_KEY_PREFIX}:result:{key}:{token}",
+                    result,
+                    COALESCED_RESULT_TIMEOUT,
+                )
+                return result
+            finally:
+                await cache.adelete(lock_key)
+
+        # Another process runs the same search: wait for its result
+        leader_token = await cache.aget(lock_key)
+        result_key = f"{COALESCING_CACHE_KEY_PREFIX}:result:{key}:{leader_token}"
+        deadline = time.perf_counter() + timeout
+        while leader_token is not None and time.perf_counter() < deadline:
+            result = await cache.aget(result_key)
+            if result is not None:
+                return result
+            if await cache.aget(lock_key) != leader_token:
+                # The leader finished (its result may have been published meanwhile) or failed
+                result = await cache.aget(result_key)
+                if result is not None:
+                    return result
+                break
+            await asyncio.sleep(COALESCING_POLL_INTERVAL)
+
+        return await search()
+
+
+_coalescers: dict[str | None, SearchCoalescer] = {}
+_coalescers_lock = threading.Lock()
+
+
+def get_search_coalescer(cache_alias: str | None = None) -> SearchCoalescer:
+    """Get the search coalescer shared by all searches of the process.
+
+    :param cache_alias: Django cache alias to coalesce searches across processes, or None
+    """
+    with _coalescers_lock:
+        coalescer = _coalescers.get(cache_alias)
+        if coalescer is None:
+            coalescer = _coalescers[cache_alias] = SearchCoalescer(cache_alias)
+        return coalescer
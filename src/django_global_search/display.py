@@ -0,0 +1,37 @@
+"""Declarative display text of search results."""
+
+from __future__ import annotations
+
+from functools import cache
+from string import Formatter
+
+
+@cache
+def get_display_fields(template: str) -> tuple[str, ...]:
+    """Get the fields a display template reads, in order of first use.
+
+    Placeholders name a field or a lookup through relations, as ``values()``
+    accepts them (e.g. ``"{number} - {customer__email}"``). They show the raw
+    values ``values()`` returns: the stored value of a field with choices, not
+    its label, and the primary key of a foreign key named without a lookup.
+
+    :param template: ``ModelAdmin.global_search_display``
+    :raises ValueError: If the template has positional or attribute placeholders
+    """
+    fields: list[str] = []
+    for _literal_text, field_name, _format_spec, _conversion in Formatter().parse(template):
+        if field_name is None:
+            continue
+        if not field_name.isidentifier():
+            raise ValueError(  # noqa: TRY003
+                f"Invalid placeholder {{{field_name}}} in global search display {template!r}: "
+                "placeholders must name a field"
+            )
+        if field_name not in fields:
+            fields.append(field_name)
+    return tuple(fields)
+
+
+def format_display(template: str, row: dict) -> str:
+    """Format the display text of a result from its ``values()`` row, without choice labels."""
+    return template.format_map(row)
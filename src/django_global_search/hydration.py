@@ -0,0 +1,181 @@
+"""Hydration plans: which fields and relations ``__str__`` reads."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import BinaryField, Field, JSONField, Model, TextField
+from django.db.models.constants import LOOKUP_SEP
+
+logger = logging.getLogger(__name__)
+
+# Fields whose values may weigh kilobytes, worth deferring when not displayed
+LARGE_FIELD_TYPES = (TextField, JSONField, BinaryField)
+
+# How deep relations followed by __str__ are recorded (e.g. author__publisher is 2)
+MAX_SELECT_RELATED_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class HydrationPlan:
+    """What ``__str__`` of a model reads, introspected on a loaded instance."""
+
+    str_fields: frozenset[str]
+    """Attribute names of the fields ``__str__`` reads (e.g. ``author_id``)."""
+    select_related: tuple[str, ...]
+    """Relations ``__str__`` follows, as ``select_related()`` paths."""
+
+
+_plans: dict[type[Model], HydrationPlan | None] = {}
+_plans_lock = threading.Lock()
+_n_plus_one_warned_models: set[type[Model]] = set()
+
+
+def is_hydration_plan_known(model: type[Model]) -> bool:
+    """Whether ``__str__`` of the model was introspected already."""
+    return model in _plans
+
+
+def get_hydration_plan(model: type[Model]) -> HydrationPlan | None:
+    """Get the hydration plan of the model.
+
+    None until :func:`record_hydration_plan` introspected the model, or if the
+    introspection failed.
+    """
+    return _plans.get(model)
+
+
+def get_deferred_fields(model: type[Model]) -> list[str]:
+    """Get the large fields of the model its ``__str__`` doesn't read."""
+    plan = get_hydration_plan(model)
+    if plan is None:
+        return []
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, LARGE_FIELD_TYPES)
+        and not field.primary_key
+        and field.attname not in plan.str_fields
+    ]
+
+
+def record_hydration_plan(instance: Model) -> None:
+    """Record which fields and relations ``__str__`` reads, from a fully loaded instance.
+
+    ``__str__`` runs on a copy of the instance whose field values and related
+    objects are all cleared:
+
+    - Reading a field calls ``refresh_from_db()``, which records the field and
+      copies its value from ``instance`` instead of querying it.
+    - Following a relation loads and caches the related object, which records
+      the relation. This runs a query per relation followed, once per model.
+
+    The plan is kept until :func:`clear_hydration_plans`.
+    """
+    model = type(instance)
+    read_fields: set[str] = set()
+    sample = copy.copy(instance)
+    for field in model._meta.concrete_fields:
+        if not field.primary_key:
+            sample.__dict__.pop(field.attname, None)
+    sample._state = copy.copy(instance._state)
+    sample._state.fields_cache = {}
+
+    def refresh_from_db(using=None, fields=None, **kwargs):
+        for field_name in fields or ():
+            read_fields.add(field_name)
+            # Fields deferred by the search queryset are loaded from the database
+            sample.__dict__[field_name] = getattr(instance, field_name)
+
+    sample.refresh_from_db = refresh_from_db
+    try:
+        str(sample)
+    except Exception:
+        logger.debug("Couldn't introspect the fields read by %s.__str__", model, exc_info=True)
+        plan = None
+    else:
+        plan = HydrationPlan(
+            str_fields=frozenset(read_fields),
+            select_related=tuple(_get_followed_relations(sample, "", {id(sample)})),
+        )
+
+    with _plans_lock:
+        _plans[model] = plan
+
+
+def clear_hydration_plans(**kwargs) -> None:
+    """Forget the hydration plans and N+1 warnings, e.g. when ``__str__`` changed.
+
+    Usable as a ``setting_changed`` or ``post_migrate`` receiver.
+    """
+    with _plans_lock:
+        _plans.clear()
+        _n_plus_one_warned_models.clear()
+
+
+def _get_followed_relations(instance: Model, prefix: str, seen: set[int]) -> list[str]:
+    """Get the ``select_related()`` paths of the related objects cached on ``instance``."""
+    paths = []
+    for cache_name, related_object in instance._state.fields_cache.items():
+        if _get_select_related_field(type(instance), cache_name) is None:
+            continue
+        path = f"{prefix}{cache_name}"
+        paths.append(path)
+        if (
+            related_object is not None
+            and id(related_object) not in seen
+            and path.count(LOOKUP_SEP) + 1 < MAX_SELECT_RELATED_DEPTH
+        ):
+            # Skip objects seen already, like the back reference of a one-to-one relation
+            seen.add(id(related_object))
+            paths.extend(_get_followed_relations(related_object, f"{path}{LOOKUP_SEP}", seen))
+    return paths
+
+
+def _get_select_related_field(model: type[Model], name: str) -> Field | None:
+    """Get the relation ``select_related()`` can follow under ``name``, or None.
+
+    Foreign keys and one-to-one relations in both directions; not generic foreign keys.
+    """
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if not (field.many_to_one or field.one_to_one):
+        return None
+    if not (field.concrete or field.auto_created):
+        return None
+    return field
+
+
+class QueryCounter:
+    """Database execute wrapper counting the queries run."""
+
+    def __init__(self):
+        """Initialize counter."""
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def warn_n_plus_one(model: type[Model], num_queries: int, num_objects: int) -> None:
+    """Warn, once per model and process, that building results ran a query per object."""
+    with _plans_lock:
+        if model in _n_plus_one_warned_models:
+            return
+        _n_plus_one_warned_models.add(model)
+
+    logger.warning(
+        "Building the global search results of %s ran %d queries for %d objects. "
+        "If __str__ follows relations, set global_search_select_related on its "
+        "ModelAdmin or enable GLOBAL_SEARCH_AUTO_SELECT_RELATED_ENABLED.",
+        model._meta.label,
+        num_queries,
+        num_objects,
+    )
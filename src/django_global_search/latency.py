@@ -0,0 +1,108 @@
+"""Observed model search latencies."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+from django.core.cache import caches
+
+# Weight of the latest measurement in the moving average
+EWMA_ALPHA = 0.2
+
+# How long shared estimates are kept in the cache, in seconds
+LATENCY_CACHE_TIMEOUT = 24 * 60 * 60
+
+LATENCY_CACHE_KEY_PREFIX = "global_search:latency"
+
+
+class LatencyTracker:
+    """Exponentially weighted moving average of the search time of each model.
+
+    Estimates are kept in process memory, and shared between processes through
+    the Django cache when a cache alias is given.
+    """
+
+    def __init__(self, namespace: str, cache_alias: str | None = None):
+        """Initialize tracker.
+
+        :param namespace: Namespace of the estimates (e.g. admin site name)
+        :param cache_alias: Django cache alias to share estimates through, or None
+        """
+        self.namespace = namespace
+        self.cache_alias = cache_alias
+        self._estimates: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _get_cache_key(self, model_label: str) -> str:
+        return f"{LATENCY_CACHE_KEY_PREFIX}:{self.namespace}:{model_label}"
+
+    def record(self, model_label: str, elapsed_ms: float) -> float:
+        """Add a measurement to the estimate of a model.
+
+        :param model_label: Model label (format: "app_label.model_name")
+        :param elapsed_ms: Measured search time in milliseconds
+        :return: Updated estimate in milliseconds
+        """
+        if self.cache_alias is not None:
+            cache = caches[self.cache_alias]
+            cache_key = self._get_cache_key(model_label)
+            previous = cache.get(cache_key)
+        else:
+            previous = None
+
+        with self._lock:
+            if previous is None:
+                previous = self._estimates.get(model_label)
+            estimate = (
+                float(elapsed_ms)
+                if previous is None
+                else EWMA_ALPHA * elapsed_ms + (1 - EWMA_ALPHA) * previous
+            )
+            self._estimates[model_label] = estimate
+
+        if self.cache_alias is not None:
+            cache.set(cache_key, estimate, LATENCY_CACHE_TIMEOUT)
+        return estimate
+
+    def get_estimates(self, model_labels: Iterable[str]) -> dict[str, float]:
+        """Get the estimates of the given models in milliseconds.
+
+        :param model_labels: Model labels (format: "app_label.model_name")
+        :return: Estimates by model label, without models that were never measured
+        """
+        model_labels = list(model_labels)
+        with self._lock:
+            estimates = {
+                label: self._estimates[label] for label in model_labels if label in self._estimates
+            }
+
+        if self.cache_alias is not None:
+            cache_keys = {self._get_cache_key(label): label for label in model_labels}
+            shared_estimates = caches[self.cache_alias].get_many(cache_keys)
+            estimates.update(
+                {cache_keys[cache_key]: value for cache_key, value in shared_estimates.items()}
+            )
+        return estimates
+
+    def clear(self) -> None:
+        """Forget the process-local estimates."""
+        with self._lock:
+            self._estimates.clear()
+
+
+_trackers: dict[tuple[str, str | None], LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(namespace: str, cache_alias: str | None = None) -> LatencyTracker:
+    """Get the latency tracker shared by all searches of the process.
+
+    :param namespace: Namespace of the estimates (e.g. admin site name)
+    :param cache_alias: Django cache alias to share estimates through, or None
+    """
+    with _trackers_lock:
+        tracker = _trackers.get((namespace, cache_alias))
+        if tracker is None:
+            tracker = _trackers[(namespace, cache_alias)] = LatencyTracker(namespace, cache_alias)
+        return tracker
@@ -12,6 +12,27 @@ if TYPE_CHECKING:
     from django.http import HttpRequest
 
 
+def is_searchable_model(model_admin: ModelAdmin, excluded_models: Iterable[str]) -> bool:
+    """Check if the model has ``search_fields`` and isn't excluded, whoever searches.
+
+    :param model_admin: ModelAdmin instance
+    :param excluded_models: Iterable of excluded model labels (format: "app_label.model_name")
+    :return: True if the model can be searched, False otherwise
+    """
+    # Check if model has search_fields configured
+    if not getattr(model_admin, "search_fields", None):
+        return False
+
+    excluded_models_set = (
+        set(excluded_models) if not isinstance(excluded_models, set) else excluded_models
+    )
+
+    model = model_admin.model
+    # Check if model is in excluded list
+    model_label = f"{model._meta.app_label}.{model._meta.model_name}"
+    return model_label not in excluded_models_set
+
+
 def has_search_permission(
     request: HttpRequest,
     model_admin: ModelAdmin,
@@ -24,8 +45,7 @@ def has_search_permission(
     :param excluded_models: Iterable of excluded model labels (format: "app_label.model_name")
     :return: True if user can search this model, False otherwise
     """
-    # Check if model has search_fields configured
-    if not getattr(model_admin, "search_fields", None):
+    if not is_searchable_model(model_admin, excluded_models):
         return False
 
     # Check module permission (app-level access)
@@ -33,17 +53,7 @@ def has_search_permission(
         return False
 
     # Check view permission (model-level access)
-    if not model_admin.has_view_permission(request):
-        return False
-
-    excluded_models_set = (
-        set(excluded_models) if not isinstance(excluded_models, set) else excluded_models
-    )
-
-    model = model_admin.model
-    # Check if model is in excluded list
-    model_label = f"{model._meta.app_label}.{model._meta.model_name}"
-    return model_label not in excluded_models_set
+    return model_admin.has_view_permission(request)
 
 
 def filter_searchable_models(
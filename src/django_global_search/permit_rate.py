@@ -0,0 +1,71 @@
+"""Observed object level view permission pass rates."""
+
+from __future__ import annotations
+
+import threading
+
+# Weight of the latest measurement in the moving average
+EWMA_ALPHA = 0.2
+
+# Lowest pass rate over-fetching is sized with, so rare viewable objects don't
+# make a model fetch its whole scan limit in one batch
+MIN_PERMIT_RATE = 0.05
+
+
+class PermitRateTracker:
+    """Exponentially weighted moving average of the share of viewable results.
+
+    Tracked per model and role, since users with the same permissions see the
+    same share of objects. Estimates are kept in process memory.
+    """
+
+    def __init__(self):
+        """Initialize tracker."""
+        self._estimates: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model_label: str, role: str, permitted: int, scanned: int) -> float:
+        """Add a measurement to the estimate of a model and role.
+
+        :param model_label: Model label (format: "app_label.model_name")
+        :param role: Key of the permissions of the user
+        :param permitted: Number of scanned objects the user may view
+        :param scanned: Number of objects whose permission was checked
+        :return: Updated estimate, between 0 and 1
+        """
+        rate = permitted / scanned
+        with self._lock:
+            previous = self._estimates.get((model_label, role))
+            estimate = rate if previous is None else EWMA_ALPHA * rate + (1 - EWMA_ALPHA) * previous
+            self._estimates[(model_label, role)] = estimate
+        return estimate
+
+    def get_estimate(self, model_label: str, role: str) -> float:
+        """Get the estimate of a model and role, ``1.0`` if it was never measured.
+
+        :return: Estimate, at least :data:`MIN_PERMIT_RATE`
+        """
+        with self._lock:
+            estimate = self._estimates.get((model_label, role), 1.0)
+        return max(estimate, MIN_PERMIT_RATE)
+
+    def clear(self) -> None:
+        """Forget the estimates."""
+        with self._lock:
+            self._estimates.clear()
+
+
+_trackers: dict[str, PermitRateTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_permit_rate_tracker(namespace: str) -> PermitRateTracker:
+    """Get the permit rate tracker shared by all searches of the process.
+
+    :param namespace: Namespace of the estimates (e.g. admin site name)
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(namespace)
+        if tracker is None:
+            tracker = _trackers[namespace] = PermitRateTracker()
+        return tracker
@@ -0,0 +1,109 @@
+"""Pipelined search queries on PostgreSQL with psycopg 3."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import nullcontext
+
+from django.core.exceptions import EmptyResultSet
+from django.db import DatabaseError, connections, transaction
+from django.db.models import QuerySet
+
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.timeouts import (
+    SearchTimeoutError,
+    is_query_canceled_error,
+    restore_statement_timeout,
+)
+
+
+def supports_pipeline(using: str) -> bool:
+    """Whether queries on the ``using`` database can be sent in one pipeline.
+
+    Requires PostgreSQL with psycopg 3 and a libpq supporting pipeline mode (14+).
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    # Only importable when a PostgreSQL driver is installed
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    if not is_psycopg3:
+        return False
+
+    import psycopg
+
+    return psycopg.Pipeline.is_supported()
+
+
+def fetch_pipelined(
+    using: str,
+    querysets: list[QuerySet],
+    timeout_ms: int | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> list[list[tuple]]:
+    """Run the queries of ``querysets`` in one pipeline, paying a single round trip.
+
+    Queries run in a savepoint, so a failing query doesn't break the
+    transaction of the request. They run on plain psycopg cursors, so driver
+    errors are raised as Django's :class:`~django.db.DatabaseError`.
+
+    :param using: Database alias, see :func:`supports_pipeline`
+    :param querysets: Querysets to evaluate, on the ``using`` database
+    :param timeout_ms: ``statement_timeout`` of the queries in milliseconds, or None
+    :param is_cancelled: Callable telling whether the search was cancelled, or None.
+        Checked before the pipeline is sent.
+    :return: Rows of each queryset, as ``values_list()`` returns them
+    :raises SearchTimeoutError: If the database cancelled the queries at ``timeout_ms``
+    :raises SearchCancelledError: If the search was cancelled
+    :raises DatabaseError: If a query failed
+    """
+    import psycopg
+
+    if is_cancelled is not None and is_cancelled():
+        raise SearchCancelledError
+
+    connection = connections[using]
+    compilers = [queryset.query.get_compiler(using) for queryset in querysets]
+    statements = []
+    for compiler in compilers:
+        try:
+            statements.append(compiler.as_sql())
+        except EmptyResultSet:
+            statements.append(None)
+
+    restore = restore_statement_timeout(using) if timeout_ms is not None else nullcontext()
+    try:
+        with restore, transaction.atomic(using=using):
+            raw_connection = connection.connection
+            cursors = []
+            with raw_connection.pipeline():
+                # Plain psycopg cursors, whatever cursor class the Django connection uses
+                if timeout_ms is not None:
+                    psycopg.Cursor(raw_connection).execute(
+                        f"SET LOCAL statement_timeout = {int(timeout_ms)}"
+                    )
+                for statement in statements:
+                    if statement is None:
+                        cursors.append(None)
+                        continue
+                    cursor = psycopg.Cursor(raw_connection)
+                    cursor.execute(*statement)
+                    cursors.append(cursor)
+            # Leaving the pipeline waits for the results of all queries
+            rows = [cursor.fetchall() if cursor is not None else [] for cursor in cursors]
+    except psycopg.Error as exc:
+        if is_query_canceled_error(exc):
+            raise SearchTimeoutError from exc
+        # Plain psycopg cursors bypass Django's error wrapping
+        raise DatabaseError(*exc.args) from exc
+
+    # Apply the field converters the way QuerySet iteration does
+    results = []
+    for compiler, compiler_rows in zip(compilers, rows):
+        if compiler_rows:
+            results.append([tuple(row) for row in compiler.results_iter(results=[compiler_rows])])
+        else:
+            results.append([])
+    return results
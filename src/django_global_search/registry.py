@@ -0,0 +1,94 @@
+"""Snapshot of the searchable models of an admin site, built once."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+
+from django_global_search.permissions import is_searchable_model
+
+if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+    from django.contrib.admin.sites import AdminSite
+    from django.db.models import Model
+
+    from django_global_search.settings import GlobalSearchAdminSiteSettings
+
+
+class SearchRegistry:
+    """Settings and searchable models of an admin site, shared by its searches.
+
+    Holds what doesn't depend on the request: the settings, the model admins
+    with ``search_fields`` that aren't excluded, and their content types.
+    Permissions are still checked for each search.
+    """
+
+    def __init__(self, admin_site: AdminSite):
+        """Take a snapshot of the admin site.
+
+        Content types are fetched on first use, so the snapshot can be taken
+        in async code.
+
+        :param admin_site: AdminSite instance with GlobalSearchAdminSiteMixin
+        """
+        self.settings: GlobalSearchAdminSiteSettings = admin_site.get_global_search_settings()
+        self._registry = dict(admin_site._registry)
+
+        excluded_models = set(self.settings.excluded_models)
+        self.model_admins: tuple[ModelAdmin, ...] = tuple(
+            model_admin
+            for model_admin in self._registry.values()
+            if is_searchable_model(model_admin, excluded_models)
+        )
+        """Model admins with ``search_fields`` that aren't excluded, in registry order."""
+
+        self._content_types: dict[type[Model], ContentType] | None = None
+        self._lock = threading.Lock()
+
+    def is_current(self, admin_site: AdminSite) -> bool:
+        """Whether models were neither registered nor unregistered since the snapshot."""
+        return self._registry == admin_site._registry
+
+    def get_content_type(self, model_admin: ModelAdmin) -> ContentType:
+        """Get the content type of the concrete model of a model admin."""
+        self._load_content_types()
+        return self._content_types[model_admin.model]
+
+    def _load_content_types(self) -> None:
+        if self._content_types is not None:
+            return
+        models = [model_admin.model for model_admin in self.model_admins]
+        with self._lock:
+            if self._content_types is None:
+                self._content_types = ContentType.objects.get_for_models(*models)
+
+
+_registries: weakref.WeakKeyDictionary[AdminSite, SearchRegistry] = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def get_search_registry(admin_site: AdminSite) -> SearchRegistry:
+    """Get the snapshot of an admin site, taking a new one if its registry changed.
+
+    :param admin_site: AdminSite instance with GlobalSearchAdminSiteMixin
+    """
+    registry = _registries.get(admin_site)
+    if registry is not None and registry.is_current(admin_site):
+        return registry
+
+    registry = SearchRegistry(admin_site)
+    with _registries_lock:
+        _registries[admin_site] = registry
+    return registry
+
+
+def clear_search_registries(**kwargs) -> None:
+    """Forget the snapshots, e.g. when settings change or content types are recreated.
+
+    Usable as a ``setting_changed`` or ``post_migrate`` receiver.
+    """
+    with _registries_lock:
+        _registries.clear()
@@ -0,0 +1,56 @@
+"""Database routing for search queries."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+    from django.http import HttpRequest
+
+SearchDatabaseAlias = Union[
+    str,
+    Iterable[str],
+    Callable[["HttpRequest", "ModelAdmin"], Union[str, None]],
+    None,
+]
+
+_alias_cycles: dict[tuple[str, ...], Iterator[str]] = {}
+_alias_cycles_lock = threading.Lock()
+
+
+def get_search_database(
+    search_database_alias: SearchDatabaseAlias,
+    request: HttpRequest,
+    model_admin: ModelAdmin,
+) -> str | None:
+    """Get the database alias the search queries of a model should run on.
+
+    :param search_database_alias: Database alias, list of aliases used in rotation,
+        or callable ``(request, model_admin) -> alias | None``
+    :param request: HTTP request object
+    :param model_admin: ModelAdmin instance
+    :return: Database alias, or None to keep the database of ``model_admin.get_queryset()``
+    """
+    if search_database_alias is None:
+        return None
+
+    if callable(search_database_alias):
+        return search_database_alias(request, model_admin)
+
+    if isinstance(search_database_alias, str):
+        return search_database_alias
+
+    aliases = tuple(search_database_alias)
+    if not aliases:
+        return None
+
+    # Round-robin shared by all searches of the process
+    with _alias_cycles_lock:
+        alias_cycle = _alias_cycles.get(aliases)
+        if alias_cycle is None:
+            alias_cycle = _alias_cycles[aliases] = itertools.cycle(aliases)
+        return next(alias_cycle)
@@ -0,0 +1,52 @@
+"""Search field lookups."""
+
+from __future__ import annotations
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from django.db.models.constants import LOOKUP_SEP
+
+# Prefixes of ModelAdmin.search_fields: istartswith, iexact and full-text search
+SEARCH_FIELD_PREFIXES = ("^", "=", "@")
+
+# Lookups that can't use a B-tree index, and the lookup replacing them in indexed searches
+INDEXED_LOOKUP_REPLACEMENTS = {
+    "icontains": "istartswith",
+    "contains": "startswith",
+}
+
+
+def get_indexed_search_field(model: type[Model], field_name: str) -> str:
+    """Get a search field that only uses lookups an index can serve.
+
+    Plain fields, which Django admin searches with ``icontains``, are searched
+    with ``istartswith`` (``^`` prefix). ``contains`` lookups become
+    ``startswith`` lookups. Prefixed fields and other lookups are kept.
+
+    :param model: Model searched by the ModelAdmin
+    :param field_name: Entry of ``ModelAdmin.get_search_fields()``
+    """
+    if field_name.startswith(SEARCH_FIELD_PREFIXES):
+        return field_name
+
+    # Find an explicit lookup the same way ModelAdmin.get_search_results() does
+    opts = model._meta
+    path_parts = field_name.split(LOOKUP_SEP)
+    prev_field = None
+    for position, path_part in enumerate(path_parts):
+        if path_part == "pk":
+            path_part = opts.pk.name
+        try:
+            field = opts.get_field(path_part)
+        except FieldDoesNotExist:
+            if prev_field and prev_field.get_lookup(path_part):
+                if position == len(path_parts) - 1 and path_part in INDEXED_LOOKUP_REPLACEMENTS:
+                    path_parts[-1] = INDEXED_LOOKUP_REPLACEMENTS[path_part]
+                    return LOOKUP_SEP.join(path_parts)
+                return field_name
+        else:
+            prev_field = field
+            if hasattr(field, "path_infos"):
+                opts = field.path_infos[-1].to_opts
+
+    return f"^{field_name}"
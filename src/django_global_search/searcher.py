@@ -2,23 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import math
+import queue
+import threading
 import time
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import ExitStack, asynccontextmanager, closing, contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
+from enum import Enum
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
+from asgiref.sync import sync_to_async
 from django.apps import apps
+from django.contrib.admin.options import BaseModelAdmin
 from django.contrib.admin.sites import AdminSite
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
-from django.urls import reverse
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Model, QuerySet
 from django.utils.translation import gettext as _
 
 from django_global_search.admin import GlobalSearchAdminSiteMixin
+from django_global_search.admin_urls import get_change_url, get_changelist_url
+from django_global_search.admission import (
+    DEGRADED_NAMESPACE_SUFFIX,
+    SearchAdmissionController,
+    SearchRejectedError,
+    get_admission_controller,
+)
+from django_global_search.cancellation import (
+    CANCELLATION_CHECK_INTERVAL,
+    SearchCancelledError,
+    SearchToken,
+)
+from django_global_search.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from django_global_search.coalescing import (
+    get_coalescing_key,
+    get_permission_fingerprint,
+    get_search_coalescer,
+    get_user_fingerprint,
+)
+from django_global_search.display import format_display, get_display_fields
+from django_global_search.hydration import (
+    QueryCounter,
+    get_deferred_fields,
+    get_hydration_plan,
+    is_hydration_plan_known,
+    record_hydration_plan,
+    warn_n_plus_one,
+)
+from django_global_search.latency import LatencyTracker, get_latency_tracker
 from django_global_search.permissions import filter_searchable_models
+from django_global_search.permit_rate import PermitRateTracker, get_permit_rate_tracker
+from django_global_search.pipeline import fetch_pipelined, supports_pipeline
+from django_global_search.registry import SearchRegistry, get_search_registry
+from django_global_search.routing import get_search_database
+from django_global_search.search_fields import get_indexed_search_field
 from django_global_search.settings import GlobalSearchAdminSiteSettings
+from django_global_search.timeouts import SearchTimeoutError, database_deadline
+from django_global_search.union import can_union, fetch_union_primary_keys, supports_union
 
 if TYPE_CHECKING:
     from django.contrib.admin import ModelAdmin
@@ -27,6 +75,44 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class ModelSearchStatus(str, Enum):
+    """How the search of a model ended."""
+
+    COMPLETED = "completed"
+    """The model was searched."""
+    TIMED_OUT = "timed_out"
+    """The search of the model was cancelled at the deadline."""
+    OVER_BUDGET = "over_budget"
+    """The search of the model was cancelled at the end of its own time budget.
+
+    The search went on with the other models.
+    """
+    SKIPPED = "skipped"
+    """The model was not searched."""
+    ERRORED = "errored"
+    """The search of the model raised an error."""
+    CIRCUIT_OPEN = "circuit_open"
+    """The model was skipped because its recent searches kept timing out or failing."""
+
+
+class SearchPhase(str, Enum):
+    """Which lookups of the search fields a search runs."""
+
+    FULL = "full"
+    """All lookups, like the changelist search (plain fields are searched with ``icontains``)."""
+    INDEXED = "indexed"
+    """Only lookups an index can serve (plain fields are searched with ``istartswith``)."""
+
+
+class Hydration(str, Enum):
+    """How the result objects of a model are loaded."""
+
+    TWO_STEP = "two_step"
+    """Fetch primary keys, then load the objects by primary key without the default JOINs."""
+    SINGLE_QUERY = "single_query"
+    """Load the objects in the limited search query itself, saving a round trip."""
+
+
 @dataclass(frozen=True)
 class SearchResultItem:
     """Search result item."""
@@ -35,17 +121,32 @@ class SearchResultItem:
     display_text: str
 
 
+@dataclass(frozen=True)
+class RankedSearchResultItem:
+    """Search result item of the top results of all models."""
+
+    url: str
+    display_text: str
+    content_type_id: int
+    app_label: str
+    model_name: str
+    verbose_name: str
+
+
 @dataclass(frozen=True)
 class ModelSearchResult:
     """Search results for a specific model."""
 
     content_type_id: int
+    app_label: str
     model_name: str
     verbose_name: str
     verbose_name_plural: str
     items: list[SearchResultItem]
     has_more: bool
     changelist_url: str | None = None
+    status: ModelSearchStatus = ModelSearchStatus.COMPLETED
+    elapsed_time_ms: int = 0
 
 
 @dataclass(frozen=True)
@@ -64,6 +165,49 @@ class GlobalSearchResult:
     apps: list[AppSearchResult]
     elapsed_time_ms: int
     is_timeout: bool = False
+    unsearched_models: list[ModelSearchResult] = field(default_factory=list)
+    """Models that were not completely searched (timed out, skipped or errored)."""
+    is_degraded: bool = False
+    """Whether a cheaper search ran because too many searches were running."""
+    top_results: list[RankedSearchResultItem] = field(default_factory=list)
+    """Best results of all models, highest ``global_search_priority`` first (top results mode)."""
+
+
+class ModelSearchResults(Iterator):
+    """Model search results of a running search, see :meth:`GlobalSearch.iter_search`.
+
+    Once every model search result was consumed, :attr:`search_result` holds the
+    :class:`GlobalSearchResult` the same search would return from
+    :meth:`GlobalSearch.search`, e.g. to tell whether it was degraded.
+    """
+
+    def __init__(self):
+        """Initialize results, the search generator is set by ``iter_search``."""
+        self.search_result: GlobalSearchResult | None = None
+        self._results: Iterator[ModelSearchResult] | None = None
+
+    def __next__(self) -> ModelSearchResult:
+        return next(self._results)
+
+    def close(self):
+        """Stop the search, dropping the model searches that didn't start yet."""
+        self._results.close()
+
+
+class AsyncModelSearchResults(AsyncIterator):
+    """Model search results of a running search, see :meth:`AsyncGlobalSearch.iter_search`."""
+
+    def __init__(self):
+        """Initialize results, the search generator is set by ``iter_search``."""
+        self.search_result: GlobalSearchResult | None = None
+        self._results: AsyncIterator[ModelSearchResult] | None = None
+
+    async def __anext__(self) -> ModelSearchResult:
+        return await self._results.__anext__()
+
+    async def aclose(self):
+        """Stop the search, cancelling the model searches still running."""
+        await self._results.aclose()
 
 
 class GlobalSearch:
@@ -81,208 +225,1963 @@ class GlobalSearch:
             )
 
         self.admin_site = admin_site
-        self.settings: GlobalSearchAdminSiteSettings = admin_site.get_global_search_settings()
+        self.registry: SearchRegistry = get_search_registry(admin_site)
+        self.settings: GlobalSearchAdminSiteSettings = self.registry.settings
+        self.latency_tracker: LatencyTracker | None = (
+            get_latency_tracker(admin_site.name, self.settings.latency_cache_alias)
+            if self.settings.cost_based_ordering_enabled
+            else None
+        )
+        self.admission_controller: SearchAdmissionController | None = (
+            get_admission_controller(
+                admin_site.name,
+                self.settings.max_concurrent_searches,
+                self.settings.max_concurrent_searches_per_user,
+                self.settings.max_queued_searches,
+                self.settings.queue_timeout_ms / 1000.0,
+            )
+            if self.settings.max_concurrent_searches is not None
+            or self.settings.max_concurrent_searches_per_user is not None
+            else None
+        )
+        self.circuit_breaker: CircuitBreaker | None = (
+            get_circuit_breaker(
+                admin_site.name,
+                self.settings.circuit_breaker_failure_threshold,
+                self.settings.circuit_breaker_window_ms / 1000.0,
+                self.settings.circuit_breaker_cooldown_ms / 1000.0,
+            )
+            if self.settings.circuit_breaker_failure_threshold is not None
+            else None
+        )
+        self.permit_rate_tracker: PermitRateTracker | None = (
+            get_permit_rate_tracker(admin_site.name)
+            if self.settings.permission_scan_limit is not None
+            else None
+        )
+        # Whether this searcher runs the cheaper search of rejected searches
+        self.is_degraded = False
+        self.search_phase = SearchPhase.FULL
+        # Position of each searchable model admin in the search order, for the top results
+        self.search_positions: list[int] = []
+        # Primary keys fetched in a pipeline, by (model label, database alias)
+        self.prefetched_primary_keys: dict[tuple[str, str], list] = {}
+        # Search database alias chosen for each model admin of the running search
+        self.search_databases: dict[ModelAdmin, str | None] = {}
+        # Token of the running search, when cancellation of superseded searches is enabled
+        self.search_token: SearchToken | None = None
+        # Set when the running search stops its worker threads (deadline, enough results)
+        self.search_stopped: threading.Event | None = None
 
     def search(
         self,
         request: HttpRequest,
         query: str,
         content_type_ids: list[int] | None = None,
+        phase: SearchPhase = SearchPhase.FULL,
     ) -> GlobalSearchResult:
         """Execute search.
 
         :param request: Request object
         :param query: Search query string
         :param content_type_ids: Optional list of content type IDs to filter
+        :param phase: Which lookups of the search fields to run
         :raises ValueError: If query is too short
+        :raises SearchRejectedError: If too many searches are running
         """
-        # Validate and normalize query
-        query = query.strip()
-        min_query_length = self.settings.min_query_length
-        if len(query) < min_query_length:
-            raise ValueError(
-                _("Query must be at least %(min_length)d characters")
-                % {"min_length": min_query_length}
-            )  # noqa: TRY003
+        if phase != self.search_phase:
+            return self._with_search_phase(phase).search(request, query, content_type_ids, phase)
+
+        query = self._normalize_query(query)
+
+        if self.settings.coalescing_enabled:
+            # Identical searches running at the same time share the result of the first one
+            return get_search_coalescer(self.settings.coalescing_cache_alias).run(
+                self._get_coalescing_key(request, query, content_type_ids),
+                lambda: self._search(request, query, content_type_ids),
+                self.settings.search_timeout_ms / 1000.0,
+            )
+        return self._search(request, query, content_type_ids)
+
+    def _search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> GlobalSearchResult:
+        """Execute search with a normalized query, once admitted."""
+        with self._admit(request) as searcher:
+            return searcher._run_search(request, query, content_type_ids)
+
+    def _run_search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> GlobalSearchResult:
+        """Execute search with a normalized query."""
+        start_time = time.perf_counter()
+
+        results_by_index: dict[int, ModelSearchResult] = {}
+        # Closing the search drops the model searches that didn't start yet
+        with closing(self._iter_search(request, query, content_type_ids)) as indexed_results:
+            for index, model_search_result in indexed_results:
+                results_by_index[index] = model_search_result
+                if self._has_enough_top_results(results_by_index):
+                    break
+
+        return self._build_search_result_by_index(results_by_index, start_time)
+
+    def iter_search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+        phase: SearchPhase = SearchPhase.FULL,
+    ) -> ModelSearchResults:
+        """Execute search, yielding each model search result as soon as it is produced.
+
+        One result is yielded per searchable model, whatever its status. Unlike
+        :meth:`search`, results that were already yielded are kept on timeout.
+        Once exhausted, ``search_result`` of the returned iterator holds the global
+        search result (degraded search, top results).
+
+        :param request: Request object
+        :param query: Search query string
+        :param content_type_ids: Optional list of content type IDs to filter
+        :param phase: Which lookups of the search fields to run
+        :raises ValueError: If query is too short
+        """
+        if phase != self.search_phase:
+            return self._with_search_phase(phase).iter_search(
+                request, query, content_type_ids, phase
+            )
+
+        # Validate before returning the generator, so errors are raised at call time
+        query = self._normalize_query(query)
+        model_search_results = ModelSearchResults()
+        model_search_results._results = self._iter_model_search_results(
+            request, query, content_type_ids, model_search_results
+        )
+        return model_search_results
+
+    def _iter_model_search_results(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None,
+        model_search_results: ModelSearchResults,
+    ) -> Iterator[ModelSearchResult]:
+        """Yield model search results once admitted, holding the search slot until done.
 
+        :raises SearchRejectedError: If too many searches are running
+        """
         start_time = time.perf_counter()
-        timeout_seconds = self.settings.search_timeout_ms / 1000.0
+        results_by_index: dict[int, ModelSearchResult] = {}
+        with self._admit(request) as searcher:
+            for index, model_search_result in searcher._iter_search(
+                request, query, content_type_ids
+            ):
+                results_by_index[index] = model_search_result
+                yield model_search_result
+
+            model_search_results.search_result = searcher._build_search_result_by_index(
+                results_by_index, start_time
+            )
+
+    def _iter_search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> Iterator[tuple[int, ModelSearchResult]]:
+        """Yield ``(model admin index, model search result)`` in completion order.
+
+        :raises SearchCancelledError: If the user started a newer search
+        """
+        deadline = time.perf_counter() + self.settings.search_timeout_ms / 1000.0
+        self.search_token = self._start_search_token(request)
+        self.search_stopped = None
+        self.search_databases = {}
 
         # Get searchable model admins
         model_admins = self.get_searchable_model_admins(request, content_type_ids)
+        if self.settings.max_results is not None:
+            self._set_search_positions(self._get_search_order(model_admins))
 
-        # Group results by app_label
-        search_results_by_app_label: dict[str, list[ModelSearchResult]] = defaultdict(list)
+        database_groups = (
+            self._group_model_admins_by_database(request, model_admins)
+            if self.settings.database_fan_out_enabled
+            else {}
+        )
 
-        for model_admin in model_admins:
-            # Check timeout
-            elapsed = time.perf_counter() - start_time
-            if elapsed > timeout_seconds:
-                # Return empty result on timeout for accuracy
-                elapsed_ms = int(elapsed * 1000)
-                return GlobalSearchResult(
-                    apps=[],
-                    elapsed_time_ms=elapsed_ms,
-                    is_timeout=True,
+        if len(database_groups) > 1:
+            yield from self._search_databases_concurrently(
+                request, model_admins, database_groups, query, deadline
+            )
+        elif self.settings.max_workers > 1 and len(model_admins) > 1:
+            yield from self._search_models_concurrently(request, model_admins, query, deadline)
+        else:
+            if self.settings.union_enabled or self.settings.pipeline_enabled:
+                self.prefetched_primary_keys = self._prefetch_primary_keys(
+                    request, model_admins, query, deadline
                 )
+            yield from self._search_models_sequentially(request, model_admins, query, deadline)
 
-            model_query_start_time = time.perf_counter()
-            model = model_admin.model
-            content_type = ContentType.objects.get_for_model(model)
-            model_search_result = self._search_model(request, model_admin, content_type, query)
+    def _get_coalescing_key(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> str:
+        """Get the key shared by identical searches with the same coalescing fingerprint."""
+        get_fingerprint = self.settings.coalescing_fingerprint or get_user_fingerprint
+        return get_coalescing_key(
+            f"{self.admin_site.name}:{self.search_phase.value}",
+            query,
+            content_type_ids,
+            get_fingerprint(request),
+        )
 
-            if model_search_result:
-                app_label = model._meta.app_label
-                search_results_by_app_label[app_label].append(model_search_result)
+    def _with_search_phase(self, phase: SearchPhase) -> GlobalSearch:
+        """Get a searcher running the given search phase."""
+        searcher = copy.copy(self)
+        searcher.search_phase = phase
+        return searcher
 
-            logger.debug(
-                "model_admin: %s - query elapsed: %s",
-                model_admin,
-                time.perf_counter() - model_query_start_time,
-            )
+    @contextmanager
+    def _admit(self, request: HttpRequest) -> Iterator[GlobalSearch]:
+        """Hold a search slot while the search runs.
 
-        # Build app results
-        app_results = []
-        for app_label in sorted(search_results_by_app_label.keys()):
-            models = search_results_by_app_label[app_label]
-            app_config = apps.get_app_config(app_label)
-            app_results.append(
-                AppSearchResult(
-                    app_label=app_label,
-                    app_verbose_name=app_config.verbose_name,
-                    models=models,
+        :return: Searcher to run the search with, a degraded one if the search was rejected
+        :raises SearchRejectedError: If the search was rejected and degraded searches are disabled
+        """
+        if self.admission_controller is None:
+            yield self
+            return
+
+        user_key = self._get_admission_key(request)
+        searcher = self._acquire_search_slot(user_key)
+        try:
+            yield searcher
+        finally:
+            # A degraded searcher holds a slot of the degraded searches
+            searcher.admission_controller.release(user_key)
+
+    def _get_admission_key(self, request: HttpRequest):
+        """Get the key counting the searches of the requesting user."""
+        return request.user.pk
+
+    def _acquire_search_slot(self, user_key) -> GlobalSearch:
+        """Wait for a search slot.
+
+        Rejected searches run a degraded search when enabled. Degraded searches
+        have their own slots, as many as the searches admitted, and never queue.
+
+        :return: This searcher once admitted, or a degraded searcher if the search was rejected
+        :raises SearchRejectedError: If the search was rejected and degraded searches are
+            disabled or have no free slot either
+        """
+        try:
+            self.admission_controller.acquire(user_key)
+        except SearchRejectedError:
+            if self.settings.degraded_search_timeout_ms is None:
+                raise
+            searcher = self._make_degraded_searcher()
+            searcher.admission_controller.acquire(user_key)
+            return searcher
+        return self
+
+    def _make_degraded_searcher(self) -> GlobalSearch:
+        """Make a searcher running a cheaper search, under the admission of degraded searches.
+
+        Models are searched one after another on a single connection, for at most
+        ``degraded_search_timeout_ms``, keeping the results of the models searched in time.
+        """
+        searcher = copy.copy(self)
+        searcher.settings = replace(
+            self.settings,
+            search_timeout_ms=self.settings.degraded_search_timeout_ms,
+            partial_results_enabled=True,
+            max_workers=1,
+            database_fan_out_enabled=False,
+        )
+        searcher.admission_controller = get_admission_controller(
+            f"{self.admin_site.name}{DEGRADED_NAMESPACE_SUFFIX}",
+            self.settings.max_concurrent_searches,
+            self.settings.max_concurrent_searches_per_user,
+        )
+        searcher.is_degraded = True
+        return searcher
+
+    def _start_search_token(self, request: HttpRequest) -> SearchToken | None:
+        """Start the token of a search, cancelling the running searches of the same user."""
+        if not self.settings.cancellation_enabled:
+            return None
+        return SearchToken.start(
+            self.settings.cancellation_cache_alias, self.admin_site.name, request.user.pk
+        )
+
+    def _get_is_cancelled(self) -> Callable[[], bool] | None:
+        """Get the callable telling whether the running search was cancelled, if it can be.
+
+        In worker threads, the search is also cancelled once it stopped its workers.
+        """
+        search_token, search_stopped = self.search_token, self.search_stopped
+        if search_stopped is None:
+            return search_token.is_cancelled if search_token is not None else None
+        if search_token is None:
+            return search_stopped.is_set
+        return lambda: search_stopped.is_set() or search_token.is_cancelled()
+
+    def _check_cancelled(self) -> None:
+        """Raise :class:`SearchCancelledError` if the user started a newer search."""
+        if self.search_token is not None:
+            self.search_token.check()
+
+    def _set_search_positions(self, search_order: list[int]) -> None:
+        """Remember the position of each model admin index in the search order."""
+        self.search_positions = [0] * len(search_order)
+        for position, index in enumerate(search_order):
+            self.search_positions[index] = position
+
+    def _has_enough_top_results(self, results_by_index: dict[int, ModelSearchResult]) -> bool:
+        """Whether the models still to search can't make it to the top results.
+
+        Models are ranked by their position in the search order, which puts higher
+        ``global_search_priority`` first. The search can stop once the models ranked
+        before every model still searching returned ``max_results`` results.
+        """
+        max_results = self.settings.max_results
+        if max_results is None:
+            return False
+
+        pending_positions = [
+            position
+            for index, position in enumerate(self.search_positions)
+            if index not in results_by_index
+        ]
+        if not pending_positions:
+            return False
+
+        first_pending_position = min(pending_positions)
+        result_count = sum(
+            len(model_search_result.items)
+            for index, model_search_result in results_by_index.items()
+            if self.search_positions[index] < first_pending_position
+        )
+        return result_count >= max_results
+
+    def _get_top_results(
+        self, results_by_index: dict[int, ModelSearchResult]
+    ) -> list[RankedSearchResultItem]:
+        """Merge the items of all models into the ranked top results."""
+        top_results = []
+        for index in sorted(results_by_index, key=self.search_positions.__getitem__):
+            model_search_result = results_by_index[index]
+            top_results.extend(
+                RankedSearchResultItem(
+                    url=item.url,
+                    display_text=item.display_text,
+                    content_type_id=model_search_result.content_type_id,
+                    app_label=model_search_result.app_label,
+                    model_name=model_search_result.model_name,
+                    verbose_name=model_search_result.verbose_name,
                 )
+                for item in model_search_result.items
             )
+        return top_results[: self.settings.max_results]
+
+    def _build_search_result_by_index(
+        self, results_by_index: dict[int, ModelSearchResult], start_time: float
+    ) -> GlobalSearchResult:
+        """Build the global search result from model search results by model admin index."""
+        # Results are produced in completion order, restore the registry order
+        model_search_results = [results_by_index[index] for index in sorted(results_by_index)]
+        result = self._build_global_search_result(model_search_results, start_time)
+
+        if self.settings.max_results is not None and result.apps:
+            result = replace(result, top_results=self._get_top_results(results_by_index))
+        return result
 
+    def _build_global_search_result(
+        self, model_search_results: list[ModelSearchResult], start_time: float
+    ) -> GlobalSearchResult:
+        """Merge model search results into an app-grouped global search result."""
         elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        is_timeout = any(
+            result.status in (ModelSearchStatus.TIMED_OUT, ModelSearchStatus.SKIPPED)
+            for result in model_search_results
+        )
+
+        if is_timeout and not self.settings.partial_results_enabled:
+            # Return empty result on timeout for accuracy
+            return GlobalSearchResult(
+                apps=[],
+                elapsed_time_ms=elapsed_ms,
+                is_timeout=True,
+                is_degraded=self.is_degraded,
+            )
+
+        completed_results = [
+            result
+            for result in model_search_results
+            if result.status == ModelSearchStatus.COMPLETED and result.items
+        ]
+        unsearched_models = [
+            result
+            for result in model_search_results
+            if result.status != ModelSearchStatus.COMPLETED
+        ]
 
         return GlobalSearchResult(
-            apps=app_results,
+            apps=self._group_results_by_app(completed_results),
             elapsed_time_ms=elapsed_ms,
-            is_timeout=False,
+            is_timeout=is_timeout,
+            unsearched_models=unsearched_models,
+            is_degraded=self.is_degraded,
         )
 
+    def _normalize_query(self, query: str) -> str:
+        """Validate and normalize query.
+
+        :raises ValueError: If query is too short
+        """
+        query = query.strip()
+        min_query_length = self.settings.min_query_length
+        if len(query) < min_query_length:
+            raise ValueError(
+                _("Query must be at least %(min_length)d characters")
+                % {"min_length": min_query_length}
+            )  # noqa: TRY003
+        return query
+
     def get_searchable_model_admins(
         self, request: HttpRequest, content_type_ids: list[int] | None = None
     ) -> list[ModelAdmin]:
         """Get list of searchable ModelAdmin instances."""
-        model_admins = list(self.admin_site._registry.values())
-
         return filter_searchable_models(
             request=request,
-            model_admins=model_admins,
+            model_admins=list(self.registry.model_admins),
             excluded_models=self.settings.excluded_models,
             content_type_ids=content_type_ids,
         )
 
-    def _search_model(
+    def _get_search_order(self, model_admins: list[ModelAdmin]) -> list[int]:
+        """Get model admin indexes in search order, highest ``global_search_priority`` first.
+
+        With cost-based ordering, models with the same priority are searched from the
+        fastest to the slowest observed search time. Otherwise they keep the registry order.
+        """
+        if self.latency_tracker is not None:
+            estimates = self.latency_tracker.get_estimates(
+                model_admin.model._meta.label_lower for model_admin in model_admins
+            )
+        else:
+            estimates = {}
+
+        def sort_key(index: int) -> tuple[int, float]:
+            model_admin = model_admins[index]
+            # Models never measured go first, so they get measured
+            estimate = estimates.get(model_admin.model._meta.label_lower, 0.0)
+            return -getattr(model_admin, "global_search_priority", 0), estimate
+
+        return sorted(range(len(model_admins)), key=sort_key)
+
+    def _record_model_latency(
+        self, model_admin: ModelAdmin, model_search_result: ModelSearchResult
+    ) -> None:
+        """Add the search time of a model to its latency estimate."""
+        if self.latency_tracker is None:
+            return
+        # Timed out searches still tell how long the model takes at least
+        if model_search_result.status in (
+            ModelSearchStatus.COMPLETED,
+            ModelSearchStatus.TIMED_OUT,
+            ModelSearchStatus.OVER_BUDGET,
+        ):
+            self.latency_tracker.record(
+                model_admin.model._meta.label_lower, model_search_result.elapsed_time_ms
+            )
+
+    def _is_model_search_allowed(self, model_admin: ModelAdmin) -> bool:
+        """Whether the circuit breaker lets the model be searched now."""
+        if self.circuit_breaker is None:
+            return True
+        return self.circuit_breaker.allow(model_admin.model._meta.label_lower)
+
+    def _record_model_outcome(self, model_admin: ModelAdmin, status: ModelSearchStatus) -> None:
+        """Report how the search of a model ended to the circuit breaker."""
+        if self.circuit_breaker is None:
+            return
+        model_label = model_admin.model._meta.label_lower
+        if status == ModelSearchStatus.COMPLETED:
+            self.circuit_breaker.record_success(model_label)
+        elif status in (
+            ModelSearchStatus.TIMED_OUT,
+            ModelSearchStatus.OVER_BUDGET,
+            ModelSearchStatus.ERRORED,
+        ):
+            self.circuit_breaker.record_failure(model_label)
+
+    def _get_model_deadline(
         self,
-        request: HttpRequest,
         model_admin: ModelAdmin,
-        ct: ContentType,
-        query: str,
-    ) -> ModelSearchResult | None:
-        """Search in a specific model using ModelAdmin's search configuration."""
-        model = model_admin.model
+        deadline: float,
+        models_left: int,
+        parallelism: int = 1,
+    ) -> float:
+        """Get the deadline of a model search starting now, never later than ``deadline``.
 
-        # Get base queryset with permissions applied
-        queryset = model_admin.get_queryset(request)
+        :param model_admin: ModelAdmin instance
+        :param deadline: Deadline of the whole search (or of the model's database)
+        :param models_left: Number of models still to search, including this one
+        :param parallelism: Number of models searched at the same time
+        """
+        now = time.perf_counter()
+        model_deadline = deadline
 
-        # Use Django admin's built-in search
-        queryset, use_distinct = model_admin.get_search_results(request, queryset, query)
+        timeout_ms = getattr(model_admin, "global_search_timeout_ms", None)
+        if timeout_ms is None:
+            timeout_ms = self.settings.model_timeout_ms
+        if timeout_ms is not None:
+            model_deadline = min(model_deadline, now + timeout_ms / 1000.0)
 
-        # Apply distinct if needed
-        if use_distinct:
-            queryset = queryset.distinct()
+        if self.settings.time_slicing_enabled and models_left > 0:
+            # Models still to search share the remaining time equally
+            rounds = math.ceil(models_left / parallelism)
+            model_deadline = min(model_deadline, now + (deadline - now) / rounds)
 
-        # Apply ordering for consistent results
-        ordering = model_admin.get_ordering(request)
-        if ordering:
-            queryset = queryset.order_by(*ordering)
+        return model_deadline
 
-        max_results = self.settings.max_results_per_model
+    def _search_models_sequentially(
+        self,
+        request: HttpRequest,
+        model_admins: list[ModelAdmin],
+        query: str,
+        deadline: float,
+    ) -> Iterator[tuple[int, ModelSearchResult]]:
+        """Search models one after another in the current thread.
 
-        # Fetch only primary keys to check result count efficiently
-        primary_keys = list(queryset.values_list("pk", flat=True)[: max_results + 1])
+        :return: Iterator of ``(model admin index, model search result)``
+        """
+        search_order = self._get_search_order(model_admins)
+        for position, index in enumerate(search_order):
+            model_admin = model_admins[index]
+            content_type = self.registry.get_content_type(model_admin)
+            self._check_cancelled()
 
-        if not primary_keys:
-            return None
+            # Check timeout
+            if time.perf_counter() > deadline:
+                yield (
+                    index,
+                    self._make_status_result(model_admin, content_type, ModelSearchStatus.SKIPPED),
+                )
+                continue
 
-        has_more = len(primary_keys) > max_results
-        if has_more:
-            primary_keys = primary_keys[:max_results]
+            model_deadline = self._get_model_deadline(
+                model_admin, deadline, len(search_order) - position
+            )
+            yield (
+                index,
+                self._run_model_search(
+                    request,
+                    model_admin,
+                    content_type,
+                    query,
+                    model_deadline,
+                    is_model_budget=model_deadline < deadline,
+                ),
+            )
 
-        # Create a mapping to preserve the original search result order
-        pk_to_position = {pk: position for position, pk in enumerate(primary_keys)}
+    def _prefetch_primary_keys(
+        self,
+        request: HttpRequest,
+        model_admins: list[ModelAdmin],
+        query: str,
+        deadline: float,
+    ) -> dict[tuple[str, str], list]:
+        """Fetch the primary keys of all models with one round trip per database.
 
-        # Fetch actual instances
-        # - select_related(None): Clear any default select_related, avoid unnecessary JOINs
-        # - order_by(): Clear ordering, sort in Python using pk_to_position
-        optimized_queryset = (
-            model._default_manager.using(queryset.db)
-            .filter(pk__in=primary_keys)
-            .select_related(None)
-            .order_by()
-        )
+        - ``union_enabled``: one UNION ALL query per database, for the querysets
+          that can be combined (see :func:`~django_global_search.union.can_union`)
+        - ``pipeline_enabled``: the remaining queries in one pipeline per
+          PostgreSQL database (psycopg 3)
 
-        # Sort instances to match the original search result order
-        results = sorted(
-            optimized_queryset,
-            key=lambda instance: pk_to_position[instance.pk],
-        )
+        Model searches then read their primary keys from the prefetched results
+        instead of paying a round trip each. Other models, and the models of a
+        failed prefetch, query their primary keys as usual.
 
-        # Build result items with permission check
-        result_items = []
-        for obj in results:
-            # Check object level view permission
-            if not model_admin.has_view_permission(request, obj):
+        :return: Primary keys by ``(model label, database alias)``
+        """
+        querysets_by_database: dict[str, list[tuple[str, QuerySet]]] = defaultdict(list)
+        for model_admin in model_admins:
+            if self._get_hydration(model_admin) == Hydration.SINGLE_QUERY:
+                # No primary key query to prefetch
+                continue
+            try:
+                queryset = self._get_search_queryset(request, model_admin, query)
+            except Exception:
+                # The model search builds the query again and reports the error
+                logger.debug(
+                    "Couldn't build the search query of %s, not prefetching its primary keys",
+                    model_admin,
+                    exc_info=True,
+                )
                 continue
+            search_database = self._get_search_database(request, model_admin)
+            if search_database:
+                queryset = queryset.using(search_database)
+            querysets_by_database[queryset.db].append(
+                (model_admin.model._meta.label_lower, queryset)
+            )
 
-            url = self._get_object_url(obj)
-            display_text = str(obj)
-            result_items.append(SearchResultItem(url=url, display_text=display_text))
+        prefetched_primary_keys = {}
+        for using, labeled_querysets in querysets_by_database.items():
+            if self.settings.union_enabled and supports_union(using):
+                unionable = [
+                    (label, queryset)
+                    for label, queryset in labeled_querysets
+                    if can_union(queryset)
+                ]
+                union_primary_keys = self._fetch_union_primary_keys(using, unionable, deadline)
+                prefetched_primary_keys.update(union_primary_keys)
+                labeled_querysets = [
+                    (label, queryset)
+                    for label, queryset in labeled_querysets
+                    if (label, using) not in union_primary_keys
+                ]
+            if self.settings.pipeline_enabled and supports_pipeline(using):
+                prefetched_primary_keys.update(
+                    self._fetch_pipelined_primary_keys(using, labeled_querysets, deadline)
+                )
 
-        if not result_items:
-            return None
+        return prefetched_primary_keys
 
-        # Get changelist URL
-        changelist_url = self._get_changelist_url(model_admin, query)
+    def _fetch_union_primary_keys(
+        self, using: str, labeled_querysets: list[tuple[str, QuerySet]], deadline: float
+    ) -> dict[tuple[str, str], list]:
+        """Fetch the primary keys of the models of a database in one UNION ALL query.
 
-        return ModelSearchResult(
-            content_type_id=ct.id,
-            model_name=model._meta.model_name,
-            verbose_name=str(model._meta.verbose_name),
-            verbose_name_plural=str(model._meta.verbose_name_plural),
-            items=result_items,
-            has_more=has_more,
-            changelist_url=changelist_url,
-        )
+        :return: Primary keys by ``(model label, database alias)``, empty if the query failed
+        """
+        if len(labeled_querysets) < 2:
+            # A single query doesn't save any round trip
+            return {}
 
-    def _get_object_url(self, obj: Model) -> str:
-        """Get admin change URL for object."""
-        admin_site_name = self.admin_site.name
-        app_label = obj._meta.app_label
-        model_name = obj._meta.model_name
-
-        return reverse(
-            f"admin:{app_label}_{model_name}_change",
-            args=[obj.pk],
-            current_app=admin_site_name,
-        )
+        if self.settings.database_timeout_enabled:
+            query_deadline = database_deadline(using, deadline, self._get_is_cancelled())
+        else:
+            query_deadline = nullcontext()
+        try:
+            # Savepoint, so a failed query doesn't break the transaction of the request
+            with transaction.atomic(using=using), query_deadline:
+                results = fetch_union_primary_keys(
+                    [queryset for _label, queryset in labeled_querysets],
+                    self.settings.max_results_per_model + 1,
+                )
+        except (DatabaseError, SearchTimeoutError):
+            logger.warning(
+                "UNION ALL search query failed on database %r, querying models one by one",
+                using,
+                exc_info=True,
+            )
+            return {}
 
-    def _get_changelist_url(self, model_admin: ModelAdmin, query: str) -> str | None:
-        """Get admin changelist URL with search query."""
-        model = model_admin.model
+        return {
+            (label, using): primary_keys
+            for (label, _queryset), primary_keys in zip(labeled_querysets, results)
+        }
+
+    def _fetch_pipelined_primary_keys(
+        self, using: str, labeled_querysets: list[tuple[str, QuerySet]], deadline: float
+    ) -> dict[tuple[str, str], list]:
+        """Fetch the primary keys of the models of a database in one pipeline.
 
-        admin_site_name = self.admin_site.name
-        app_label = model._meta.app_label
-        model_name = model._meta.model_name
-        viewname = f"admin:{app_label}_{model_name}_changelist"
+        :return: Primary keys by ``(model label, database alias)``, empty if the pipeline failed
+        """
+        if len(labeled_querysets) < 2:
+            # A single query doesn't save any round trip
+            return {}
 
+        timeout_ms = None
+        if self.settings.database_timeout_enabled:
+            timeout_ms = max(math.ceil((deadline - time.perf_counter()) * 1000), 1)
         try:
-            base_url = reverse(viewname, current_app=admin_site_name)
-        except Exception:
-            return None
-        else:
-            query_string = urlencode({"q": query})
-            return f"{base_url}?{query_string}"
+            pk_querysets = [
+                self._get_primary_keys_queryset(queryset) for _label, queryset in labeled_querysets
+            ]
+            results = fetch_pipelined(using, pk_querysets, timeout_ms, self._get_is_cancelled())
+        except (DatabaseError, SearchTimeoutError):
+            logger.warning(
+                "Pipelined search queries failed on database %r, querying models one by one",
+                using,
+                exc_info=True,
+            )
+            return {}
+
+        return {
+            (label, using): [row[0] for row in rows]
+            for (label, _queryset), rows in zip(labeled_querysets, results)
+        }
+
+    def _search_models_concurrently(
+        self,
+        request: HttpRequest,
+        model_admins: list[ModelAdmin],
+        query: str,
+        deadline: float,
+    ) -> Iterator[tuple[int, ModelSearchResult]]:
+        """Search models in a bounded thread pool.
+
+        Each worker thread opens its own database connections, which are closed
+        as soon as its model search finishes.
+
+        :return: Iterator of ``(model admin index, model search result)`` in completion order
+        """
+        # Resolve content types up front so workers don't race on the ContentType cache
+        content_types = self._get_content_types(model_admins)
+        max_workers = min(self.settings.max_workers, len(model_admins))
+        # Start time of each model search, to report how long timed out searches ran
+        start_times: dict[int, float] = {}
+        stopped = self.search_stopped = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="global_search")
+        try:
+            future_to_index = {
+                executor.submit(
+                    self._run_model_search_in_worker,
+                    request,
+                    model_admins[index],
+                    content_types[index],
+                    query,
+                    deadline,
+                    start_times,
+                    index,
+                    len(model_admins),
+                    max_workers,
+                    stopped,
+                ): index
+                # The pool starts queued searches in submission order
+                for index in self._get_search_order(model_admins)
+            }
+
+            remaining_indexes = set(future_to_index.values())
+            try:
+                for future in as_completed(
+                    future_to_index, timeout=max(deadline - time.perf_counter(), 0)
+                ):
+                    index = future_to_index[future]
+                    remaining_indexes.discard(index)
+                    yield index, future.result()
+                    self._check_cancelled()
+            except FuturesTimeoutError:
+                pass
+        finally:
+            # Drop queued searches; running ones stop at their next query and release
+            # their connections
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for index in sorted(remaining_indexes):
+            if index in start_times:
+                elapsed_ms = int((time.perf_counter() - start_times[index]) * 1000)
+                status_result = self._make_status_result(
+                    model_admins[index],
+                    content_types[index],
+                    ModelSearchStatus.TIMED_OUT,
+                    elapsed_ms,
+                )
+            else:
+                status_result = self._make_status_result(
+                    model_admins[index], content_types[index], ModelSearchStatus.SKIPPED
+                )
+            yield index, status_result
+
+    def _group_model_admins_by_database(
+        self, request: HttpRequest, model_admins: list[ModelAdmin]
+    ) -> dict[str, list[int]]:
+        """Group model admin indexes by the database their search queries run on.
+
+        That is the search database (see :meth:`_get_search_database`), or else the
+        database their queryset resolves to.
+        """
+        database_groups: dict[str, list[int]] = defaultdict(list)
+        for index, model_admin in enumerate(model_admins):
+            using = self._get_search_database(request, model_admin)
+            if using is None:
+                using = model_admin.get_queryset(request).db
+            database_groups[using].append(index)
+        return dict(database_groups)
+
+    def _get_search_database(self, request: HttpRequest, model_admin: ModelAdmin) -> str | None:
+        """Get the search database alias of a model, chosen once per search.
+
+        Rotating aliases would otherwise give the grouping by database and the
+        queries of the same model different databases.
+        """
+        try:
+            return self.search_databases[model_admin]
+        except KeyError:
+            pass
+        search_database = get_search_database(
+            self.settings.search_database_alias, request, model_admin
+        )
+        self.search_databases[model_admin] = search_database
+        return search_database
+
+    def _get_database_deadline(self, using: str, start_time: float, deadline: float) -> float:
+        """Get the deadline of the searches on a database, never later than ``deadline``."""
+        timeout_ms = self.settings.database_timeouts_ms.get(using)
+        if timeout_ms is None:
+            return deadline
+        return min(deadline, start_time + timeout_ms / 1000.0)
+
+    def _search_databases_concurrently(
+        self,
+        request: HttpRequest,
+        model_admins: list[ModelAdmin],
+        database_groups: dict[str, list[int]],
+        query: str,
+        deadline: float,
+    ) -> Iterator[tuple[int, ModelSearchResult]]:
+        """Search the models of each database in its own thread.
+
+        Models of the same database are searched one after another, within the
+        database's own time budget, so a slow database doesn't delay the others.
+
+        :param database_groups: Model admin indexes by database alias
+        :return: Iterator of ``(model admin index, model search result)`` in completion order
+        """
+        # Resolve content types up front so workers don't race on the ContentType cache
+        content_types = self._get_content_types(model_admins)
+        start_time = time.perf_counter()
+        # Start time of each model search, to report how long timed out searches ran
+        start_times: dict[int, float] = {}
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        stopped = self.search_stopped = threading.Event()
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(database_groups), thread_name_prefix="global_search"
+        )
+        remaining_indexes = set(range(len(model_admins)))
+        try:
+            search_positions = {
+                index: position
+                for position, index in enumerate(self._get_search_order(model_admins))
+            }
+            for using, indexes in database_groups.items():
+                executor.submit(
+                    self._search_database_in_worker,
+                    request,
+                    [
+                        (index, model_admins[index], content_types[index])
+                        for index in sorted(indexes, key=search_positions.__getitem__)
+                    ],
+                    query,
+                    self._get_database_deadline(using, start_time, deadline),
+                    start_times,
+                    results,
+                    stopped,
+                )
+
+            while remaining_indexes:
+                try:
+                    index, model_search_result = results.get(
+                        timeout=max(deadline - time.perf_counter(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if isinstance(model_search_result, BaseException):
+                    raise model_search_result
+                remaining_indexes.discard(index)
+                yield index, model_search_result
+        finally:
+            # Workers stop before their next model, running searches at their next query
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for index in sorted(remaining_indexes):
+            if index in start_times:
+                elapsed_ms = int((time.perf_counter() - start_times[index]) * 1000)
+                status_result = self._make_status_result(
+                    model_admins[index],
+                    content_types[index],
+                    ModelSearchStatus.TIMED_OUT,
+                    elapsed_ms,
+                )
+            else:
+                status_result = self._make_status_result(
+                    model_admins[index], content_types[index], ModelSearchStatus.SKIPPED
+                )
+            yield index, status_result
+
+    def _search_database_in_worker(
+        self,
+        request: HttpRequest,
+        indexed_model_admins: list[tuple[int, ModelAdmin, ContentType]],
+        query: str,
+        deadline: float,
+        start_times: dict[int, float],
+        results: queue.SimpleQueue,
+        stopped: threading.Event,
+    ) -> None:
+        """Search the models of one database in a worker thread, in search order.
+
+        Results, or the exception failing the search, are put on ``results``.
+        """
+        try:
+            for position, (index, model_admin, content_type) in enumerate(indexed_model_admins):
+                if stopped.is_set():
+                    return
+                self._check_cancelled()
+
+                # Check the database timeout
+                if time.perf_counter() > deadline:
+                    results.put(
+                        (
+                            index,
+                            self._make_status_result(
+                                model_admin, content_type, ModelSearchStatus.SKIPPED
+                            ),
+                        )
+                    )
+                    continue
+
+                start_times[index] = time.perf_counter()
+                model_deadline = self._get_model_deadline(
+                    model_admin, deadline, len(indexed_model_admins) - position
+                )
+                results.put(
+                    (
+                        index,
+                        self._run_model_search(
+                            request,
+                            model_admin,
+                            content_type,
+                            query,
+                            model_deadline,
+                            is_model_budget=model_deadline < deadline,
+                        ),
+                    )
+                )
+        except Exception as exc:
+            results.put((None, exc))
+        finally:
+            # Connections are thread-local: this only closes the ones opened by this worker
+            connections.close_all()
+
+    def _run_model_search_in_worker(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        deadline: float,
+        start_times: dict[int, float],
+        index: int,
+        model_count: int,
+        parallelism: int,
+        stopped: threading.Event,
+    ) -> ModelSearchResult:
+        """Run :meth:`_run_model_search` in a worker thread and close its connections afterwards.
+
+        Models picked up after the deadline, or after the search stopped, are skipped.
+        """
+        if stopped.is_set() or time.perf_counter() >= deadline:
+            return self._make_status_result(model_admin, ct, ModelSearchStatus.SKIPPED)
+        self._check_cancelled()
+        models_left = model_count - len(start_times)
+        start_times[index] = time.perf_counter()
+        try:
+            model_deadline = self._get_model_deadline(
+                model_admin, deadline, models_left, parallelism
+            )
+            return self._run_model_search(
+                request,
+                model_admin,
+                ct,
+                query,
+                model_deadline,
+                is_model_budget=model_deadline < deadline,
+            )
+        finally:
+            # Connections are thread-local: this only closes the ones opened by this worker
+            connections.close_all()
+
+    def _run_model_search(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        deadline: float,
+        is_model_budget: bool = False,
+    ) -> ModelSearchResult:
+        """Search a model and record how the search ended.
+
+        Errors are only caught when partial results are enabled.
+
+        :param is_model_budget: Whether ``deadline`` is the model's own time budget, which
+            skips the model instead of timing out the search
+        """
+        if not self._is_model_search_allowed(model_admin):
+            return self._make_status_result(model_admin, ct, ModelSearchStatus.CIRCUIT_OPEN)
+
+        model_query_start_time = time.perf_counter()
+        try:
+            model_search_result = self._search_model(request, model_admin, ct, query, deadline)
+        except SearchTimeoutError:
+            model_search_result = None
+            status = ModelSearchStatus.TIMED_OUT
+            if is_model_budget:
+                status = ModelSearchStatus.OVER_BUDGET
+        except SearchCancelledError:
+            raise
+        except Exception:
+            if not self.settings.partial_results_enabled:
+                self._record_model_outcome(model_admin, ModelSearchStatus.ERRORED)
+                raise
+            logger.exception("Search error occurred for model_admin: %s", model_admin)
+            model_search_result, status = None, ModelSearchStatus.ERRORED
+        else:
+            status = ModelSearchStatus.COMPLETED
+
+        model_search_result = self._finish_model_search(
+            model_admin, ct, model_search_result, status, model_query_start_time
+        )
+        self._record_model_latency(model_admin, model_search_result)
+        self._record_model_outcome(model_admin, model_search_result.status)
+        return model_search_result
+
+    def _finish_model_search(
+        self,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        model_search_result: ModelSearchResult | None,
+        status: ModelSearchStatus,
+        model_query_start_time: float,
+    ) -> ModelSearchResult:
+        """Attach the status and elapsed time to a model search result."""
+        elapsed = time.perf_counter() - model_query_start_time
+        logger.debug("model_admin: %s - query elapsed: %s (%s)", model_admin, elapsed, status)
+
+        elapsed_ms = int(elapsed * 1000)
+        if model_search_result is None:
+            return self._make_status_result(model_admin, ct, status, elapsed_ms)
+        return replace(model_search_result, status=status, elapsed_time_ms=elapsed_ms)
+
+    def _make_status_result(
+        self,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        status: ModelSearchStatus,
+        elapsed_time_ms: int = 0,
+    ) -> ModelSearchResult:
+        """Build a model search result without items."""
+        model = model_admin.model
+        return ModelSearchResult(
+            content_type_id=ct.id,
+            app_label=model._meta.app_label,
+            model_name=model._meta.model_name,
+            verbose_name=str(model._meta.verbose_name),
+            verbose_name_plural=str(model._meta.verbose_name_plural),
+            items=[],
+            has_more=False,
+            status=status,
+            elapsed_time_ms=elapsed_time_ms,
+        )
+
+    def _get_content_types(self, model_admins: list[ModelAdmin]) -> list[ContentType]:
+        """Get content types of the given model admins, in the same order."""
+        return [self.registry.get_content_type(model_admin) for model_admin in model_admins]
+
+    def _group_results_by_app(
+        self, model_search_results: list[ModelSearchResult]
+    ) -> list[AppSearchResult]:
+        """Group model search results by app, in app_label alphabetical order."""
+        search_results_by_app_label: dict[str, list[ModelSearchResult]] = defaultdict(list)
+        for model_search_result in model_search_results:
+            search_results_by_app_label[model_search_result.app_label].append(model_search_result)
+
+        app_results = []
+        for app_label in sorted(search_results_by_app_label.keys()):
+            models = search_results_by_app_label[app_label]
+            app_config = apps.get_app_config(app_label)
+            app_results.append(
+                AppSearchResult(
+                    app_label=app_label,
+                    app_verbose_name=app_config.verbose_name,
+                    models=models,
+                )
+            )
+        return app_results
+
+    def _search_model(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        deadline: float | None = None,
+    ) -> ModelSearchResult | None:
+        """Search in a specific model using ModelAdmin's search configuration.
+
+        :param deadline: Optional ``time.perf_counter()`` value after which the
+            database cancels the search queries
+        :raises SearchTimeoutError: If a query runs past ``deadline``
+        """
+        queryset = self._get_search_queryset(request, model_admin, query)
+
+        search_database = self._get_search_database(request, model_admin)
+        if search_database and search_database != queryset.db:
+            try:
+                return self._search_queryset(
+                    request, model_admin, ct, query, queryset.using(search_database), deadline
+                )
+            except DatabaseError:
+                # Fall back to the database the ModelAdmin queryset resolves to
+                logger.warning(
+                    "Search on database %r failed for model_admin: %s, falling back to %r",
+                    search_database,
+                    model_admin,
+                    queryset.db,
+                    exc_info=True,
+                )
+
+        return self._search_queryset(request, model_admin, ct, query, queryset, deadline)
+
+    def _search_queryset(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        queryset: QuerySet,
+        deadline: float | None = None,
+    ) -> ModelSearchResult | None:
+        """Run the search queries of a model on the database of ``queryset``."""
+        max_results = self.settings.max_results_per_model
+
+        if deadline is not None and self.settings.database_timeout_enabled:
+            query_deadline = database_deadline(queryset.db, deadline, self._get_is_cancelled())
+        else:
+            query_deadline = nullcontext()
+
+        with query_deadline:
+            if self._uses_permission_scan(model_admin):
+                instances, has_more = self._scan_viewable_instances(request, model_admin, queryset)
+                return self._build_model_search_result(
+                    request,
+                    model_admin,
+                    ct,
+                    query,
+                    instances,
+                    [instance.pk for instance in instances],
+                    has_more,
+                    is_permission_checked=True,
+                )
+
+            if self._get_hydration(model_admin) == Hydration.SINGLE_QUERY:
+                instances = self._deduplicate_instances(
+                    self._get_single_query_instances_queryset(model_admin, queryset)[
+                        : max_results + 1
+                    ]
+                )
+                primary_keys = [self._get_instance_pk(instance) for instance in instances]
+            else:
+                primary_keys = self.prefetched_primary_keys.pop(
+                    (model_admin.model._meta.label_lower, queryset.db), None
+                )
+                if primary_keys is None:
+                    primary_keys = list(self._get_primary_keys_queryset(queryset))
+                instances = None
+
+            if not primary_keys:
+                return None
+
+            has_more = len(primary_keys) > max_results
+            if has_more:
+                primary_keys = primary_keys[:max_results]
+
+            if instances is None:
+                instances = list(
+                    self._get_instances_queryset(model_admin, queryset.db, primary_keys)
+                )
+            else:
+                instances = instances[:max_results]
+
+            # __str__ may query related objects as well
+            return self._build_model_search_result(
+                request, model_admin, ct, query, instances, primary_keys, has_more
+            )
+
+    def _uses_permission_scan(self, model_admin: ModelAdmin) -> bool:
+        """Whether the search of a model pages through results dropped by object permissions.
+
+        Only with ``permission_scan_limit``, for models checking the object level
+        view permission after the search query.
+        """
+        if self.permit_rate_tracker is None:
+            return False
+        if self._get_display_template(model_admin) is not None:
+            return False
+        if hasattr(model_admin, "get_global_search_permitted_queryset"):
+            return False
+        return hasattr(model_admin, "has_view_permission_bulk") or self._overrides_view_permission(
+            model_admin
+        )
+
+    def _scan_viewable_instances(
+        self, request: HttpRequest, model_admin: ModelAdmin, queryset: QuerySet
+    ) -> tuple[list[Model], bool]:
+        """Page through the search results until a page of viewable objects is found.
+
+        Batches are over-fetched by the observed share of viewable objects of the
+        model for users with the same permissions, and the scan stops once a page
+        is full, the results are exhausted, or ``permission_scan_limit`` objects
+        were checked.
+
+        :return: Viewable instances in search order (at most ``max_results_per_model``),
+            and whether there are more
+        """
+        max_results = self.settings.max_results_per_model
+        scan_limit = max(self.settings.permission_scan_limit, max_results + 1)
+        model_label = model_admin.model._meta.label_lower
+        role = get_permission_fingerprint(request)
+        is_single_query = self._get_hydration(model_admin) == Hydration.SINGLE_QUERY
+        if is_single_query:
+            instances_queryset = self._get_single_query_instances_queryset(model_admin, queryset)
+            prefetched_primary_keys = None
+        else:
+            primary_keys_queryset = queryset.values_list("pk", flat=True)
+            prefetched_primary_keys = self.prefetched_primary_keys.pop(
+                (model_label, queryset.db), None
+            )
+
+        viewable_instances: list[Model] = []
+        scanned = 0
+        is_exhausted = False
+        while len(viewable_instances) <= max_results and scanned < scan_limit:
+            if scanned == 0 and prefetched_primary_keys is not None:
+                batch_size, primary_keys = max_results + 1, prefetched_primary_keys
+            else:
+                permit_rate = self.permit_rate_tracker.get_estimate(model_label, role)
+                wanted = max_results + 1 - len(viewable_instances)
+                batch_size = min(math.ceil(wanted / permit_rate), scan_limit - scanned)
+                if is_single_query:
+                    instances = list(instances_queryset[scanned : scanned + batch_size])
+                    primary_keys = [instance.pk for instance in instances]
+                else:
+                    primary_keys = list(primary_keys_queryset[scanned : scanned + batch_size])
+
+            if not is_single_query:
+                pk_to_position = {pk: position for position, pk in enumerate(primary_keys)}
+                instances = sorted(
+                    self._get_instances_queryset(model_admin, queryset.db, primary_keys),
+                    key=lambda instance: pk_to_position[instance.pk],
+                )
+
+            if instances:
+                batch_viewable_instances = self._filter_viewable_instances(
+                    request, model_admin, instances
+                )
+                self.permit_rate_tracker.record(
+                    model_label, role, len(batch_viewable_instances), len(instances)
+                )
+                viewable_instances.extend(batch_viewable_instances)
+            scanned += len(primary_keys)
+            if len(primary_keys) < batch_size:
+                is_exhausted = True
+                break
+
+        has_more = len(viewable_instances) > max_results or not is_exhausted
+        return viewable_instances[:max_results], has_more
+
+    def _get_primary_keys_queryset(self, queryset: QuerySet) -> QuerySet:
+        """Fetch only primary keys, one more than displayed to check if there are more."""
+        return queryset.values_list("pk", flat=True)[: self.settings.max_results_per_model + 1]
+
+    def _get_hydration(self, model_admin: ModelAdmin) -> Hydration:
+        """Get how the result objects of a model are loaded."""
+        return Hydration(getattr(model_admin, "global_search_hydration", self.settings.hydration))
+
+    def _get_single_query_instances_queryset(
+        self, model_admin: ModelAdmin, queryset: QuerySet
+    ) -> QuerySet:
+        """Load the objects in the search query itself.
+
+        - select_related(None): Clear any default select_related, avoid unnecessary JOINs
+        - values(): Load the display fields only, see :meth:`_get_display_template`
+        - only(): Load ``ModelAdmin.global_search_only_fields`` when set
+        - defer(): Skip large fields ``__str__`` doesn't read, see :meth:`_get_deferred_fields`
+        - select_related(): Join the relations ``__str__`` follows, see
+          :meth:`_get_select_related`
+        """
+        queryset = queryset.select_related(None)
+        display_template = self._get_display_template(model_admin)
+        if display_template is not None:
+            return queryset.values("pk", *get_display_fields(display_template))
+        only_fields = getattr(model_admin, "global_search_only_fields", None)
+        if only_fields:
+            queryset = queryset.only(*only_fields)
+        return self._apply_hydration_plan(model_admin, queryset)
+
+    def _deduplicate_instances(self, instances: Iterable[Model | dict]) -> list[Model | dict]:
+        """Drop repeated objects, keeping the first occurrence.
+
+        A distinct search ordered by a multi-valued relation selects the ordering
+        columns too, so it may still return an object several times.
+        """
+        seen_primary_keys = set()
+        unique_instances = []
+        for instance in instances:
+            pk = self._get_instance_pk(instance)
+            if pk not in seen_primary_keys:
+                seen_primary_keys.add(pk)
+                unique_instances.append(instance)
+        return unique_instances
+
+    def _get_instance_pk(self, instance: Model | dict):
+        """Get the primary key of a loaded object or display row."""
+        return instance["pk"] if isinstance(instance, dict) else instance.pk
+
+    def _get_display_template(self, model_admin: ModelAdmin) -> str | None:
+        """Get the display template results of a model are built from without instances.
+
+        ``ModelAdmin.global_search_display`` only applies when the object level
+        permission check doesn't need an instance: ``has_view_permission()`` isn't
+        overridden (the default implementation doesn't look at the object), or
+        ``get_global_search_permitted_queryset()`` checks it in the query.
+        """
+        display_template = getattr(model_admin, "global_search_display", None)
+        if display_template is None:
+            return None
+        if self._overrides_view_permission(model_admin) and not hasattr(
+            model_admin, "get_global_search_permitted_queryset"
+        ):
+            return None
+        return display_template
+
+    def _overrides_view_permission(self, model_admin: ModelAdmin) -> bool:
+        """Whether ``has_view_permission()`` of a model admin isn't Django's default one."""
+        has_view_permission = getattr(model_admin.has_view_permission, "__func__", None)
+        return has_view_permission is not BaseModelAdmin.has_view_permission
+
+    def _get_search_queryset(
+        self, request: HttpRequest, model_admin: ModelAdmin, query: str
+    ) -> QuerySet:
+        """Build the filtered and ordered search queryset for a model."""
+        if self.search_phase == SearchPhase.INDEXED:
+            model_admin = self._get_indexed_model_admin(request, model_admin)
+
+        # Get base queryset with permissions applied
+        queryset = model_admin.get_queryset(request)
+        get_permitted_queryset = getattr(model_admin, "get_global_search_permitted_queryset", None)
+        if get_permitted_queryset is not None:
+            # Object level permission in the query, so the limit yields a full page
+            queryset = get_permitted_queryset(request, queryset)
+
+        # Use Django admin's built-in search
+        queryset, use_distinct = model_admin.get_search_results(request, queryset, query)
+
+        # Apply distinct if needed
+        if use_distinct:
+            queryset = queryset.distinct()
+
+        # Apply ordering for consistent results
+        ordering = model_admin.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+
+        return queryset
+
+    def _get_indexed_model_admin(self, request: HttpRequest, model_admin: ModelAdmin) -> ModelAdmin:
+        """Get a copy of ``model_admin`` whose search only runs lookups an index can serve.
+
+        Custom ``get_search_results()`` calling ``super()`` get the indexed search fields too.
+        """
+        search_fields = [
+            get_indexed_search_field(model_admin.model, field_name)
+            for field_name in model_admin.get_search_fields(request)
+        ]
+        indexed_model_admin = copy.copy(model_admin)
+        indexed_model_admin.get_search_fields = lambda request: search_fields
+        return indexed_model_admin
+
+    def _get_instances_queryset(
+        self, model_admin: ModelAdmin, using: str, primary_keys: list
+    ) -> QuerySet:
+        """Build the queryset that loads instances for the given primary keys.
+
+        - select_related(None): Clear any default select_related, avoid unnecessary JOINs
+        - order_by(): Clear ordering, results are sorted in Python by primary key position
+        - values(): Load the display fields only, see :meth:`_get_display_template`
+        - defer(): Skip large fields ``__str__`` doesn't read, see :meth:`_get_deferred_fields`
+        - select_related(): Join the relations ``__str__`` follows, see
+          :meth:`_get_select_related`
+        """
+        queryset = (
+            model_admin.model._default_manager.using(using)
+            .filter(pk__in=primary_keys)
+            .select_related(None)
+            .order_by()
+        )
+        display_template = self._get_display_template(model_admin)
+        if display_template is not None:
+            return queryset.values("pk", *get_display_fields(display_template))
+        return self._apply_hydration_plan(model_admin, queryset)
+
+    def _apply_hydration_plan(self, model_admin: ModelAdmin, queryset: QuerySet) -> QuerySet:
+        """Defer the fields and join the relations of the hydration plan of a model."""
+        deferred_fields = self._get_deferred_fields(model_admin)
+        if deferred_fields:
+            queryset = queryset.defer(*deferred_fields)
+        select_related = self._get_select_related(model_admin)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset
+
+    def _get_deferred_fields(self, model_admin: ModelAdmin) -> list[str]:
+        """Get the large fields of a model to defer when loading its results.
+
+        Only with ``auto_defer_enabled``, and when ``ModelAdmin.global_search_only_fields``
+        doesn't list the fields to load already.
+        """
+        if not self.settings.auto_defer_enabled:
+            return []
+        if getattr(model_admin, "global_search_only_fields", None):
+            return []
+        return get_deferred_fields(model_admin.model)
+
+    def _get_select_related(self, model_admin: ModelAdmin) -> list[str]:
+        """Get the relations to join when loading the results of a model.
+
+        ``ModelAdmin.global_search_select_related`` when set. Otherwise, with
+        ``auto_select_related_enabled``, the relations ``__str__`` follows, unless
+        ``ModelAdmin.global_search_only_fields`` lists the fields to load.
+        """
+        select_related = getattr(model_admin, "global_search_select_related", None)
+        if select_related is not None:
+            return list(select_related)
+        if not self.settings.auto_select_related_enabled:
+            return []
+        if getattr(model_admin, "global_search_only_fields", None):
+            # only() would defer the foreign keys the joins traverse
+            return []
+        plan = get_hydration_plan(model_admin.model)
+        return list(plan.select_related) if plan is not None else []
+
+    def _build_model_search_result(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        instances: list[Model | dict],
+        primary_keys: list,
+        has_more: bool,
+        is_permission_checked: bool = False,
+    ) -> ModelSearchResult | None:
+        """Build a model search result from loaded instances.
+
+        Instances are sorted to match the order of ``primary_keys`` and filtered
+        by object level view permission, unless ``is_permission_checked``. Display
+        rows (``values()`` dicts) are formatted with ``ModelAdmin.global_search_display``.
+        """
+        model = model_admin.model
+
+        # Create a mapping to preserve the original search result order
+        pk_to_position = {pk: position for position, pk in enumerate(primary_keys)}
+
+        # Sort instances to match the original search result order
+        results = sorted(
+            instances, key=lambda instance: pk_to_position[self._get_instance_pk(instance)]
+        )
+
+        if results and isinstance(results[0], dict):
+            # Display rows: the object level permission doesn't depend on the object
+            result_items = [
+                SearchResultItem(
+                    url=self._get_change_url(model, row["pk"]),
+                    display_text=format_display(model_admin.global_search_display, row),
+                )
+                for row in results
+            ]
+        else:
+            result_items = self._build_instance_result_items(
+                request, model_admin, results, is_permission_checked
+            )
+
+        if not result_items:
+            return None
+
+        # Get changelist URL
+        changelist_url = self._get_changelist_url(model_admin, query)
+
+        return ModelSearchResult(
+            content_type_id=ct.id,
+            app_label=model._meta.app_label,
+            model_name=model._meta.model_name,
+            verbose_name=str(model._meta.verbose_name),
+            verbose_name_plural=str(model._meta.verbose_name_plural),
+            items=result_items,
+            has_more=has_more,
+            changelist_url=changelist_url,
+        )
+
+    def _build_instance_result_items(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        instances: list[Model],
+        is_permission_checked: bool = False,
+    ) -> list[SearchResultItem]:
+        """Build result items from instances, with the object level permission check.
+
+        Warns when building the items ran a query per instance, typically
+        ``__str__`` following a relation that wasn't joined.
+        """
+        if (
+            (self.settings.auto_defer_enabled or self.settings.auto_select_related_enabled)
+            and instances
+            and not is_hydration_plan_known(type(instances[0]))
+        ):
+            # Learn which fields to defer and relations to join in the next searches
+            record_hydration_plan(instances[0])
+
+        query_counter = QueryCounter()
+        result_items = []
+        with ExitStack() as stack:
+            for using in {instance._state.db for instance in instances}:
+                stack.enter_context(connections[using].execute_wrapper(query_counter))
+
+            if not is_permission_checked:
+                instances = self._filter_viewable_instances(request, model_admin, instances)
+            for obj in instances:
+                url = self._get_object_url(obj)
+                display_text = str(obj)
+                result_items.append(SearchResultItem(url=url, display_text=display_text))
+
+        if len(instances) > 1 and query_counter.count >= len(instances):
+            warn_n_plus_one(model_admin.model, query_counter.count, len(instances))
+
+        return result_items
+
+    def _filter_viewable_instances(
+        self, request: HttpRequest, model_admin: ModelAdmin, instances: list[Model]
+    ) -> list[Model]:
+        """Keep the instances the user may view (object level view permission).
+
+        - ``ModelAdmin.get_global_search_permitted_queryset()``: checked in the search
+          query already
+        - ``ModelAdmin.has_view_permission_bulk(request, objs)``: one call for all
+          instances, returning the viewable ones
+        - Otherwise ``ModelAdmin.has_view_permission(request, obj)`` for each instance
+        """
+        if hasattr(model_admin, "get_global_search_permitted_queryset"):
+            return instances
+
+        has_view_permission_bulk = getattr(model_admin, "has_view_permission_bulk", None)
+        if has_view_permission_bulk is not None:
+            viewable_primary_keys = {obj.pk for obj in has_view_permission_bulk(request, instances)}
+            return [obj for obj in instances if obj.pk in viewable_primary_keys]
+
+        return [obj for obj in instances if model_admin.has_view_permission(request, obj)]
+
+    def _get_object_url(self, obj: Model) -> str:
+        """Get admin change URL for object."""
+        return self._get_change_url(type(obj), obj.pk)
+
+    def _get_change_url(self, model: type[Model], pk) -> str:
+        """Get admin change URL for the object of ``model`` with primary key ``pk``."""
+        return get_change_url(
+            self.admin_site.name, model._meta.app_label, model._meta.model_name, pk
+        )
+
+    def _get_changelist_url(self, model_admin: ModelAdmin, query: str) -> str | None:
+        """Get admin changelist URL with search query."""
+        model = model_admin.model
+
+        base_url = get_changelist_url(
+            self.admin_site.name, model._meta.app_label, model._meta.model_name
+        )
+        if base_url is None:
+            return None
+        query_string = urlencode({"q": query})
+        return f"{base_url}?{query_string}"
+
+
+class AsyncGlobalSearch(GlobalSearch):
+    """Global Search class for async views.
+
+    Model searches run concurrently on the event loop through Django's async ORM.
+    Permission hooks, ``__str__`` and other sync-only code run through ``sync_to_async``.
+    """
+
+    async def search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+        phase: SearchPhase = SearchPhase.FULL,
+    ) -> GlobalSearchResult:
+        """Execute search.
+
+        :param request: Request object
+        :param query: Search query string
+        :param content_type_ids: Optional list of content type IDs to filter
+        :param phase: Which lookups of the search fields to run
+        :raises ValueError: If query is too short
+        :raises SearchRejectedError: If too many searches are running
+        """
+        if phase != self.search_phase:
+            return await self._with_search_phase(phase).search(
+                request, query, content_type_ids, phase
+            )
+
+        query = self._normalize_query(query)
+
+        if self.settings.coalescing_enabled:
+            # Identical searches running at the same time share the result of the first one
+            key = await sync_to_async(self._get_coalescing_key)(request, query, content_type_ids)
+            return await get_search_coalescer(self.settings.coalescing_cache_alias).arun(
+                key,
+                lambda: self._search(request, query, content_type_ids),
+                self.settings.search_timeout_ms / 1000.0,
+            )
+        return await self._search(request, query, content_type_ids)
+
+    async def _search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> GlobalSearchResult:
+        """Execute search with a normalized query, once admitted."""
+        async with self._aadmit(request) as searcher:
+            start_time = time.perf_counter()
+
+            results_by_index: dict[int, ModelSearchResult] = {}
+            indexed_results = searcher._iter_search(request, query, content_type_ids)
+            try:
+                async for index, model_search_result in indexed_results:
+                    results_by_index[index] = model_search_result
+                    if searcher._has_enough_top_results(results_by_index):
+                        break
+            finally:
+                # Cancels the model searches still running
+                await indexed_results.aclose()
+
+            return searcher._build_search_result_by_index(results_by_index, start_time)
+
+    def iter_search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+        phase: SearchPhase = SearchPhase.FULL,
+    ) -> AsyncModelSearchResults:
+        """Execute search, yielding each model search result as soon as it is produced.
+
+        :param request: Request object
+        :param query: Search query string
+        :param content_type_ids: Optional list of content type IDs to filter
+        :param phase: Which lookups of the search fields to run
+        :raises ValueError: If query is too short
+        """
+        if phase != self.search_phase:
+            return self._with_search_phase(phase).iter_search(
+                request, query, content_type_ids, phase
+            )
+
+        # Validate before returning the generator, so errors are raised at call time
+        query = self._normalize_query(query)
+        model_search_results = AsyncModelSearchResults()
+        model_search_results._results = self._iter_model_search_results(
+            request, query, content_type_ids, model_search_results
+        )
+        return model_search_results
+
+    async def _iter_model_search_results(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None,
+        model_search_results: AsyncModelSearchResults,
+    ) -> AsyncIterator[ModelSearchResult]:
+        start_time = time.perf_counter()
+        results_by_index: dict[int, ModelSearchResult] = {}
+        async with self._aadmit(request) as searcher:
+            async for index, model_search_result in searcher._iter_search(
+                request, query, content_type_ids
+            ):
+                results_by_index[index] = model_search_result
+                yield model_search_result
+
+            model_search_results.search_result = searcher._build_search_result_by_index(
+                results_by_index, start_time
+            )
+
+    @asynccontextmanager
+    async def _aadmit(self, request: HttpRequest) -> AsyncIterator[AsyncGlobalSearch]:
+        """Hold a search slot while the search runs, see :meth:`GlobalSearch._admit`."""
+        if self.admission_controller is None:
+            yield self
+            return
+
+        user_key = await sync_to_async(self._get_admission_key)(request)
+        # Waiting for a slot blocks, keep it off the thread running sync code of the views
+        searcher = await sync_to_async(self._acquire_search_slot, thread_sensitive=False)(user_key)
+        try:
+            yield searcher
+        finally:
+            searcher.admission_controller.release(user_key)
+
+    async def _iter_search(
+        self,
+        request: HttpRequest,
+        query: str,
+        content_type_ids: list[int] | None = None,
+    ) -> AsyncIterator[tuple[int, ModelSearchResult]]:
+        """Yield ``(model admin index, model search result)`` in completion order.
+
+        Running model searches are cancelled when the consumer stops iterating, e.g.
+        when the view is cancelled because the client disconnected.
+
+        :raises SearchCancelledError: If the user started a newer search
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.settings.search_timeout_ms / 1000.0
+        self.search_token = await sync_to_async(self._start_search_token)(request)
+        self.search_databases = {}
+
+        # Get searchable model admins
+        model_admins = await sync_to_async(self.get_searchable_model_admins)(
+            request, content_type_ids
+        )
+        content_types = await sync_to_async(self._get_content_types)(model_admins)
+        model_timeouts = await sync_to_async(self._get_model_timeouts)(
+            request, model_admins, start_time, deadline
+        )
+        search_order = await sync_to_async(self._get_search_order)(model_admins)
+        self._set_search_positions(search_order)
+
+        task_to_index = {
+            asyncio.ensure_future(
+                self._run_model_search(
+                    request,
+                    model_admins[index],
+                    content_types[index],
+                    query,
+                    *model_timeouts[index],
+                )
+            ): index
+            for index in search_order
+        }
+
+        pending = set(task_to_index)
+        try:
+            while pending:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                if self.search_token is not None:
+                    # Wake up regularly to notice a newer search of the same user
+                    timeout = min(timeout, CANCELLATION_CHECK_INTERVAL)
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=task_to_index.__getitem__):
+                    yield task_to_index[task], task.result()
+                if self.search_token is not None:
+                    await sync_to_async(self._check_cancelled)()
+        finally:
+            # Also runs when the consumer stops iterating (e.g. client disconnect)
+            for task in pending:
+                task.cancel()
+
+        for index in sorted(task_to_index[task] for task in pending):
+            # All model searches start together, so each ran for the whole search
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            yield (
+                index,
+                self._make_status_result(
+                    model_admins[index],
+                    content_types[index],
+                    ModelSearchStatus.TIMED_OUT,
+                    elapsed_ms,
+                ),
+            )
+
+    def _get_model_timeouts(
+        self,
+        request: HttpRequest,
+        model_admins: list[ModelAdmin],
+        start_time: float,
+        deadline: float,
+    ) -> list[tuple[float | None, bool]]:
+        """Get the time budget of each model in seconds, ``None`` when not limited.
+
+        Models are searched concurrently, so only database and per-model timeouts apply.
+
+        :return: ``(timeout, is_model_budget)`` of each model, see :meth:`_run_model_search`
+        """
+        model_deadlines = [deadline] * len(model_admins)
+        if self.settings.database_timeouts_ms:
+            database_groups = self._group_model_admins_by_database(request, model_admins)
+            for using, indexes in database_groups.items():
+                database_deadline = self._get_database_deadline(using, start_time, deadline)
+                for index in indexes:
+                    model_deadlines[index] = database_deadline
+
+        model_timeouts: list[tuple[float | None, bool]] = []
+        for model_admin, database_deadline in zip(model_admins, model_deadlines):
+            model_deadline = self._get_model_deadline(model_admin, database_deadline, models_left=0)
+            model_timeouts.append(
+                (
+                    max(model_deadline - start_time, 0) if model_deadline < deadline else None,
+                    model_deadline < database_deadline,
+                )
+            )
+        return model_timeouts
+
+    async def _run_model_search(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        timeout: float | None = None,
+        is_model_budget: bool = False,
+    ) -> ModelSearchResult:
+        """Search a model and record how the search ended.
+
+        Errors are only caught when partial results are enabled.
+
+        :param timeout: Time budget of the model in seconds, if any
+        :param is_model_budget: Whether ``timeout`` is the model's own time budget, which
+            skips the model instead of timing out the search
+        """
+        if not self._is_model_search_allowed(model_admin):
+            return self._make_status_result(model_admin, ct, ModelSearchStatus.CIRCUIT_OPEN)
+
+        model_query_start_time = time.perf_counter()
+        try:
+            model_search_result = await asyncio.wait_for(
+                self._search_model(request, model_admin, ct, query), timeout
+            )
+        except asyncio.TimeoutError:
+            model_search_result = None
+            status = ModelSearchStatus.TIMED_OUT
+            if is_model_budget:
+                status = ModelSearchStatus.OVER_BUDGET
+        except SearchCancelledError:
+            raise
+        except Exception:
+            if not self.settings.partial_results_enabled:
+                self._record_model_outcome(model_admin, ModelSearchStatus.ERRORED)
+                raise
+            logger.exception("Search error occurred for model_admin: %s", model_admin)
+            model_search_result, status = None, ModelSearchStatus.ERRORED
+        else:
+            status = ModelSearchStatus.COMPLETED
+
+        model_search_result = self._finish_model_search(
+            model_admin, ct, model_search_result, status, model_query_start_time
+        )
+        if self.latency_tracker is not None:
+            await sync_to_async(self._record_model_latency)(model_admin, model_search_result)
+        self._record_model_outcome(model_admin, model_search_result.status)
+        return model_search_result
+
+    async def _search_model(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+    ) -> ModelSearchResult | None:
+        """Search in a specific model using ModelAdmin's search configuration."""
+        # Custom get_queryset / get_search_results may touch the database
+        queryset = await sync_to_async(self._get_search_queryset)(request, model_admin, query)
+
+        search_database = await sync_to_async(self._get_search_database)(request, model_admin)
+        if search_database and search_database != queryset.db:
+            try:
+                return await self._search_queryset(
+                    request, model_admin, ct, query, queryset.using(search_database)
+                )
+            except DatabaseError:
+                # Fall back to the database the ModelAdmin queryset resolves to
+                logger.warning(
+                    "Search on database %r failed for model_admin: %s, falling back to %r",
+                    search_database,
+                    model_admin,
+                    queryset.db,
+                    exc_info=True,
+                )
+
+        return await self._search_queryset(request, model_admin, ct, query, queryset)
+
+    async def _search_queryset(
+        self,
+        request: HttpRequest,
+        model_admin: ModelAdmin,
+        ct: ContentType,
+        query: str,
+        queryset: QuerySet,
+    ) -> ModelSearchResult | None:
+        """Run the search queries of a model on the database of ``queryset``."""
+        max_results = self.settings.max_results_per_model
+
+        if self._uses_permission_scan(model_admin):
+            # has_view_permission() is synchronous anyway
+            instances, has_more = await sync_to_async(self._scan_viewable_instances)(
+                request, model_admin, queryset
+            )
+            return await sync_to_async(self._build_model_search_result)(
+                request,
+                model_admin,
+                ct,
+                query,
+                instances,
+                [instance.pk for instance in instances],
+                has_more,
+                is_permission_checked=True,
+            )
+
+        if self._get_hydration(model_admin) == Hydration.SINGLE_QUERY:
+            instances = self._deduplicate_instances(
+                [
+                    instance
+                    async for instance in self._get_single_query_instances_queryset(
+                        model_admin, queryset
+                    )[: max_results + 1]
+                ]
+            )
+            primary_keys = [self._get_instance_pk(instance) for instance in instances]
+        else:
+            primary_keys = [pk async for pk in self._get_primary_keys_queryset(queryset)]
+            instances = None
+
+        if not primary_keys:
+            return None
+
+        has_more = len(primary_keys) > max_results
+        if has_more:
+            primary_keys = primary_keys[:max_results]
+
+        if instances is None:
+            instances = [
+                instance
+                async for instance in self._get_instances_queryset(
+                    model_admin, queryset.db, primary_keys
+                )
+            ]
+        else:
+            instances = instances[:max_results]
+
+        return await sync_to_async(self._build_model_search_result)(
+            request, model_admin, ct, query, instances, primary_keys, has_more
+        )
@@ -1,9 +1,15 @@
 """django-global-search settings."""
 
+from __future__ import annotations
+
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from django.conf import settings
 from django.contrib.admin.sites import AdminSite
+from django.http import HttpRequest
+
+from django_global_search.routing import SearchDatabaseAlias
 
 
 @dataclass(frozen=True)
@@ -14,6 +20,11 @@ class GlobalSearchAdminSiteSettings:
     """Minimum query length."""
     max_results_per_model: int
     """Maximum results per model."""
+    max_results: int | None
+    """Maximum number of results of all models, ranked by model priority (top results mode).
+
+    Models ranked after enough results aren't searched. ``None`` disables the top results.
+    """
     search_timeout_ms: int
     """Search timeout in milliseconds."""
     excluded_models: list[str]
@@ -21,20 +32,244 @@ class GlobalSearchAdminSiteSettings:
 
     example: ['auth.user', 'auth.group']
     """
+    partial_results_enabled: bool
+    """Keep the results of completely searched models when the search times out.
+
+    Models whose search failed are reported instead of failing the whole search.
+    """
+    database_timeout_enabled: bool
+    """Cancel running queries in the database once the search timeout is exceeded."""
+    search_database_alias: SearchDatabaseAlias
+    """Database the search queries run on (e.g. a read replica).
+
+    A database alias, a list of aliases used in rotation, or a callable
+    ``(request, model_admin) -> alias | None``. ``None`` keeps the database
+    ``ModelAdmin.get_queryset()`` resolves to, which is also the fallback when
+    a query on the search database fails.
+    """
+    max_workers: int
+    """Maximum number of models searched concurrently.
+
+    ``1`` searches models one after another in the request thread.
+    """
+    pipeline_enabled: bool
+    """Send the primary key queries of all models in one pipeline (PostgreSQL with psycopg 3).
+
+    Applies when models are searched one after another. Other backends search
+    models one query at a time.
+    """
+    hydration: str
+    """How the result objects of a model are loaded, unless the ModelAdmin sets
+    ``global_search_hydration``.
+
+    - ``"two_step"``: primary key query, then a query loading the objects by primary key
+    - ``"single_query"``: the limited search query loads the objects
+    """
+    auto_defer_enabled: bool
+    """Defer the large fields (text, JSON, binary) ``__str__`` doesn't read when loading results.
+
+    The fields ``__str__`` reads are introspected once per model and process,
+    on the first result loaded.
+    """
+    auto_select_related_enabled: bool
+    """Join the relations ``__str__`` follows when loading results, saving a query per result.
+
+    The relations ``__str__`` follows are introspected once per model and
+    process, on the first result loaded.
+    """
+    permission_scan_limit: int | None
+    """Maximum number of results of a model checked for object level view permission.
+
+    Models whose results may be dropped by ``has_view_permission(request, obj)``
+    page through their results until a page of viewable results is found, or
+    this many results were checked. ``None`` only checks the first page.
+    """
+    union_enabled: bool
+    """Fetch the primary keys of all models in a single ``UNION ALL`` query.
+
+    Applies when models are searched one after another, on backends accepting
+    ordered and limited subqueries (PostgreSQL, MySQL, MariaDB). Querysets with
+    distinct or annotations are queried on their own.
+    """
+    async_enabled: bool
+    """Serve the search page with the async view (ASGI deployments)."""
+    streaming_enabled: bool
+    """Stream model results to the search page as soon as each model is searched."""
+    database_fan_out_enabled: bool
+    """Search the models of each database concurrently, one thread per database.
+
+    Models are grouped by the database their ``ModelAdmin.get_queryset()`` resolves to.
+    """
+    database_timeouts_ms: dict[str, int]
+    """Search timeout in milliseconds per database alias, within the global search timeout.
+
+    example: {'analytics': 2000}
+    """
+    model_timeout_ms: int | None
+    """Default search timeout in milliseconds of each model, within the search timeout.
+
+    ``ModelAdmin.global_search_timeout_ms`` overrides it per model.
+    """
+    time_slicing_enabled: bool
+    """Limit each model search to an equal share of the remaining search time."""
+    cost_based_ordering_enabled: bool
+    """Search models from the fastest to the slowest observed search time."""
+    latency_cache_alias: str | None
+    """Django cache alias to share observed search times between processes.
+
+    ``None`` keeps them in process memory.
+    """
+    cancellation_enabled: bool
+    """Cancel the running search of a user when the same user starts a new search."""
+    cancellation_cache_alias: str
+    """Django cache alias storing the latest search of each user."""
+    coalescing_enabled: bool
+    """Run identical searches running at the same time only once and share the result.
+
+    Searches are identical when the query, the selected models and the
+    permission fingerprint of the users are the same.
+    """
+    coalescing_cache_alias: str | None
+    """Django cache alias to also coalesce searches running in other processes.
+
+    ``None`` only coalesces searches of the same process.
+    """
+    coalescing_fingerprint: Callable[[HttpRequest], str] | None
+    """Callable ``(request) -> str`` telling which users may share search results.
+
+    ``None`` only shares results between searches of the same user.
+    """
+    max_concurrent_searches: int | None
+    """Maximum number of searches running at the same time in a process, ``None`` for no limit."""
+    max_concurrent_searches_per_user: int | None
+    """Maximum number of searches of a user running at the same time in a process.
+
+    ``None`` for no limit.
+    """
+    max_queued_searches: int
+    """Maximum number of searches waiting for a free slot, beyond which searches are rejected."""
+    queue_timeout_ms: int
+    """Maximum time a search waits for a free slot in milliseconds, before being rejected."""
+    degraded_search_timeout_ms: int | None
+    """Search timeout in milliseconds of the degraded search run instead of rejected searches.
+
+    Degraded searches search models one after another with partial results, and
+    are limited separately by the same maximum numbers of concurrent searches.
+    ``None`` rejects the searches instead.
+    """
+    circuit_breaker_failure_threshold: int | None
+    """Number of timed out or failed searches of a model after which the model is skipped.
+
+    ``None`` disables the circuit breaker.
+    """
+    circuit_breaker_window_ms: int
+    """Time window in milliseconds the failed searches of a model are counted in."""
+    circuit_breaker_cooldown_ms: int
+    """Time in milliseconds a model is skipped before a single search probes it again."""
+    two_phase_search_enabled: bool
+    """Search with lookups an index can serve first, then with all lookups.
+
+    The second phase is streamed after the first one with streaming, and
+    fetched on demand otherwise.
+    """
 
     @classmethod
     def from_admin_site(cls, admin_site: AdminSite):
         """Create GlobalSearchAdminSiteSettings from AdminSite."""
         min_query_length = getattr(settings, "GLOBAL_SEARCH_MIN_QUERY_LENGTH", 2)
         max_results_per_model = getattr(settings, "GLOBAL_SEARCH_MAX_RESULTS_PER_MODEL", 10)
+        max_results = getattr(settings, "GLOBAL_SEARCH_MAX_RESULTS", None)
         search_timeout_ms = getattr(settings, "GLOBAL_SEARCH_TIMEOUT_MS", 20000)
         excluded_models = getattr(settings, "GLOBAL_SEARCH_EXCLUDED_MODELS", [])
+        partial_results_enabled = getattr(settings, "GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED", False)
+        database_timeout_enabled = getattr(settings, "GLOBAL_SEARCH_DATABASE_TIMEOUT_ENABLED", True)
+        search_database_alias = getattr(settings, "GLOBAL_SEARCH_DATABASE_ALIAS", None)
+        max_workers = getattr(settings, "GLOBAL_SEARCH_MAX_WORKERS", 1)
+        pipeline_enabled = getattr(settings, "GLOBAL_SEARCH_PIPELINE_ENABLED", False)
+        union_enabled = getattr(settings, "GLOBAL_SEARCH_UNION_ENABLED", False)
+        hydration = getattr(settings, "GLOBAL_SEARCH_HYDRATION", "two_step")
+        auto_defer_enabled = getattr(settings, "GLOBAL_SEARCH_AUTO_DEFER_ENABLED", False)
+        permission_scan_limit = getattr(settings, "GLOBAL_SEARCH_PERMISSION_SCAN_LIMIT", None)
+        auto_select_related_enabled = getattr(
+            settings, "GLOBAL_SEARCH_AUTO_SELECT_RELATED_ENABLED", False
+        )
+        async_enabled = getattr(settings, "GLOBAL_SEARCH_ASYNC_ENABLED", False)
+        streaming_enabled = getattr(settings, "GLOBAL_SEARCH_STREAMING_ENABLED", False)
+        database_fan_out_enabled = getattr(
+            settings, "GLOBAL_SEARCH_DATABASE_FAN_OUT_ENABLED", False
+        )
+        database_timeouts_ms = getattr(settings, "GLOBAL_SEARCH_DATABASE_TIMEOUTS_MS", {})
+        model_timeout_ms = getattr(settings, "GLOBAL_SEARCH_MODEL_TIMEOUT_MS", None)
+        time_slicing_enabled = getattr(settings, "GLOBAL_SEARCH_TIME_SLICING_ENABLED", False)
+        cost_based_ordering_enabled = getattr(
+            settings, "GLOBAL_SEARCH_COST_BASED_ORDERING_ENABLED", False
+        )
+        latency_cache_alias = getattr(settings, "GLOBAL_SEARCH_LATENCY_CACHE_ALIAS", None)
+        cancellation_enabled = getattr(settings, "GLOBAL_SEARCH_CANCELLATION_ENABLED", False)
+        cancellation_cache_alias = getattr(
+            settings, "GLOBAL_SEARCH_CANCELLATION_CACHE_ALIAS", "default"
+        )
+        coalescing_enabled = getattr(settings, "GLOBAL_SEARCH_COALESCING_ENABLED", False)
+        coalescing_cache_alias = getattr(settings, "GLOBAL_SEARCH_COALESCING_CACHE_ALIAS", None)
+        coalescing_fingerprint = getattr(settings, "GLOBAL_SEARCH_COALESCING_FINGERPRINT", None)
+        max_concurrent_searches = getattr(settings, "GLOBAL_SEARCH_MAX_CONCURRENT_SEARCHES", None)
+        max_concurrent_searches_per_user = getattr(
+            settings, "GLOBAL_SEARCH_MAX_CONCURRENT_SEARCHES_PER_USER", None
+        )
+        max_queued_searches = getattr(settings, "GLOBAL_SEARCH_MAX_QUEUED_SEARCHES", 0)
+        queue_timeout_ms = getattr(settings, "GLOBAL_SEARCH_QUEUE_TIMEOUT_MS", 1000)
+        degraded_search_timeout_ms = getattr(
+            settings, "GLOBAL_SEARCH_DEGRADED_SEARCH_TIMEOUT_MS", None
+        )
+        circuit_breaker_failure_threshold = getattr(
+            settings, "GLOBAL_SEARCH_CIRCUIT_BREAKER_FAILURE_THRESHOLD", None
+        )
+        circuit_breaker_window_ms = getattr(
+            settings, "GLOBAL_SEARCH_CIRCUIT_BREAKER_WINDOW_MS", 60000
+        )
+        circuit_breaker_cooldown_ms = getattr(
+            settings, "GLOBAL_SEARCH_CIRCUIT_BREAKER_COOLDOWN_MS", 60000
+        )
+        two_phase_search_enabled = getattr(settings, "GLOBAL_SEARCH_TWO_PHASE_ENABLED", False)
 
         defaults = {
             "min_query_length": min_query_length,
             "max_results_per_model": max_results_per_model,
+            "max_results": max_results,
             "search_timeout_ms": search_timeout_ms,
             "excluded_models": excluded_models,
+            "partial_results_enabled": partial_results_enabled,
+            "database_timeout_enabled": database_timeout_enabled,
+            "search_database_alias": search_database_alias,
+            "max_workers": max_workers,
+            "pipeline_enabled": pipeline_enabled,
+            "union_enabled": union_enabled,
+            "hydration": hydration,
+            "auto_defer_enabled": auto_defer_enabled,
+            "permission_scan_limit": permission_scan_limit,
+            "auto_select_related_enabled": auto_select_related_enabled,
+            "async_enabled": async_enabled,
+            "streaming_enabled": streaming_enabled,
+            "database_fan_out_enabled": database_fan_out_enabled,
+            "database_timeouts_ms": database_timeouts_ms,
+            "model_timeout_ms": model_timeout_ms,
+            "time_slicing_enabled": time_slicing_enabled,
+            "cost_based_ordering_enabled": cost_based_ordering_enabled,
+            "latency_cache_alias": latency_cache_alias,
+            "cancellation_enabled": cancellation_enabled,
+            "cancellation_cache_alias": cancellation_cache_alias,
+            "coalescing_enabled": coalescing_enabled,
+            "coalescing_cache_alias": coalescing_cache_alias,
+            "coalescing_fingerprint": coalescing_fingerprint,
+            "max_concurrent_searches": max_concurrent_searches,
+            "max_concurrent_searches_per_user": max_concurrent_searches_per_user,
+            "max_queued_searches": max_queued_searches,
+            "queue_timeout_ms": queue_timeout_ms,
+            "degraded_search_timeout_ms": degraded_search_timeout_ms,
+            "circuit_breaker_failure_threshold": circuit_breaker_failure_threshold,
+            "circuit_breaker_window_ms": circuit_breaker_window_ms,
+            "circuit_breaker_cooldown_ms": circuit_breaker_cooldown_ms,
+            "two_phase_search_enabled": two_phase_search_enabled,
         }
 
         if hasattr(admin_site, "global_search_settings"):
@@ -123,10 +123,10 @@ class GlobalSearchUI {
         });
     }
 
-    restoreResultsCollapseState() {
+    restoreResultsCollapseState(root = document) {
         const collapsed = State.getCollapsedResults();
 
-        document.querySelectorAll('.app-results').forEach(appResults => {
+        root.querySelectorAll('.app-results').forEach(appResults => {
             const toggleBtn = appResults.querySelector('.result-toggle-btn');
             if (!toggleBtn) return;
 
@@ -159,20 +159,7 @@ class GlobalSearchUI {
             btn.addEventListener('click', (e) => this.handleToggle(e));
         });
 
-        // Collapse/expand toggle (search results)
-        document.querySelectorAll('.result-toggle-btn').forEach(btn => {
-            btn.addEventListener('click', (e) => this.handleResultToggle(e));
-        });
-
-        // Click on app-results-header to toggle
-        document.querySelectorAll('.app-results-header').forEach(header => {
-            header.addEventListener('click', (e) => {
-                // Only toggle if clicking on the header itself, not the button
-                if (e.target.classList.contains('result-toggle-btn')) return;
-                const btn = header.querySelector('.result-toggle-btn');
-                if (btn) btn.click();
-            });
-        });
+        this.attachResultListeners();
 
         // App checkbox (select/deselect all models in app)
         document.querySelectorAll('.app-checkbox').forEach(cb => {
@@ -205,6 +192,23 @@ class GlobalSearchUI {
         this.modelSelectionForm.addEventListener('submit', () => this.saveState());
     }
 
+    attachResultListeners(root = document) {
+        // Collapse/expand toggle (search results)
+        root.querySelectorAll('.result-toggle-btn').forEach(btn => {
+            btn.addEventListener('click', (e) => this.handleResultToggle(e));
+        });
+
+        // Click on app-results-header to toggle
+        root.querySelectorAll('.app-results-header').forEach(header => {
+            header.addEventListener('click', (e) => {
+                // Only toggle if clicking on the header itself, not the button
+                if (e.target.classList.contains('result-toggle-btn')) return;
+                const btn = header.querySelector('.result-toggle-btn');
+                if (btn) btn.click();
+            });
+        });
+    }
+
     handleToggle(e) {
         const btn = e.target;
         const modelsList = btn.closest('.app-group').querySelector('.models-list');
@@ -333,6 +337,122 @@ class GlobalSearchUI {
     }
 }
 
+// Renders model results streamed as NDJSON by the global-search/stream/ endpoint
+class SearchResultsStream {
+    constructor(ui, container) {
+        this.ui = ui;
+        this.container = container;
+        this.url = container.dataset.streamUrl;
+        this.list = container.querySelector('.search-results-list');
+    }
+
+    async start() {
+        try {
+            const response = await fetch(this.url, {
+                credentials: 'same-origin',
+                headers: { 'Accept': 'application/x-ndjson' }
+            });
+            await this.readEvents(response.body.getReader());
+        } catch (e) {
+            console.warn('Search stream failed:', e);
+            this.showError(this.container.dataset.streamErrorMessage || 'Search error');
+        }
+    }
+
+    async readEvents(reader) {
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => this.handleEvent(JSON.parse(line)));
+        }
+
+        if (buffer.trim()) {
+            this.handleEvent(JSON.parse(buffer));
+        }
+    }
+
+    handleEvent(event) {
+        if (event.type === 'model') {
+            this.appendModelResults(event);
+        } else if (event.type === 'done') {
+            this.finish(event);
+        } else if (event.type === 'error') {
+            this.showError(event.message);
+        }
+    }
+
+    appendModelResults(event) {
+        const appResults = this.parseHTML(event.html);
+        // The full phase of a two-phase search replaces the results of the indexed phase
+        const previous = this.list.querySelector(
+            `.model-results[data-content-type-id="${event.content_type_id}"]`
+        );
+        if (previous) {
+            previous.replaceWith(appResults.querySelector('.model-results'));
+            return;
+        }
+
+        const existing = this.list.querySelector(`.app-results[data-app="${event.app_label}"]`);
+
+        if (existing) {
+            const content = existing.querySelector('.app-results-content');
+            appResults.querySelectorAll('.model-results').forEach(model => content.appendChild(model));
+            return;
+        }
+
+        // Keep apps in app_label alphabetical order, like the non-streamed page
+        const next = Array.from(this.list.querySelectorAll('.app-results'))
+            .find(app => app.dataset.app > event.app_label);
+        this.list.insertBefore(appResults, next || null);
+
+        this.ui.attachResultListeners(appResults);
+        this.ui.restoreResultsCollapseState(appResults);
+    }
+
+    finish(event) {
+        const header = this.container.querySelector('.results-header');
+        header.replaceWith(this.parseHTML(event.header_html));
+
+        if (event.unsearched_html.trim()) {
+            this.list.before(this.parseHTML(event.unsearched_html));
+        }
+
+        if (event.top_results_html.trim()) {
+            this.list.before(this.parseHTML(event.top_results_html));
+        }
+
+        if (this.list.querySelector('.app-results')) {
+            document.querySelector('.search-container')
+                .setAttribute('data-search-success', 'true');
+        }
+    }
+
+    showError(message) {
+        const note = document.createElement('div');
+        note.className = 'errornote';
+        note.textContent = message;
+        this.container.prepend(note);
+    }
+
+    parseHTML(html) {
+        const template = document.createElement('template');
+        template.innerHTML = html.trim();
+        return template.content.firstElementChild;
+    }
+}
+
 document.addEventListener('DOMContentLoaded', () => {
-    new GlobalSearchUI();
+    const ui = new GlobalSearchUI();
+
+    const streamContainer = document.querySelector('.search-results[data-stream-url]');
+    if (streamContainer) {
+        new SearchResultsStream(ui, streamContainer).start();
+    }
 });
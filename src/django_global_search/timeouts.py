@@ -0,0 +1,223 @@
+"""Database level deadlines for search queries."""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+
+from django.db import connections, transaction
+
+from django_global_search.cancellation import SearchCancelledError
+
+SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+# How many SQLite virtual machine instructions run between two deadline checks
+SQLITE_PROGRESS_HANDLER_INSTRUCTIONS = 1000
+
+
+class SearchTimeoutError(Exception):
+    """Raised when a search query runs past its deadline."""
+
+
+def is_query_canceled_error(exc: BaseException | None) -> bool:
+    """Whether ``exc`` is the driver error of a PostgreSQL query cancelled by a timeout."""
+    # query_canceled (psycopg2: pgcode, psycopg 3: sqlstate)
+    return (getattr(exc, "pgcode", None) or getattr(exc, "sqlstate", None)) == "57014"
+
+
+@contextmanager
+def restore_statement_timeout(using: str) -> Iterator[None]:
+    """Restore the PostgreSQL ``statement_timeout`` changed with ``SET LOCAL`` inside the block.
+
+    ``SET LOCAL`` lasts until the end of the transaction, not of the savepoint
+    ``transaction.atomic`` opens inside a running transaction: the value would
+    then outlive the search. Inside a transaction, the current value is read
+    before the block and set again after it (two more queries). A block left
+    with an exception needs nothing, rolling back the savepoint restores the value.
+
+    Enter it before ``transaction.atomic`` and outside the execute wrappers.
+
+    :param using: Database alias
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql" or not connection.in_atomic_block:
+        # Outside a transaction, the value ends with the transaction of the block
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting('statement_timeout')")
+        (statement_timeout,) = cursor.fetchone()
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT set_config('statement_timeout', %s, true)", [statement_timeout])
+
+
+class DeadlineExecuteWrapper:
+    """``connection.execute_wrapper`` that refuses to start queries past the deadline.
+
+    Subclasses install the remaining budget as a server-side timeout for each query.
+    Queries are also refused once ``is_cancelled`` returns True.
+    """
+
+    def __init__(self, deadline: float, is_cancelled: Callable[[], bool] | None = None):
+        """Initialize wrapper.
+
+        :param deadline: ``time.perf_counter()`` value after which queries are cancelled
+        :param is_cancelled: Callable telling whether the search was cancelled, or None
+        """
+        self.deadline = deadline
+        self.is_cancelled = is_cancelled
+        self.cancelled = False
+
+    def check_cancelled(self) -> bool:
+        """Whether the search was cancelled, remembering it for :meth:`is_timeout_error`."""
+        if not self.cancelled and self.is_cancelled is not None:
+            self.cancelled = self.is_cancelled()
+        return self.cancelled
+
+    def remaining_ms(self) -> int:
+        """Remaining budget in milliseconds, rounded up so the deadline is never undercut."""
+        return math.ceil((self.deadline - time.perf_counter()) * 1000)
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.check_cancelled():
+            raise SearchCancelledError
+        remaining_ms = self.remaining_ms()
+        if remaining_ms <= 0:
+            raise SearchTimeoutError
+        return self.execute(execute, sql, params, many, context, remaining_ms)
+
+    def execute(self, execute, sql, params, many, context, remaining_ms: int):
+        return execute(sql, params, many, context)
+
+    def is_timeout_error(self, exc: Exception) -> bool:
+        """Whether ``exc`` was raised because the database cancelled the query."""
+        return False
+
+
+class PostgreSQLDeadlineExecuteWrapper(DeadlineExecuteWrapper):
+    """Set ``statement_timeout`` to the remaining budget before each query.
+
+    ``SET LOCAL`` only lasts until the end of the current transaction, so the
+    wrapper must be used inside ``transaction.atomic`` and
+    :func:`restore_statement_timeout`.
+    """
+
+    def execute(self, execute, sql, params, many, context, remaining_ms: int):
+        # Use the raw cursor so the SET statement doesn't go through the wrappers again
+        context["cursor"].cursor.execute(f"SET LOCAL statement_timeout = {int(remaining_ms)}")
+        return execute(sql, params, many, context)
+
+    def is_timeout_error(self, exc: Exception) -> bool:
+        return is_query_canceled_error(exc.__cause__)
+
+
+class MySQLDeadlineExecuteWrapper(DeadlineExecuteWrapper):
+    """Limit SELECT statements with ``MAX_EXECUTION_TIME`` (``max_statement_time`` on MariaDB)."""
+
+    def __init__(
+        self,
+        deadline: float,
+        is_mariadb: bool,
+        is_cancelled: Callable[[], bool] | None = None,
+    ):
+        """Initialize wrapper.
+
+        :param deadline: ``time.perf_counter()`` value after which queries are cancelled
+        :param is_mariadb: Whether the server is MariaDB
+        :param is_cancelled: Callable telling whether the search was cancelled, or None
+        """
+        super().__init__(deadline, is_cancelled)
+        self.is_mariadb = is_mariadb
+
+    def execute(self, execute, sql, params, many, context, remaining_ms: int):
+        if SELECT_RE.match(sql):
+            if self.is_mariadb:
+                sql = f"SET STATEMENT max_statement_time={remaining_ms / 1000:.3f} FOR {sql}"
+            else:
+                sql = SELECT_RE.sub(f"SELECT /*+ MAX_EXECUTION_TIME({remaining_ms}) */", sql, 1)
+        return execute(sql, params, many, context)
+
+    def is_timeout_error(self, exc: Exception) -> bool:
+        # ER_QUERY_TIMEOUT (MySQL), ER_STATEMENT_TIMEOUT (MariaDB)
+        return bool(exc.args) and exc.args[0] in (3024, 1969)
+
+
+class SQLiteDeadlineExecuteWrapper(DeadlineExecuteWrapper):
+    """Interrupt running statements from an SQLite progress handler.
+
+    SQLite steps through rows while results are fetched, so the handler stays
+    installed for the whole :func:`database_deadline` block, not only during ``execute``.
+    """
+
+    def progress_handler(self) -> bool:
+        return time.perf_counter() > self.deadline or self.check_cancelled()
+
+    def is_timeout_error(self, exc: Exception) -> bool:
+        return "interrupted" in str(exc)
+
+
+@contextmanager
+def database_deadline(
+    using: str, deadline: float, is_cancelled: Callable[[], bool] | None = None
+) -> Iterator[None]:
+    """Cancel queries on the ``using`` connection that run past ``deadline``.
+
+    - PostgreSQL: ``SET LOCAL statement_timeout`` inside a transaction (savepoint),
+      restored at the end of the block (see :func:`restore_statement_timeout`)
+    - MySQL / MariaDB: ``MAX_EXECUTION_TIME`` optimizer hint / ``max_statement_time``
+    - SQLite: progress handler interrupting the running statement
+    - Other backends: queries are only refused once the deadline has passed
+
+    :param using: Database alias
+    :param deadline: ``time.perf_counter()`` value after which queries are cancelled
+    :param is_cancelled: Callable telling whether the search was cancelled, or None.
+        Checked before each query, and while SQLite statements run.
+    :raises SearchTimeoutError: If a query is refused or cancelled by the database
+    :raises SearchCancelledError: If a query is refused or interrupted because the
+        search was cancelled
+    """
+    connection = connections[using]
+
+    if connection.vendor == "postgresql":
+        wrapper = PostgreSQLDeadlineExecuteWrapper(deadline, is_cancelled)
+    elif connection.vendor == "mysql":
+        wrapper = MySQLDeadlineExecuteWrapper(deadline, connection.mysql_is_mariadb, is_cancelled)
+    elif connection.vendor == "sqlite":
+        wrapper = SQLiteDeadlineExecuteWrapper(deadline, is_cancelled)
+    else:
+        wrapper = DeadlineExecuteWrapper(deadline, is_cancelled)
+
+    if isinstance(wrapper, PostgreSQLDeadlineExecuteWrapper):
+        restore = restore_statement_timeout(using)
+    else:
+        restore = nullcontext()
+
+    try:
+        with restore, connection.execute_wrapper(wrapper):
+            if isinstance(wrapper, PostgreSQLDeadlineExecuteWrapper):
+                with transaction.atomic(using=using):
+                    yield
+            elif isinstance(wrapper, SQLiteDeadlineExecuteWrapper):
+                connection.ensure_connection()
+                connection.connection.set_progress_handler(
+                    wrapper.progress_handler, SQLITE_PROGRESS_HANDLER_INSTRUCTIONS
+                )
+                try:
+                    yield
+                finally:
+                    connection.connection.set_progress_handler(None, 0)
+            else:
+                yield
+    except (SearchTimeoutError, SearchCancelledError):
+        raise
+    except Exception as exc:
+        if wrapper.is_timeout_error(exc):
+            if wrapper.cancelled:
+                raise SearchCancelledError from exc
+            raise SearchTimeoutError from exc
+        raise
@@ -0,0 +1,85 @@
+"""Single UNION ALL query collecting the primary keys of several models."""
+
+from __future__ import annotations
+
+from django.db import connections
+from django.db.models import F, IntegerField, QuerySet, TextField, Value, Window
+from django.db.models.functions import Cast, RowNumber
+
+TAG_ALIAS = "_global_search_tag"
+PK_ALIAS = "_global_search_pk"
+ROW_ALIAS = "_global_search_row"
+
+
+def supports_union(using: str) -> bool:
+    """Whether the ``using`` database accepts ordered and limited UNION ALL subqueries.
+
+    Subqueries are numbered with a window function, so it must support them too.
+    PostgreSQL, MySQL 8 and MariaDB do; SQLite doesn't.
+    """
+    features = connections[using].features
+    return features.supports_slicing_ordering_in_compound and features.supports_over_clause
+
+
+def get_ordering(queryset: QuerySet) -> list:
+    """Get the ordering of ``queryset``, ending with its primary key so it is total."""
+    query = queryset.query
+    if query.order_by:
+        ordering = list(query.order_by)
+    elif query.default_ordering and query.get_meta().ordering:
+        ordering = list(query.get_meta().ordering)
+    else:
+        ordering = []
+    return [*ordering, F("pk").asc()]
+
+
+def can_union(queryset: QuerySet) -> bool:
+    """Whether a search queryset can be a subquery of the UNION ALL query.
+
+    Querysets with distinct, annotations, extra selects or their own combinator
+    don't select the same columns as the other subqueries.
+    """
+    query = queryset.query
+    return not (query.distinct or query.annotations or query.extra or query.combinator)
+
+
+def get_union_queryset(querysets: list[QuerySet], limit: int) -> QuerySet:
+    """Build the UNION ALL query of :func:`fetch_union_primary_keys`.
+
+    Each subquery selects the position of its queryset (the tag), its primary
+    keys cast to text, so models with different primary key types can be
+    combined, and their row number in the queryset's ordering. SQL doesn't
+    keep the order of the subqueries of a UNION ALL, so the union is ordered
+    by tag and row number.
+    """
+    subqueries = []
+    for position, queryset in enumerate(querysets):
+        ordering = get_ordering(queryset)
+        subqueries.append(
+            queryset.order_by(*ordering)
+            .annotate(
+                **{
+                    TAG_ALIAS: Value(position, output_field=IntegerField()),
+                    PK_ALIAS: Cast("pk", output_field=TextField()),
+                    ROW_ALIAS: Window(RowNumber(), order_by=ordering),
+                }
+            )
+            .values_list(TAG_ALIAS, PK_ALIAS, ROW_ALIAS)[:limit]
+        )
+    return subqueries[0].union(*subqueries[1:], all=True).order_by(TAG_ALIAS, ROW_ALIAS)
+
+
+def fetch_union_primary_keys(querysets: list[QuerySet], limit: int) -> list[list]:
+    """Fetch the first ``limit`` primary keys of each queryset in one UNION ALL query.
+
+    Primary keys are converted back with the model's primary key field.
+
+    :param querysets: Ordered querysets of the same database, see :func:`can_union`
+    :param limit: Number of primary keys to fetch per queryset
+    :return: Primary keys of each queryset, in the queryset's ordering (with ties
+        broken by primary key)
+    """
+    primary_keys: list[list] = [[] for _queryset in querysets]
+    for position, pk, _row in get_union_queryset(querysets, limit):
+        primary_keys[position].append(querysets[position].model._meta.pk.to_python(pk))
+    return primary_keys
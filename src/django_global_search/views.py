@@ -2,23 +2,53 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import time
 from collections import defaultdict
-from dataclasses import asdict, dataclass
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlencode
 
+from asgiref.sync import sync_to_async
 from django.apps import apps
 from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.auth.views import redirect_to_login
 from django.contrib.contenttypes.models import ContentType
-from django.http import HttpRequest
+from django.http import HttpRequest, StreamingHttpResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
 from django.views import View
 
-from django_global_search.searcher import GlobalSearch, GlobalSearchResult, ModelSearchResult
+from django_global_search.admission import SEARCH_REJECTED_RETRY_AFTER, SearchRejectedError
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.searcher import (
+    AsyncGlobalSearch,
+    GlobalSearch,
+    GlobalSearchResult,
+    ModelSearchResult,
+    ModelSearchStatus,
+    RankedSearchResultItem,
+    SearchPhase,
+)
 
 logger = logging.getLogger(__name__)
 
+MODEL_SEARCH_STATUS_LABELS = {
+    ModelSearchStatus.COMPLETED: gettext_lazy("Completed"),
+    ModelSearchStatus.TIMED_OUT: gettext_lazy("Timed out"),
+    ModelSearchStatus.OVER_BUDGET: gettext_lazy("Skipped after its time budget"),
+    ModelSearchStatus.SKIPPED: gettext_lazy("Skipped"),
+    ModelSearchStatus.ERRORED: gettext_lazy("Error"),
+    ModelSearchStatus.CIRCUIT_OPEN: gettext_lazy("Temporarily skipped after repeated failures"),
+}
+
+SEARCH_BUSY_MESSAGE = gettext_lazy("Too many searches are running. Please retry in a moment.")
+
 
 @method_decorator(staff_member_required, name="dispatch")
 class GlobalSearchView(View):
@@ -45,6 +75,9 @@ class GlobalSearchView(View):
         has_more: bool
         changelist_url: str | None
         items: list[GlobalSearchView.SearchItemContext]
+        status: str
+        status_display: str
+        elapsed_time_ms: int
 
     @dataclass
     class AppResultContext:
@@ -64,52 +97,142 @@ class GlobalSearchView(View):
         search_results: list[GlobalSearchView.AppResultContext]
         elapsed_time: float | None
         error_message: str | None
+        warning_message: str | None = None
+        unsearched_models: list[GlobalSearchView.ModelResultContext] = field(default_factory=list)
+        circuit_open_models: list[str] = field(default_factory=list)
+        full_search_url: str | None = None
+        top_results: list[RankedSearchResultItem] = field(default_factory=list)
+        retry_url: str | None = None
+        stream_url: str | None = None
+        is_busy: bool = False
 
     def get(self, request, *args, **kwargs):
         """Handle GET request."""
         query = request.GET.get("q", "").strip()
-        admin_site = self.admin_site
-        searcher = GlobalSearch(admin_site)
-        selected_ct_ids = self._get_selected_content_type_ids(request, searcher)
-
-        # Build context
-        context = self.SearchContext(
-            query=query,
-            apps_data=self._get_apps_data(request, searcher),
-            selected_content_type_ids=selected_ct_ids,
-            search_results=[],
-            elapsed_time=None,
-            error_message=None,
-        )
+        searcher = GlobalSearch(self.admin_site)
+        context = self._build_context(request, searcher, query)
 
+        if query and searcher.settings.streaming_enabled:
+            # Results are fetched by global_search.js from the stream endpoint
+            context.stream_url = self._get_stream_url(request)
         # Execute search if query is provided
-        if query:
+        elif query:
             try:
+                phases = self._get_search_phases(request, searcher)
                 result = searcher.search(
                     request=request,
                     query=query,
-                    content_type_ids=selected_ct_ids or None,
+                    content_type_ids=context.selected_content_type_ids or None,
+                    phase=phases[0],
                 )
-
-                context.search_results = self._convert_search_results(result)
-                context.elapsed_time = result.elapsed_time_ms / 1000.0
-
-                if result.is_timeout:
-                    context.error_message = _("Search timeout exceeded. Please refine your query.")
-
+                self._apply_search_result(context, result)
+                if len(phases) > 1:
+                    # The full search is fetched on demand
+                    context.full_search_url = self._get_full_search_url(request)
             except ValueError:
                 logger.exception("Invalid search query: %s", query)
                 context.error_message = _("Invalid query")
+            except SearchCancelledError:
+                logger.info("Search cancelled by a newer search: %s", query)
+                context.error_message = _("Search cancelled by a newer search.")
+            except SearchRejectedError:
+                logger.info("Search rejected, too many searches running: %s", query)
+                context.error_message = SEARCH_BUSY_MESSAGE
+                context.is_busy = True
             except Exception:
                 logger.exception("Search error occurred for query: %s", query)
                 context.error_message = _("Search error")
 
+        return self._render(request, context)
+
+    def _build_context(self, request: HttpRequest, searcher: GlobalSearch, query: str):
+        """Build the template context before the search is executed."""
+        return self.SearchContext(
+            query=query,
+            apps_data=self._get_apps_data(request, searcher),
+            selected_content_type_ids=self._get_selected_content_type_ids(request, searcher),
+            search_results=[],
+            elapsed_time=None,
+            error_message=None,
+        )
+
+    def _apply_search_result(self, context: SearchContext, result: GlobalSearchResult):
+        """Fill the template context with a search result."""
+        context.search_results = self._convert_search_results(result)
+        context.elapsed_time = result.elapsed_time_ms / 1000.0
+
+        self._apply_unsearched_models(context, result.unsearched_models, result.is_timeout)
+        self._apply_search_summary(context, result)
+
+    def _apply_search_summary(self, context: SearchContext, result: GlobalSearchResult):
+        """Fill the template context with the top results and the degraded search warning."""
+        context.top_results = result.top_results
+        if result.is_degraded:
+            context.warning_message = _(
+                "Too many searches are running. Showing the results of a reduced search."
+            )
+
+    def _apply_unsearched_models(
+        self,
+        context: SearchContext,
+        unsearched_models: list[ModelSearchResult],
+        is_timeout: bool,
+    ):
+        """Fill the template context with the models that were not completely searched."""
+        context.circuit_open_models = [
+            model_result.verbose_name_plural
+            for model_result in unsearched_models
+            if model_result.status == ModelSearchStatus.CIRCUIT_OPEN
+        ]
+        if unsearched_models:
+            # Partial results: let the user retry only the models that weren't searched
+            context.unsearched_models = [
+                self._convert_model_result(model_result) for model_result in unsearched_models
+            ]
+            content_type_ids = [m.content_type_id for m in unsearched_models]
+            context.retry_url = "?" + urlencode(
+                {"q": context.query, "content_type": ",".join(map(str, content_type_ids))}
+            )
+            context.warning_message = _("Some models could not be searched.")
+
+        if is_timeout:
+            if unsearched_models:
+                context.warning_message = _(
+                    "Search timeout exceeded. Showing results of the models searched in time."
+                )
+            else:
+                context.error_message = _("Search timeout exceeded. Please refine your query.")
+
+    def _get_search_phases(self, request: HttpRequest, searcher: GlobalSearch) -> list[SearchPhase]:
+        """Get the phases of the search, in order."""
+        if (
+            not searcher.settings.two_phase_search_enabled
+            or request.GET.get("phase") == SearchPhase.FULL.value
+        ):
+            return [SearchPhase.FULL]
+        return [SearchPhase.INDEXED, SearchPhase.FULL]
+
+    def _get_full_search_url(self, request: HttpRequest) -> str:
+        params = request.GET.copy()
+        params["phase"] = SearchPhase.FULL.value
+        return f"?{params.urlencode()}"
+
+    def _get_stream_url(self, request: HttpRequest) -> str:
+        stream_url = reverse("admin:global_search_stream", current_app=self.admin_site.name)
+        return f"{stream_url}?{request.GET.urlencode()}"
+
+    def _render(self, request: HttpRequest, context: SearchContext):
         # Merge with admin site context for proper URL resolution
         template_context = {
             **self.admin_site.each_context(request),
             **asdict(context),
         }
-        return render(request, self.template_name, template_context)
+        response = render(request, self.template_name, template_context)
+        if context.is_busy:
+            # Tell clients (and load balancers) the search may be retried shortly
+            response.status_code = 503
+            response["Retry-After"] = str(SEARCH_REJECTED_RETRY_AFTER)
+        return response
 
     def _convert_search_results(self, result: GlobalSearchResult) -> list[AppResultContext]:
         return [
@@ -135,6 +258,9 @@ class GlobalSearchView(View):
                 self.SearchItemContext(url=item.url, display_text=item.display_text)
                 for item in model_result.items
             ],
+            status=model_result.status.value,
+            status_display=str(MODEL_SEARCH_STATUS_LABELS[model_result.status]),
+            elapsed_time_ms=model_result.elapsed_time_ms,
         )
 
     def _get_selected_content_type_ids(self, request: HttpRequest, searcher: GlobalSearch):
@@ -214,3 +340,269 @@ class GlobalSearchView(View):
 
         # Return in app_label alphabetical order
         return dict(sorted(apps_data.items()))
+
+
+class AsyncGlobalSearchView(GlobalSearchView):
+    """Global Search View for ASGI deployments.
+
+    Runs the search with :class:`AsyncGlobalSearch`, so waiting on the database
+    doesn't hold a thread for the whole duration of the search.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # staff_member_required only supports sync views, apply the same check here
+        if not await sync_to_async(_is_active_staff)(request.user):
+            return redirect_to_login(
+                request.get_full_path(),
+                reverse("admin:login", current_app=self.admin_site.name),
+            )
+        return await View.dispatch(self, request, *args, **kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        """Handle GET request."""
+        query = request.GET.get("q", "").strip()
+        searcher = AsyncGlobalSearch(self.admin_site)
+        context = await sync_to_async(self._build_context)(request, searcher, query)
+
+        if query and searcher.settings.streaming_enabled:
+            # Results are fetched by global_search.js from the stream endpoint
+            context.stream_url = self._get_stream_url(request)
+        # Execute search if query is provided
+        elif query:
+            try:
+                phases = self._get_search_phases(request, searcher)
+                result = await searcher.search(
+                    request=request,
+                    query=query,
+                    content_type_ids=context.selected_content_type_ids or None,
+                    phase=phases[0],
+                )
+                self._apply_search_result(context, result)
+                if len(phases) > 1:
+                    # The full search is fetched on demand
+                    context.full_search_url = self._get_full_search_url(request)
+            except ValueError:
+                logger.exception("Invalid search query: %s", query)
+                context.error_message = _("Invalid query")
+            except SearchCancelledError:
+                logger.info("Search cancelled by a newer search: %s", query)
+                context.error_message = _("Search cancelled by a newer search.")
+            except SearchRejectedError:
+                logger.info("Search rejected, too many searches running: %s", query)
+                context.error_message = SEARCH_BUSY_MESSAGE
+                context.is_busy = True
+            except Exception:
+                logger.exception("Search error occurred for query: %s", query)
+                context.error_message = _("Search error")
+
+        return await sync_to_async(self._render)(request, context)
+
+
+class GlobalSearchStreamMixin:
+    """Stream model search results as newline-delimited JSON (NDJSON).
+
+    Each line is an event:
+
+    - ``{"type": "model", "app_label": ..., "content_type_id": ..., "html": ...}``
+      for every model with results, as soon as it is searched
+    - ``{"type": "done", "is_timeout": ..., "elapsed_time": ..., "header_html": ...,
+      "unsearched_html": ..., "top_results_html": ...}`` once all models are searched,
+      with the same warnings and top results as the search page
+    - ``{"type": "error", "message": ...}`` if the search fails or is cancelled
+
+    Results that were already streamed are kept on timeout (partial results).
+    With the two-phase search, the results of the full phase replace the
+    results of the indexed phase model by model.
+    """
+
+    stream_content_type = "application/x-ndjson"
+
+    def _encode_event(self, event: dict) -> str:
+        return json.dumps(event) + "\n"
+
+    def _model_event(self, model_search_result: ModelSearchResult) -> str:
+        app_result = self.AppResultContext(
+            app_label=model_search_result.app_label,
+            app_verbose_name=str(apps.get_app_config(model_search_result.app_label).verbose_name),
+            models=[self._convert_model_result(model_search_result)],
+        )
+        html = render_to_string("global_search/app_results.html", {"app_result": app_result})
+        return self._encode_event(
+            {
+                "type": "model",
+                "app_label": model_search_result.app_label,
+                "content_type_id": model_search_result.content_type_id,
+                "html": html,
+            }
+        )
+
+    def _done_event(
+        self,
+        query: str,
+        unsearched_models: list[ModelSearchResult],
+        has_results: bool,
+        start_time: float,
+        search_result: GlobalSearchResult | None,
+    ) -> str:
+        is_timeout = any(
+            model_result.status in (ModelSearchStatus.TIMED_OUT, ModelSearchStatus.SKIPPED)
+            for model_result in unsearched_models
+        )
+        context = self.SearchContext(
+            query=query,
+            apps_data={},
+            selected_content_type_ids=[],
+            search_results=[],
+            elapsed_time=int((time.perf_counter() - start_time) * 1000) / 1000.0,
+            error_message=None,
+        )
+        self._apply_unsearched_models(context, unsearched_models, is_timeout)
+        if search_result is not None:
+            self._apply_search_summary(context, search_result)
+        template_context = {**asdict(context), "has_results": has_results}
+
+        return self._encode_event(
+            {
+                "type": "done",
+                "is_timeout": is_timeout,
+                "elapsed_time": context.elapsed_time,
+                "header_html": render_to_string(
+                    "global_search/results_header.html", template_context
+                ),
+                "unsearched_html": render_to_string(
+                    "global_search/unsearched_models.html", template_context
+                ),
+                "top_results_html": render_to_string(
+                    "global_search/top_results.html", template_context
+                ),
+            }
+        )
+
+    def _error_event(self, message: str) -> str:
+        return self._encode_event({"type": "error", "message": str(message)})
+
+    def _streaming_response(self, streaming_content) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(streaming_content, content_type=self.stream_content_type)
+        # Ask reverse proxies (nginx) not to buffer the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class GlobalSearchStreamView(GlobalSearchStreamMixin, GlobalSearchView):
+    """Global Search View streaming model results as they are searched."""
+
+    def get(self, request, *args, **kwargs):
+        """Handle GET request."""
+        query = request.GET.get("q", "").strip()
+        searcher = GlobalSearch(self.admin_site)
+        selected_ct_ids = self._get_selected_content_type_ids(request, searcher)
+
+        try:
+            phase_results = [
+                searcher.iter_search(
+                    request=request,
+                    query=query,
+                    content_type_ids=selected_ct_ids or None,
+                    phase=phase,
+                )
+                for phase in self._get_search_phases(request, searcher)
+            ]
+        except ValueError:
+            logger.exception("Invalid search query: %s", query)
+            return self._streaming_response([self._error_event(_("Invalid query"))])
+
+        return self._streaming_response(self._stream(query, phase_results))
+
+    def _stream(self, query: str, phase_results) -> Iterator[str]:
+        start_time = time.perf_counter()
+        has_results = False
+
+        try:
+            for model_search_results in phase_results:
+                # Every phase searches all models, the last one tells which weren't searched
+                unsearched_models = []
+                for model_search_result in model_search_results:
+                    if model_search_result.status != ModelSearchStatus.COMPLETED:
+                        unsearched_models.append(model_search_result)
+                    elif model_search_result.items:
+                        has_results = True
+                        yield self._model_event(model_search_result)
+        except SearchCancelledError:
+            logger.info("Search cancelled by a newer search: %s", query)
+            yield self._error_event(_("Search cancelled by a newer search."))
+            return
+        except SearchRejectedError:
+            logger.info("Search rejected, too many searches running: %s", query)
+            yield self._error_event(SEARCH_BUSY_MESSAGE)
+            return
+        except Exception:
+            logger.exception("Search error occurred for query: %s", query)
+            yield self._error_event(_("Search error"))
+            return
+
+        yield self._done_event(
+            query, unsearched_models, has_results, start_time, model_search_results.search_result
+        )
+
+
+class AsyncGlobalSearchStreamView(GlobalSearchStreamMixin, AsyncGlobalSearchView):
+    """Async Global Search View streaming model results as they are searched."""
+
+    async def get(self, request, *args, **kwargs):
+        """Handle GET request."""
+        query = request.GET.get("q", "").strip()
+        searcher = AsyncGlobalSearch(self.admin_site)
+        selected_ct_ids = await sync_to_async(self._get_selected_content_type_ids)(
+            request, searcher
+        )
+
+        try:
+            phase_results = [
+                searcher.iter_search(
+                    request=request,
+                    query=query,
+                    content_type_ids=selected_ct_ids or None,
+                    phase=phase,
+                )
+                for phase in self._get_search_phases(request, searcher)
+            ]
+        except ValueError:
+            logger.exception("Invalid search query: %s", query)
+            return self._streaming_response([self._error_event(_("Invalid query"))])
+
+        return self._streaming_response(self._stream(query, phase_results))
+
+    async def _stream(self, query: str, phase_results) -> AsyncIterator[str]:
+        start_time = time.perf_counter()
+        has_results = False
+
+        try:
+            for model_search_results in phase_results:
+                # Every phase searches all models, the last one tells which weren't searched
+                unsearched_models = []
+                async for model_search_result in model_search_results:
+                    if model_search_result.status != ModelSearchStatus.COMPLETED:
+                        unsearched_models.append(model_search_result)
+                    elif model_search_result.items:
+                        has_results = True
+                        yield self._model_event(model_search_result)
+        except SearchCancelledError:
+            logger.info("Search cancelled by a newer search: %s", query)
+            yield self._error_event(_("Search cancelled by a newer search."))
+            return
+        except SearchRejectedError:
+            logger.info("Search rejected, too many searches running: %s", query)
+            yield self._error_event(SEARCH_BUSY_MESSAGE)
+            return
+        except Exception:
+            logger.exception("Search error occurred for query: %s", query)
+            yield self._error_event(_("Search error"))
+            return
+
+        yield self._done_event(
+            query, unsearched_models, has_results, start_time, model_search_results.search_result
+        )
+
+
+def _is_active_staff(user) -> bool:
+    return user.is_active and user.is_staff
@@ -0,0 +1,54 @@
+"""Admin URL template tests."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import NoReverseMatch, reverse
+
+from django_global_search import admin_urls
+from django_global_search.admin_urls import (
+    clear_url_templates,
+    get_change_url,
+    get_changelist_url,
+)
+
+
+class TestAdminUrls(SimpleTestCase):
+    """Test get_change_url and get_changelist_url."""
+
+    def setUp(self):
+        clear_url_templates()
+        self.addCleanup(clear_url_templates)
+
+    def test_change_url_matches_reverse(self):
+        self.assertEqual(
+            get_change_url("admin", "test_app", "book", 42),
+            reverse("admin:test_app_book_change", args=[42]),
+        )
+
+    def test_change_url_quotes_object_id_like_admin(self):
+        self.assertEqual(
+            get_change_url("admin", "test_app", "book", "a/b_c d"),
+            "/admin/test_app/book/a_2Fb_5Fc%20d/change/",
+        )
+
+    def test_change_url_unknown_model(self):
+        with self.assertRaises(NoReverseMatch):
+            get_change_url("admin", "test_app", "unknown", 1)
+
+    def test_changelist_url(self):
+        self.assertEqual(get_changelist_url("admin", "test_app", "book"), "/admin/test_app/book/")
+        self.assertIsNone(get_changelist_url("admin", "test_app", "unknown"))
+
+    def test_reversed_once(self):
+        with mock.patch.object(admin_urls, "reverse", wraps=reverse) as mock_reverse:
+            for pk in range(3):
+                get_change_url("admin", "test_app", "book", pk)
+
+        mock_reverse.assert_called_once()
+
+    def test_cleared_when_urlconf_changes(self):
+        get_change_url("admin", "test_app", "book", 1)
+
+        with override_settings(ROOT_URLCONF="tests.test_project.urls"):
+            self.assertEqual(admin_urls._url_templates, {})
@@ -0,0 +1,77 @@
+"""Admission controller tests."""
+
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from django_global_search.admission import SearchAdmissionController, SearchRejectedError
+
+
+class TestSearchAdmissionController(SimpleTestCase):
+    """Test SearchAdmissionController."""
+
+    def test_rejected_beyond_global_limit(self):
+        controller = SearchAdmissionController(max_searches=1)
+        controller.acquire("user1")
+
+        with self.assertRaises(SearchRejectedError):
+            controller.acquire("user2")
+
+        self.assertEqual(controller.get_stats().rejected, 1)
+
+    def test_rejected_beyond_user_limit(self):
+        controller = SearchAdmissionController(max_searches_per_user=1)
+        controller.acquire("user1")
+
+        with self.assertRaises(SearchRejectedError):
+            controller.acquire("user1")
+        controller.acquire("user2")
+
+        self.assertEqual(controller.get_stats().running, 2)
+
+    def test_release_frees_slot(self):
+        controller = SearchAdmissionController(max_searches=1, max_searches_per_user=1)
+        controller.acquire("user1")
+        controller.release("user1")
+
+        controller.acquire("user1")
+
+        self.assertEqual(controller.get_stats().admitted, 2)
+
+    def test_queued_search_admitted_when_slot_frees(self):
+        controller = SearchAdmissionController(max_searches=1, max_queued=1, queue_timeout=5)
+        controller.acquire("user1")
+        threading.Timer(0.05, controller.release, ["user1"]).start()
+
+        controller.acquire("user2")
+
+        stats = controller.get_stats()
+        self.assertEqual((stats.running, stats.queued, stats.admitted), (1, 0, 2))
+        self.assertGreater(stats.queue_wait_ms_max, 0)
+
+    def test_rejected_after_queue_timeout(self):
+        controller = SearchAdmissionController(max_searches=1, max_queued=1, queue_timeout=0.01)
+        controller.acquire("user1")
+        start_time = time.perf_counter()
+
+        with self.assertRaises(SearchRejectedError):
+            controller.acquire("user2")
+
+        self.assertLess(time.perf_counter() - start_time, 1)
+        self.assertEqual(controller.get_stats().queued, 0)
+
+    def test_rejected_when_queue_is_full(self):
+        controller = SearchAdmissionController(max_searches=1, max_queued=1, queue_timeout=5)
+        controller.acquire("user1")
+        waiter = threading.Thread(target=controller.acquire, args=["user2"])
+        waiter.start()
+        while controller.get_stats().queued < 1:
+            time.sleep(0.01)
+
+        with self.assertRaises(SearchRejectedError):
+            controller.acquire("user3")
+
+        controller.release("user1")
+        waiter.join(5)
+        self.assertEqual(controller.get_stats().running, 1)
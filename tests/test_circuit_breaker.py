@@ -0,0 +1,80 @@
+"""Circuit breaker tests."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from django_global_search.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(SimpleTestCase):
+    """Test CircuitBreaker."""
+
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch(
+            "django_global_search.circuit_breaker.time.perf_counter", side_effect=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_opens_after_failure_threshold(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=2, window=60, cooldown=30)
+
+        circuit_breaker.record_failure("test_app.book")
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+        circuit_breaker.record_failure("test_app.book")
+
+        self.assertFalse(circuit_breaker.allow("test_app.book"))
+        self.assertTrue(circuit_breaker.allow("test_app.author"))
+
+    def test_failures_outside_window_are_forgotten(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=2, window=60, cooldown=30)
+        circuit_breaker.record_failure("test_app.book")
+        self.now += 61
+
+        circuit_breaker.record_failure("test_app.book")
+
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+
+    def test_half_open_allows_single_probe(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, window=60, cooldown=30)
+        circuit_breaker.record_failure("test_app.book")
+        self.now += 31
+
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+        self.assertFalse(circuit_breaker.allow("test_app.book"))
+
+    def test_successful_probe_closes_circuit(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, window=60, cooldown=30)
+        circuit_breaker.record_failure("test_app.book")
+        self.now += 31
+        circuit_breaker.allow("test_app.book")
+
+        circuit_breaker.record_success("test_app.book")
+
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+
+    def test_failed_probe_reopens_circuit(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, window=60, cooldown=30)
+        circuit_breaker.record_failure("test_app.book")
+        self.now += 31
+        circuit_breaker.allow("test_app.book")
+
+        circuit_breaker.record_failure("test_app.book")
+
+        self.assertFalse(circuit_breaker.allow("test_app.book"))
+        self.now += 31
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
+
+    def test_stale_failures_keep_cooldown(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, window=60, cooldown=30)
+        circuit_breaker.record_failure("test_app.book")
+        self.now += 20
+
+        # A search started before the circuit opened fails late
+        circuit_breaker.record_failure("test_app.book")
+
+        self.now += 11
+        self.assertTrue(circuit_breaker.allow("test_app.book"))
@@ -0,0 +1,174 @@
+"""Search coalescing tests."""
+
+import asyncio
+import threading
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from django_global_search.coalescing import (
+    COALESCING_CACHE_KEY_PREFIX,
+    SearchCoalescer,
+    get_coalescing_key,
+)
+
+
+class TestGetCoalescingKey(SimpleTestCase):
+    """Test get_coalescing_key."""
+
+    def test_content_type_order_does_not_matter(self):
+        self.assertEqual(
+            get_coalescing_key("admin", "django", [2, 1], "fingerprint"),
+            get_coalescing_key("admin", "django", [1, 2, 2], "fingerprint"),
+        )
+
+    def test_fingerprints_are_separate(self):
+        self.assertNotEqual(
+            get_coalescing_key("admin", "django", None, "staff"),
+            get_coalescing_key("admin", "django", None, "superuser"),
+        )
+
+
+class TestSearchCoalescer(SimpleTestCase):
+    """Test SearchCoalescer."""
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_followers_share_leader_result(self):
+        coalescer = SearchCoalescer()
+        leader_started = threading.Event()
+        release_leader = threading.Event()
+        calls = []
+
+        def search():
+            calls.append(1)
+            leader_started.set()
+            release_leader.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(coalescer.run("key", search, 5)))
+        leader.start()
+        leader_started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(coalescer.run("key", search, 5)))
+            for _ in range(3)
+        ]
+        # Count the followers waiting for the leader's flight
+        flight = coalescer._flights["key"]
+        waiting = threading.Semaphore(0)
+        wait_for_leader = flight.done.wait
+
+        def wait(timeout=None):
+            waiting.release()
+            return wait_for_leader(timeout)
+
+        flight.done.wait = wait
+        for follower in followers:
+            follower.start()
+        for _ in followers:
+            self.assertTrue(waiting.acquire(timeout=5))
+        release_leader.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_async_followers_share_leader_result(self):
+        coalescer = SearchCoalescer()
+        calls = []
+
+        async def search():
+            calls.append(1)
+            # Let the followers join the flight
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def search_concurrently():
+            return await asyncio.gather(*(coalescer.arun("key", search, 5) for _ in range(4)))
+
+        results = async_to_sync(search_concurrently)()
+
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_async_follower_shares_sync_leader_result(self):
+        coalescer = SearchCoalescer()
+        leader_started = threading.Event()
+        release_leader = threading.Event()
+
+        def search():
+            leader_started.set()
+            release_leader.wait(5)
+            return "result"
+
+        leader = threading.Thread(target=coalescer.run, args=("key", search, 5))
+        leader.start()
+        leader_started.wait(5)
+
+        async def follow():
+            follower = asyncio.ensure_future(coalescer.arun("key", mock.AsyncMock(), 5))
+            # Release the leader once the follower waits for its flight
+            await asyncio.sleep(0.05)
+            release_leader.set()
+            return await follower
+
+        result = async_to_sync(follow)()
+        leader.join(5)
+
+        self.assertEqual(result, "result")
+
+    def test_async_leader_error_is_raised(self):
+        coalescer = SearchCoalescer()
+
+        with self.assertRaises(ValueError):
+            async_to_sync(coalescer.arun)("key", mock.AsyncMock(side_effect=ValueError), 5)
+
+        self.assertEqual(coalescer._flights, {})
+
+    def test_sequential_searches_are_not_coalesced(self):
+        coalescer = SearchCoalescer()
+        search = mock.Mock(side_effect=["first", "second"])
+
+        self.assertEqual(coalescer.run("key", search, 5), "first")
+        self.assertEqual(coalescer.run("key", search, 5), "second")
+
+    def test_leader_error_is_raised(self):
+        coalescer = SearchCoalescer()
+
+        with self.assertRaises(ValueError):
+            coalescer.run("key", mock.Mock(side_effect=ValueError), 5)
+
+        self.assertEqual(coalescer._flights, {})
+
+    def test_follower_waits_for_other_process_result(self):
+        cache.set(f"{COALESCING_CACHE_KEY_PREFIX}:lock:key", "leader")
+        cache.set(f"{COALESCING_CACHE_KEY_PREFIX}:result:key:leader", "shared")
+        search = mock.Mock(return_value="own")
+
+        result = SearchCoalescer(cache_alias="default").run("key", search, 5)
+
+        self.assertEqual(result, "shared")
+        search.assert_not_called()
+
+    @mock.patch("django_global_search.coalescing.COALESCING_GRACE_PERIOD", 0)
+    def test_follower_searches_when_other_process_is_too_slow(self):
+        cache.set(f"{COALESCING_CACHE_KEY_PREFIX}:lock:key", "leader")
+
+        result = SearchCoalescer(cache_alias="default").run("key", mock.Mock(return_value="own"), 0)
+
+        self.assertEqual(result, "own")
+
+    def test_async_follower_waits_for_other_process_result(self):
+        cache.set(f"{COALESCING_CACHE_KEY_PREFIX}:lock:key", "leader")
+        cache.set(f"{COALESCING_CACHE_KEY_PREFIX}:result:key:leader", "shared")
+        search = mock.AsyncMock(return_value="own")
+
+        result = async_to_sync(SearchCoalescer(cache_alias="default").arun)("key", search, 5)
+
+        self.assertEqual(result, "shared")
+        search.assert_not_called()
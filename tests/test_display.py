@@ -0,0 +1,35 @@
+"""Display template tests."""
+
+from django.test import SimpleTestCase
+
+from django_global_search.display import format_display, get_display_fields
+
+
+class TestGetDisplayFields(SimpleTestCase):
+    """Test get_display_fields."""
+
+    def test_fields_in_order_of_first_use(self):
+        self.assertEqual(
+            get_display_fields("{title} ({author__name}, {title:.5})"), ("title", "author__name")
+        )
+
+    def test_no_placeholder(self):
+        self.assertEqual(get_display_fields("Book"), ())
+
+    def test_positional_placeholder(self):
+        with self.assertRaises(ValueError):
+            get_display_fields("{} - {0}")
+
+    def test_attribute_placeholder(self):
+        with self.assertRaises(ValueError):
+            get_display_fields("{author.name}")
+
+
+class TestFormatDisplay(SimpleTestCase):
+    """Test format_display."""
+
+    def test_format(self):
+        self.assertEqual(
+            format_display("{title} ({author__name})", {"title": "Django", "author__name": "Jo"}),
+            "Django (Jo)",
+        )
@@ -0,0 +1,105 @@
+"""Hydration plan tests."""
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from django_global_search.hydration import (
+    clear_hydration_plans,
+    get_deferred_fields,
+    get_hydration_plan,
+    is_hydration_plan_known,
+    record_hydration_plan,
+)
+from tests.factories import AuthorFactory, BookFactory
+from tests.test_app.models import Book
+
+
+class TestRecordHydrationPlan(TestCase):
+    """Test record_hydration_plan and get_deferred_fields."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = BookFactory(title="Django for Beginners", description="A long description")
+
+    def setUp(self):
+        clear_hydration_plans()
+        self.addCleanup(clear_hydration_plans)
+
+    def test_nothing_deferred_before_introspection(self):
+        self.assertFalse(is_hydration_plan_known(Book))
+        self.assertEqual(get_deferred_fields(Book), [])
+
+    def test_defers_large_fields_not_read(self):
+        with self.assertNumQueries(0):
+            record_hydration_plan(self.book)
+
+        self.assertTrue(is_hydration_plan_known(Book))
+        self.assertEqual(get_deferred_fields(Book), ["description"])
+
+    def test_keeps_large_fields_read(self):
+        with mock.patch.object(Book, "__str__", lambda book: f"{book.title}: {book.description}"):
+            record_hydration_plan(self.book)
+
+        self.assertEqual(get_deferred_fields(Book), [])
+
+    def test_loads_fields_deferred_by_the_queryset(self):
+        book = Book.objects.defer("title").get(pk=self.book.pk)
+
+        with self.assertNumQueries(1):
+            record_hydration_plan(book)
+
+        self.assertEqual(get_deferred_fields(Book), ["description"])
+
+    def test_failing_str_defers_nothing(self):
+        with mock.patch.object(Book, "__str__", side_effect=ValueError):
+            record_hydration_plan(self.book)
+
+        self.assertTrue(is_hydration_plan_known(Book))
+        self.assertEqual(get_deferred_fields(Book), [])
+
+    def test_no_relation_followed(self):
+        record_hydration_plan(self.book)
+
+        self.assertEqual(get_hydration_plan(Book).select_related, ())
+
+    def test_relations_followed(self):
+        author = AuthorFactory(name="John Doe", bio="A long biography")
+        book = BookFactory(title="Two Scoops of Django", author=author)
+
+        book = Book.objects.get(pk=book.pk)
+
+        # Following the relation loads the related object
+        with (
+            mock.patch.object(Book, "__str__", lambda book: f"{book.title} ({book.author})"),
+            self.assertNumQueries(1),
+        ):
+            record_hydration_plan(book)
+
+        plan = get_hydration_plan(Book)
+        self.assertEqual(plan.select_related, ("author",))
+        self.assertEqual(plan.str_fields, {"title", "author_id"})
+        self.assertEqual(get_deferred_fields(Book), ["description"])
+
+    def test_relations_cached_on_the_instance_are_recorded(self):
+        book = Book.objects.select_related("author").get(pk=self.book.pk)
+
+        with mock.patch.object(Book, "__str__", lambda book: book.author.name):
+            record_hydration_plan(book)
+
+        self.assertEqual(get_hydration_plan(Book).select_related, ("author",))
+        # The instance keeps its related objects
+        self.assertIn("author", book._state.fields_cache)
+
+    def test_clear_hydration_plans(self):
+        record_hydration_plan(self.book)
+
+        clear_hydration_plans()
+
+        self.assertFalse(is_hydration_plan_known(Book))
+
+    def test_plans_forgotten_when_settings_change(self):
+        record_hydration_plan(self.book)
+
+        with override_settings(GLOBAL_SEARCH_AUTO_DEFER_ENABLED=True):
+            self.assertFalse(is_hydration_plan_known(Book))
@@ -0,0 +1,44 @@
+"""Latency tracker tests."""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from django_global_search.latency import LatencyTracker
+
+
+class TestLatencyTracker(SimpleTestCase):
+    """Test LatencyTracker."""
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_first_measurement_is_the_estimate(self):
+        tracker = LatencyTracker("admin")
+
+        self.assertEqual(tracker.record("test_app.book", 100), 100)
+        self.assertEqual(
+            tracker.get_estimates(["test_app.book", "test_app.author"]), {"test_app.book": 100}
+        )
+
+    def test_estimate_moves_towards_measurements(self):
+        tracker = LatencyTracker("admin")
+        tracker.record("test_app.book", 100)
+
+        estimate = tracker.record("test_app.book", 200)
+
+        self.assertGreater(estimate, 100)
+        self.assertLess(estimate, 200)
+
+    def test_estimates_shared_through_cache(self):
+        LatencyTracker("admin", cache_alias="default").record("test_app.book", 100)
+
+        estimates = LatencyTracker("admin", cache_alias="default").get_estimates(["test_app.book"])
+
+        self.assertEqual(estimates, {"test_app.book": 100})
+
+    def test_namespaces_are_separate(self):
+        LatencyTracker("admin", cache_alias="default").record("test_app.book", 100)
+
+        estimates = LatencyTracker("other", cache_alias="default").get_estimates(["test_app.book"])
+
+        self.assertEqual(estimates, {})
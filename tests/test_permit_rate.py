@@ -0,0 +1,31 @@
+"""Permit rate tracker tests."""
+
+from django.test import SimpleTestCase
+
+from django_global_search.permit_rate import MIN_PERMIT_RATE, PermitRateTracker
+
+
+class TestPermitRateTracker(SimpleTestCase):
+    """Test PermitRateTracker."""
+
+    def test_unknown_model_is_fully_viewable(self):
+        self.assertEqual(PermitRateTracker().get_estimate("test_app.book", "role"), 1.0)
+
+    def test_moving_average(self):
+        tracker = PermitRateTracker()
+
+        self.assertEqual(tracker.record("test_app.book", "role", 1, 4), 0.25)
+        self.assertAlmostEqual(tracker.record("test_app.book", "role", 4, 4), 0.4)
+        self.assertAlmostEqual(tracker.get_estimate("test_app.book", "role"), 0.4)
+
+    def test_estimates_per_role(self):
+        tracker = PermitRateTracker()
+        tracker.record("test_app.book", "role", 1, 2)
+
+        self.assertEqual(tracker.get_estimate("test_app.book", "other role"), 1.0)
+
+    def test_minimum_estimate(self):
+        tracker = PermitRateTracker()
+        tracker.record("test_app.book", "role", 0, 10)
+
+        self.assertEqual(tracker.get_estimate("test_app.book", "role"), MIN_PERMIT_RATE)
@@ -0,0 +1,132 @@
+"""Pipelined query tests."""
+
+import sys
+from unittest import mock, skipUnless
+
+from django.db import DatabaseError, connection
+from django.test import SimpleTestCase, TestCase
+
+from django_global_search import pipeline
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.pipeline import fetch_pipelined, supports_pipeline
+from django_global_search.timeouts import SearchTimeoutError
+from tests.test_app.models import Book
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+
+class TestSupportsPipeline(SimpleTestCase):
+    """Test supports_pipeline."""
+
+    def test_not_supported_on_sqlite(self):
+        self.assertFalse(supports_pipeline("default"))
+
+
+class TestFetchPipelined(TestCase):
+    """Test fetch_pipelined with a mocked psycopg connection."""
+
+    def setUp(self):
+        self.executed = []
+        self.rows = []
+        self.raw_connection = mock.MagicMock()
+        self.psycopg = mock.Mock()
+        self.psycopg.Cursor.side_effect = self._make_cursor
+
+        patches = [
+            mock.patch.dict(sys.modules, {"psycopg": self.psycopg}),
+            mock.patch.object(
+                pipeline, "connections", {"default": mock.Mock(connection=self.raw_connection)}
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _make_cursor(self, raw_connection):
+        self.assertIs(raw_connection, self.raw_connection)
+        cursor = mock.Mock()
+
+        def execute(sql, params=None):
+            # Savepoints open when the query is sent
+            self.executed.append((sql, len(connection.savepoint_ids)))
+
+        cursor.execute.side_effect = execute
+        cursor.fetchall.side_effect = lambda: self.rows.pop(0)
+        return cursor
+
+    def test_queries_sent_in_one_pipeline_in_a_savepoint(self):
+        self.rows = [[(3,), (1,)], [(2,)]]
+        savepoints = len(connection.savepoint_ids)
+
+        results = fetch_pipelined(
+            "default",
+            [Book.objects.values_list("pk"), Book.objects.filter(title="a").values_list("pk")],
+        )
+
+        self.assertEqual(results, [[(3,), (1,)], [(2,)]])
+        self.raw_connection.pipeline.assert_called_once_with()
+        self.assertEqual(len(self.executed), 2)
+        self.assertEqual({depth for _sql, depth in self.executed}, {savepoints + 1})
+
+    def test_rows_converted_like_queryset_iteration(self):
+        # SQLite returns booleans as integers
+        self.rows = [[(1,), (0,)]]
+
+        results = fetch_pipelined("default", [Book.objects.values_list("is_active")])
+
+        self.assertEqual(results, [[(True,), (False,)]])
+
+    def test_statement_timeout(self):
+        self.rows = [[]]
+
+        fetch_pipelined("default", [Book.objects.values_list("pk")], timeout_ms=250)
+
+        self.assertEqual(self.executed[0][0], "SET LOCAL statement_timeout = 250")
+        self.assertEqual(len(self.executed), 2)
+
+    def test_no_statement_timeout_by_default(self):
+        self.rows = [[]]
+
+        fetch_pipelined("default", [Book.objects.values_list("pk")])
+
+        self.assertNotIn("statement_timeout", self.executed[0][0])
+
+    def test_empty_queryset_not_sent(self):
+        self.rows = [[(1,)]]
+
+        results = fetch_pipelined(
+            "default", [Book.objects.none().values_list("pk"), Book.objects.values_list("pk")]
+        )
+
+        self.assertEqual(results, [[], [(1,)]])
+        self.assertEqual(len(self.executed), 1)
+
+    def test_cancelled_search_not_sent(self):
+        with self.assertRaises(SearchCancelledError):
+            fetch_pipelined("default", [Book.objects.values_list("pk")], is_cancelled=lambda: True)
+
+        self.raw_connection.pipeline.assert_not_called()
+
+    def _fail_pipeline(self, exc):
+        # Errors of the pipeline are raised when leaving it
+        self.psycopg.Error = psycopg.Error
+        self.raw_connection.pipeline.return_value.__exit__.side_effect = exc
+
+    @skipUnless(psycopg, "psycopg is not installed")
+    def test_statement_timeout_raises_search_timeout(self):
+        self._fail_pipeline(psycopg.errors.QueryCanceled("canceling statement due to timeout"))
+
+        with self.assertRaises(SearchTimeoutError):
+            fetch_pipelined("default", [Book.objects.values_list("pk")], timeout_ms=1)
+
+    @skipUnless(psycopg, "psycopg is not installed")
+    def test_driver_error_raised_as_database_error(self):
+        self._fail_pipeline(psycopg.errors.UndefinedTable("relation does not exist"))
+
+        with self.assertRaises(DatabaseError) as context:
+            fetch_pipelined("default", [Book.objects.values_list("pk")])
+
+        self.assertIsInstance(context.exception.__cause__, psycopg.errors.UndefinedTable)
@@ -0,0 +1,84 @@
+"""Search registry snapshot tests."""
+
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+
+from django_global_search.admin import GlobalSearchAdminSiteMixin
+from django_global_search.registry import clear_search_registries, get_search_registry
+from django_global_search.settings import GlobalSearchAdminSiteSettings
+from tests.test_app.admin import AuthorAdmin, BookAdmin, CategoryAdmin
+from tests.test_app.models import Author, Book, Category
+
+
+class SearchAdminSite(GlobalSearchAdminSiteMixin, admin.AdminSite):
+    """Admin site whose registry the tests change."""
+
+
+class TestSearchRegistry(TestCase):
+    """Test get_search_registry."""
+
+    def setUp(self):
+        clear_search_registries()
+        self.addCleanup(clear_search_registries)
+        self.site = SearchAdminSite(name="registry_admin")
+        self.site.register(Author, AuthorAdmin)
+        self.site.register(Book, BookAdmin)
+        self.site.register(Category, CategoryAdmin)
+
+    def test_snapshot_is_reused(self):
+        with mock.patch.object(
+            GlobalSearchAdminSiteSettings,
+            "from_admin_site",
+            wraps=GlobalSearchAdminSiteSettings.from_admin_site,
+        ) as from_admin_site:
+            registry = get_search_registry(self.site)
+            self.assertIs(get_search_registry(self.site), registry)
+
+        from_admin_site.assert_called_once_with(self.site)
+
+    def test_model_admins_have_search_fields(self):
+        registry = get_search_registry(self.site)
+
+        self.assertEqual(
+            [model_admin.model for model_admin in registry.model_admins], [Author, Book]
+        )
+
+    @override_settings(GLOBAL_SEARCH_EXCLUDED_MODELS=["test_app.book"])
+    def test_excluded_models_are_omitted(self):
+        registry = get_search_registry(self.site)
+
+        self.assertEqual([model_admin.model for model_admin in registry.model_admins], [Author])
+
+    def test_snapshot_is_rebuilt_when_models_change(self):
+        registry = get_search_registry(self.site)
+
+        self.site.unregister(Book)
+
+        rebuilt = get_search_registry(self.site)
+        self.assertIsNot(rebuilt, registry)
+        self.assertEqual([model_admin.model for model_admin in rebuilt.model_admins], [Author])
+
+    def test_snapshot_is_rebuilt_when_settings_change(self):
+        registry = get_search_registry(self.site)
+
+        with override_settings(GLOBAL_SEARCH_MAX_RESULTS=5):
+            self.assertIsNot(get_search_registry(self.site), registry)
+
+    def test_content_types(self):
+        registry = get_search_registry(self.site)
+        book_admin = self.site._registry[Book]
+
+        self.assertEqual(
+            registry.get_content_type(book_admin), ContentType.objects.get_for_model(Book)
+        )
+
+    def test_content_types_are_loaded_once(self):
+        registry = get_search_registry(self.site)
+        book_admin = self.site._registry[Book]
+        registry.get_content_type(book_admin)
+
+        with self.assertNumQueries(0):
+            registry.get_content_type(book_admin)
@@ -0,0 +1,30 @@
+"""Search field lookup tests."""
+
+from django.test import SimpleTestCase
+
+from django_global_search.search_fields import get_indexed_search_field
+from tests.test_app.models import Book
+
+
+class TestGetIndexedSearchField(SimpleTestCase):
+    """Test get_indexed_search_field."""
+
+    def test_plain_field_searched_by_prefix(self):
+        self.assertEqual(get_indexed_search_field(Book, "title"), "^title")
+
+    def test_related_field_searched_by_prefix(self):
+        self.assertEqual(get_indexed_search_field(Book, "author__name"), "^author__name")
+
+    def test_prefixed_fields_are_kept(self):
+        for field_name in ["^title", "=isbn", "@description"]:
+            with self.subTest(field_name=field_name):
+                self.assertEqual(get_indexed_search_field(Book, field_name), field_name)
+
+    def test_contains_lookups_replaced(self):
+        self.assertEqual(
+            get_indexed_search_field(Book, "author__name__icontains"), "author__name__istartswith"
+        )
+        self.assertEqual(get_indexed_search_field(Book, "title__contains"), "title__startswith")
+
+    def test_other_lookups_are_kept(self):
+        self.assertEqual(get_indexed_search_field(Book, "isbn__iexact"), "isbn__iexact")
@@ -0,0 +1,1443 @@
+"""GlobalSearch tests."""
+
+import asyncio
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.db import OperationalError, connection, connections
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from django_global_search import circuit_breaker, hydration, permit_rate
+from django_global_search.admission import SearchRejectedError, clear_admission_controllers
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.coalescing import get_permission_fingerprint
+from django_global_search.routing import get_search_database
+from django_global_search.searcher import (
+    AsyncGlobalSearch,
+    GlobalSearch,
+    Hydration,
+    ModelSearchStatus,
+    SearchPhase,
+)
+from django_global_search.timeouts import SearchTimeoutError
+from tests.factories import AuthorFactory, BookFactory, PublisherFactory, StaffUserFactory
+from tests.test_app.models import Author, Book, Publisher
+
+
+def _make_request(user):
+    request = RequestFactory().get("/admin/global-search/")
+    request.user = user
+    return request
+
+
+def _result_summary(result):
+    return [
+        (
+            app_result.app_label,
+            model_result.model_name,
+            [item.display_text for item in model_result.items],
+        )
+        for app_result in result.apps
+        for model_result in app_result.models
+    ]
+
+
+def _result_texts(result):
+    return {
+        item.display_text
+        for app_result in result.apps
+        for model_result in app_result.models
+        for item in model_result.items
+    }
+
+
+class TestGlobalSearch(TestCase):
+    """Test GlobalSearch."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_iter_search_yields_every_model(self):
+        model_results = list(
+            GlobalSearch(admin.site).iter_search(_make_request(self.staff_user), "Django")
+        )
+
+        self.assertEqual(
+            [
+                (model_result.model_name, bool(model_result.items))
+                for model_result in model_results
+                if model_result.app_label == "test_app"
+            ],
+            [("author", False), ("book", True), ("publisher", True)],
+        )
+
+    def test_iter_search_validates_query_on_call(self):
+        with self.assertRaises(ValueError):
+            GlobalSearch(admin.site).iter_search(_make_request(self.staff_user), "a")
+
+    def test_search_groups_results_by_app(self):
+        searcher = GlobalSearch(admin.site)
+
+        result = searcher.search(_make_request(self.staff_user), "Django")
+
+        self.assertFalse(result.is_timeout)
+        self.assertEqual([app_result.app_label for app_result in result.apps], ["test_app"])
+        model_names = [model_result.model_name for model_result in result.apps[0].models]
+        self.assertEqual(model_names, ["book", "publisher"])
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+
+class TestGlobalSearchPartialResults(TestCase):
+    """Test per-model status and partial results."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="Django Fan")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def _search_failing_for(self, model, exception):
+        original_search_model = GlobalSearch._search_model
+
+        def search_model(searcher, request, model_admin, *args, **kwargs):
+            if model_admin.model is model:
+                raise exception
+            return original_search_model(searcher, request, model_admin, *args, **kwargs)
+
+        with mock.patch.object(GlobalSearch, "_search_model", search_model):
+            return GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+    def test_completed_models_have_status_and_elapsed_time(self):
+        result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        for app_result in result.apps:
+            for model_result in app_result.models:
+                self.assertEqual(model_result.status, ModelSearchStatus.COMPLETED)
+                self.assertGreaterEqual(model_result.elapsed_time_ms, 0)
+        self.assertEqual(result.unsearched_models, [])
+
+    def test_timeout_discards_results_by_default(self):
+        result = self._search_failing_for(Book, SearchTimeoutError())
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(result.apps, [])
+
+    @override_settings(GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True)
+    def test_timeout_keeps_completed_results(self):
+        result = self._search_failing_for(Book, SearchTimeoutError())
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Fan", "Django Press"})
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.TIMED_OUT)],
+        )
+
+    @override_settings(GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True, GLOBAL_SEARCH_TIMEOUT_MS=0)
+    def test_models_after_deadline_are_skipped(self):
+        result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(result.apps, [])
+        self.assertEqual({m.status for m in result.unsearched_models}, {ModelSearchStatus.SKIPPED})
+
+    def test_error_fails_search_by_default(self):
+        with self.assertRaises(RuntimeError):
+            self._search_failing_for(Book, RuntimeError("broken"))
+
+    @override_settings(GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True)
+    def test_error_reported_as_errored_model(self):
+        with self.assertLogs("django_global_search.searcher", "ERROR"):
+            result = self._search_failing_for(Book, RuntimeError("broken"))
+
+        self.assertFalse(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Fan", "Django Press"})
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.ERRORED)],
+        )
+
+
+class TestGlobalSearchScheduling(TestCase):
+    """Test model search priorities and per-model time budgets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="Django Fan")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_high_priority_models_searched_first(self):
+        original_search_model = GlobalSearch._search_model
+        searched_models = []
+
+        def search_model(searcher, request, model_admin, *args, **kwargs):
+            searched_models.append(model_admin.model._meta.model_name)
+            return original_search_model(searcher, request, model_admin, *args, **kwargs)
+
+        with (
+            mock.patch.object(
+                admin.site._registry[Publisher], "global_search_priority", 10, create=True
+            ),
+            mock.patch.object(GlobalSearch, "_search_model", search_model),
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(searched_models[0], "publisher")
+        # Results keep the registry order
+        model_names = [model_result.model_name for model_result in result.apps[0].models]
+        self.assertEqual(model_names, ["author", "book", "publisher"])
+
+    def _search_with_book_timeout(self, search):
+        with mock.patch.object(
+            admin.site._registry[Book], "global_search_timeout_ms", 0, create=True
+        ):
+            return search(_make_request(self.staff_user), "Django")
+
+    def test_model_timeout_only_stops_that_model(self):
+        result = self._search_with_book_timeout(GlobalSearch(admin.site).search)
+
+        self.assertFalse(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Fan", "Django Press"})
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.OVER_BUDGET)],
+        )
+
+    @override_settings(GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True)
+    def test_model_timeout_with_partial_results(self):
+        result = self._search_with_book_timeout(GlobalSearch(admin.site).search)
+
+        self.assertFalse(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Fan", "Django Press"})
+
+    def test_async_model_timeout_only_stops_that_model(self):
+        result = self._search_with_book_timeout(async_to_sync(AsyncGlobalSearch(admin.site).search))
+
+        self.assertFalse(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Fan", "Django Press"})
+
+    @override_settings(GLOBAL_SEARCH_COST_BASED_ORDERING_ENABLED=True)
+    def test_fast_models_searched_first(self):
+        searcher = GlobalSearch(admin.site)
+        self.addCleanup(searcher.latency_tracker.clear)
+        searcher.latency_tracker.record("test_app.author", 500)
+        searcher.latency_tracker.record("test_app.book", 5)
+        model_admins = [admin.site._registry[model] for model in (Author, Book, Publisher)]
+
+        search_order = searcher._get_search_order(model_admins)
+
+        # Publisher was never measured, so it is searched first to measure it
+        self.assertEqual(search_order, [2, 1, 0])
+
+    @override_settings(GLOBAL_SEARCH_COST_BASED_ORDERING_ENABLED=True)
+    def test_search_records_model_latency(self):
+        searcher = GlobalSearch(admin.site)
+        self.addCleanup(searcher.latency_tracker.clear)
+
+        searcher.search(_make_request(self.staff_user), "Django")
+
+        self.assertIn("test_app.book", searcher.latency_tracker.get_estimates(["test_app.book"]))
+
+    @override_settings(GLOBAL_SEARCH_TIME_SLICING_ENABLED=True)
+    def test_time_slice_shares_remaining_time(self):
+        searcher = GlobalSearch(admin.site)
+        deadline = time.perf_counter() + 1.0
+
+        model_deadline = searcher._get_model_deadline(
+            admin.site._registry[Book], deadline, models_left=4
+        )
+
+        self.assertAlmostEqual(model_deadline, deadline - 0.75, delta=0.05)
+
+
+@override_settings(GLOBAL_SEARCH_MAX_CONCURRENT_SEARCHES=1, GLOBAL_SEARCH_QUEUE_TIMEOUT_MS=0)
+class TestGlobalSearchAdmission(TestCase):
+    """Test admission control of concurrent searches."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+
+    def setUp(self):
+        clear_admission_controllers()
+        self.addCleanup(clear_admission_controllers)
+
+    def test_search_releases_its_slot(self):
+        searcher = GlobalSearch(admin.site)
+
+        searcher.search(_make_request(self.staff_user), "Django")
+        searcher.search(_make_request(self.staff_user), "Django")
+
+        stats = searcher.admission_controller.get_stats()
+        self.assertEqual((stats.running, stats.admitted, stats.rejected), (0, 2, 0))
+
+    def test_search_rejected_when_busy(self):
+        searcher = GlobalSearch(admin.site)
+        model_results = searcher.iter_search(_make_request(self.staff_user), "Django")
+        next(model_results)
+
+        with self.assertRaises(SearchRejectedError):
+            searcher.search(_make_request(self.staff_user), "Django")
+
+        list(model_results)
+        self.assertEqual(searcher.admission_controller.get_stats().rejected, 1)
+
+    @override_settings(GLOBAL_SEARCH_DEGRADED_SEARCH_TIMEOUT_MS=1000)
+    def test_degraded_search_when_busy(self):
+        searcher = GlobalSearch(admin.site)
+        model_results = searcher.iter_search(_make_request(self.staff_user), "Django")
+        next(model_results)
+
+        result = searcher.search(_make_request(self.staff_user), "Django")
+
+        list(model_results)
+        self.assertTrue(result.is_degraded)
+        self.assertIn("Django for Beginners", _result_texts(result))
+        stats = searcher._make_degraded_searcher().admission_controller.get_stats()
+        self.assertEqual((stats.running, stats.admitted), (0, 1))
+
+    @override_settings(GLOBAL_SEARCH_DEGRADED_SEARCH_TIMEOUT_MS=1000)
+    def test_degraded_search_rejected_when_degraded_searches_busy(self):
+        searcher = GlobalSearch(admin.site)
+        model_results = searcher.iter_search(_make_request(self.staff_user), "Django")
+        next(model_results)
+        degraded_results = searcher.iter_search(_make_request(self.staff_user), "Django")
+        next(degraded_results)
+
+        with self.assertRaises(SearchRejectedError):
+            searcher.search(_make_request(self.staff_user), "Django")
+
+        list(degraded_results)
+        list(model_results)
+
+    def test_async_search_rejected_when_busy(self):
+        async def search():
+            model_results = AsyncGlobalSearch(admin.site).iter_search(
+                _make_request(self.staff_user), "Django"
+            )
+            await model_results.__anext__()
+            try:
+                await AsyncGlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+            finally:
+                await model_results.aclose()
+
+        with self.assertRaises(SearchRejectedError):
+            async_to_sync(search)()
+
+
+@override_settings(
+    GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True, GLOBAL_SEARCH_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2
+)
+class TestGlobalSearchCircuitBreaker(TestCase):
+    """Test skipping models whose searches keep failing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def tearDown(self):
+        circuit_breaker._circuit_breakers.clear()
+
+    def _search_with_failing_books(self, searcher):
+        original_search_model = GlobalSearch._search_model
+
+        def search_model(self, request, model_admin, *args):
+            if model_admin.model is Book:
+                raise OperationalError("missing index")  # noqa: TRY003
+            return original_search_model(self, request, model_admin, *args)
+
+        with mock.patch.object(GlobalSearch, "_search_model", autospec=True) as mock_search:
+            mock_search.side_effect = search_model
+            return searcher.search(_make_request(self.staff_user), "Django")
+
+    def test_model_skipped_after_repeated_failures(self):
+        searcher = GlobalSearch(admin.site)
+        self._search_with_failing_books(searcher)
+        self._search_with_failing_books(searcher)
+
+        result = self._search_with_failing_books(searcher)
+
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.CIRCUIT_OPEN)],
+        )
+        self.assertEqual(_result_texts(result), {"Django Press"})
+
+    def test_successful_search_resets_failures(self):
+        searcher = GlobalSearch(admin.site)
+        self._search_with_failing_books(searcher)
+        searcher.search(_make_request(self.staff_user), "Django")
+
+        result = self._search_with_failing_books(searcher)
+
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.ERRORED)],
+        )
+
+
+def _fetch_unpipelined(using, querysets, timeout_ms=None, is_cancelled=None):
+    return [[(pk,) for pk in queryset.using(using)] for queryset in querysets]
+
+
+@override_settings(GLOBAL_SEARCH_PIPELINE_ENABLED=True)
+@mock.patch("django_global_search.searcher.supports_pipeline", return_value=True)
+class TestGlobalSearchPipeline(TestCase):
+    """Test pipelining the primary key queries of all models."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_primary_keys_fetched_in_one_pipeline(self, _supports_pipeline):
+        searcher = GlobalSearch(admin.site)
+        with mock.patch(
+            "django_global_search.searcher.fetch_pipelined", side_effect=_fetch_unpipelined
+        ) as mock_fetch_pipelined:
+            result = searcher.search(_make_request(self.staff_user), "Django")
+
+        mock_fetch_pipelined.assert_called_once()
+        using, querysets, _timeout_ms, _is_cancelled = mock_fetch_pipelined.call_args.args
+        self.assertEqual(using, "default")
+        model_admins = searcher.get_searchable_model_admins(_make_request(self.staff_user))
+        self.assertEqual(len(querysets), len(model_admins))
+        # Every model search used its prefetched primary keys
+        self.assertEqual(searcher.prefetched_primary_keys, {})
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+    def test_falls_back_when_pipeline_fails(self, _supports_pipeline):
+        with mock.patch(
+            "django_global_search.searcher.fetch_pipelined", side_effect=OperationalError
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+    def test_falls_back_when_pipeline_times_out(self, _supports_pipeline):
+        with mock.patch(
+            "django_global_search.searcher.fetch_pipelined", side_effect=SearchTimeoutError
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+    @override_settings(GLOBAL_SEARCH_CANCELLATION_ENABLED=True)
+    def test_pipeline_checks_search_cancellation(self, _supports_pipeline):
+        searcher = GlobalSearch(admin.site)
+        with (
+            mock.patch(
+                "django_global_search.searcher.fetch_pipelined", side_effect=SearchCancelledError
+            ) as mock_fetch_pipelined,
+            self.assertRaises(SearchCancelledError),
+        ):
+            searcher.search(_make_request(self.staff_user), "Django")
+
+        _using, _querysets, _timeout_ms, is_cancelled = mock_fetch_pipelined.call_args.args
+        self.assertEqual(is_cancelled, searcher.search_token.is_cancelled)
+
+    @override_settings(GLOBAL_SEARCH_PIPELINE_ENABLED=False)
+    def test_disabled_by_default(self, _supports_pipeline):
+        with mock.patch("django_global_search.searcher.fetch_pipelined") as mock_fetch_pipelined:
+            GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        mock_fetch_pipelined.assert_not_called()
+
+
+def _fetch_without_union(querysets, limit):
+    return [list(queryset.values_list("pk", flat=True)[:limit]) for queryset in querysets]
+
+
+@override_settings(GLOBAL_SEARCH_UNION_ENABLED=True)
+@mock.patch("django_global_search.searcher.supports_union", return_value=True)
+class TestGlobalSearchUnion(TestCase):
+    """Test fetching the primary keys of all models in one UNION ALL query."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_primary_keys_fetched_in_one_query(self, _supports_union):
+        searcher = GlobalSearch(admin.site)
+        with mock.patch(
+            "django_global_search.searcher.fetch_union_primary_keys",
+            side_effect=_fetch_without_union,
+        ) as mock_fetch_union_primary_keys:
+            result = searcher.search(_make_request(self.staff_user), "Django")
+
+        mock_fetch_union_primary_keys.assert_called_once()
+        querysets, limit = mock_fetch_union_primary_keys.call_args.args
+        model_admins = searcher.get_searchable_model_admins(_make_request(self.staff_user))
+        self.assertEqual(len(querysets), len(model_admins))
+        self.assertEqual(limit, searcher.settings.max_results_per_model + 1)
+        # Every model search used its prefetched primary keys
+        self.assertEqual(searcher.prefetched_primary_keys, {})
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+    def test_falls_back_when_union_fails(self, _supports_union):
+        # SQLite refuses limited subqueries in a compound statement
+        result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+    def test_distinct_querysets_queried_on_their_own(self, _supports_union):
+        book_admin = admin.site._registry[Book]
+        get_search_results = book_admin.get_search_results
+
+        def get_distinct_search_results(request, queryset, search_term):
+            queryset, _may_have_duplicates = get_search_results(request, queryset, search_term)
+            return queryset, True
+
+        searcher = GlobalSearch(admin.site)
+        with (
+            mock.patch.object(
+                book_admin, "get_search_results", side_effect=get_distinct_search_results
+            ),
+            mock.patch(
+                "django_global_search.searcher.fetch_union_primary_keys",
+                side_effect=_fetch_without_union,
+            ) as mock_fetch_union_primary_keys,
+        ):
+            result = searcher.search(_make_request(self.staff_user), "Django")
+
+        querysets, _limit = mock_fetch_union_primary_keys.call_args.args
+        self.assertNotIn(Book, [queryset.model for queryset in querysets])
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+
+@override_settings(GLOBAL_SEARCH_HYDRATION="single_query")
+class TestGlobalSearchSingleQueryHydration(TestCase):
+    """Test loading the result objects in the search query itself."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.books = [
+            BookFactory(title="Django for Beginners", description="A long description"),
+            BookFactory(title="Django for Professionals"),
+        ]
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def _search(self):
+        with CaptureQueriesContext(connection) as context:
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+        return result, len(context.captured_queries)
+
+    def test_matches_two_step_hydration_with_fewer_queries(self):
+        result, num_queries = self._search()
+        with override_settings(GLOBAL_SEARCH_HYDRATION="two_step"):
+            two_step_result, two_step_num_queries = self._search()
+
+        self.assertEqual(_result_summary(result), _result_summary(two_step_result))
+        # One query saved per model with results (book, publisher)
+        self.assertEqual(num_queries, two_step_num_queries - 2)
+
+    @override_settings(GLOBAL_SEARCH_MAX_RESULTS_PER_MODEL=1)
+    def test_has_more(self):
+        result, _num_queries = self._search()
+
+        book_result = next(
+            model_result
+            for model_result in result.apps[0].models
+            if model_result.model_name == "book"
+        )
+        self.assertEqual(len(book_result.items), 1)
+        self.assertTrue(book_result.has_more)
+
+    def test_only_fields(self):
+        book_admin = admin.site._registry[Book]
+        with (
+            mock.patch.object(book_admin, "global_search_only_fields", ["title"], create=True),
+            CaptureQueriesContext(connection) as context,
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        book_queries = [
+            captured["sql"]
+            for captured in context.captured_queries
+            if '"test_app_book"' in captured["sql"]
+        ]
+        self.assertEqual(len(book_queries), 1)
+        self.assertNotIn('"test_app_book"."description"', book_queries[0].split(" FROM ")[0])
+        self.assertIn("Django for Beginners", _result_texts(result))
+
+    @override_settings(GLOBAL_SEARCH_HYDRATION="two_step")
+    def test_selectable_per_model(self):
+        book_admin = admin.site._registry[Book]
+        searcher = GlobalSearch(admin.site)
+        with mock.patch.object(book_admin, "global_search_hydration", "single_query", create=True):
+            self.assertEqual(searcher._get_hydration(book_admin), Hydration.SINGLE_QUERY)
+            result = searcher.search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(
+            searcher._get_hydration(admin.site._registry[Publisher]), Hydration.TWO_STEP
+        )
+        self.assertEqual(
+            _result_texts(result),
+            {"Django for Beginners", "Django for Professionals", "Django Press"},
+        )
+
+    def test_async_search(self):
+        request = _make_request(self.staff_user)
+
+        async_result = async_to_sync(AsyncGlobalSearch(admin.site).search)(request, "Django")
+        sync_result = GlobalSearch(admin.site).search(request, "Django")
+
+        self.assertEqual(_result_summary(async_result), _result_summary(sync_result))
+
+
+class TestGlobalSearchDisplayTemplate(TestCase):
+    """Test building results from ModelAdmin.global_search_display."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+
+    def _search(self, search):
+        book_admin = admin.site._registry[Book]
+        with (
+            mock.patch.object(
+                book_admin, "global_search_display", "{title} by {author__name}", create=True
+            ),
+            mock.patch.object(Book, "__str__", side_effect=AssertionError),
+        ):
+            return search(_make_request(self.staff_user), "Django")
+
+    def test_display_text_built_without_instances(self):
+        result = self._search(GlobalSearch(admin.site).search)
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners by John Doe"})
+        [item] = result.apps[0].models[0].items
+        self.assertEqual(item.url, f"/admin/test_app/book/{self.book.pk}/change/")
+
+    @override_settings(GLOBAL_SEARCH_HYDRATION="single_query")
+    def test_single_query_hydration(self):
+        result = self._search(GlobalSearch(admin.site).search)
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners by John Doe"})
+
+    def test_async_search(self):
+        result = self._search(async_to_sync(AsyncGlobalSearch(admin.site).search))
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners by John Doe"})
+
+    def test_foreign_key_placeholder_shows_primary_key(self):
+        book_admin = admin.site._registry[Book]
+        with mock.patch.object(
+            book_admin, "global_search_display", "{title} by {author}", create=True
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(_result_texts(result), {f"Django for Beginners by {self.author.pk}"})
+
+    def test_ignored_when_view_permission_is_overridden(self):
+        class BookAdmin(type(admin.site._registry[Book])):
+            global_search_display = "{title} by {author__name}"
+
+        class PermissionBookAdmin(BookAdmin):
+            def has_view_permission(self, request, obj=None):
+                return True
+
+        searcher = GlobalSearch(admin.site)
+
+        self.assertEqual(
+            searcher._get_display_template(BookAdmin(Book, admin.site)),
+            "{title} by {author__name}",
+        )
+        self.assertIsNone(searcher._get_display_template(PermissionBookAdmin(Book, admin.site)))
+
+
+@override_settings(GLOBAL_SEARCH_AUTO_DEFER_ENABLED=True)
+class TestGlobalSearchAutoDefer(TestCase):
+    """Test deferring the large fields __str__ doesn't read."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners", description="A long description")
+
+    def setUp(self):
+        hydration.clear_hydration_plans()
+        self.addCleanup(hydration.clear_hydration_plans)
+
+    def _search_book_select(self):
+        with CaptureQueriesContext(connection) as context:
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners"})
+        [select] = [
+            captured["sql"].split(" FROM ")[0]
+            for captured in context.captured_queries
+            if captured["sql"].startswith('SELECT "test_app_book"."id", "test_app_book"."title"')
+        ]
+        return select
+
+    def test_defers_after_first_search(self):
+        self.assertIn('"test_app_book"."description"', self._search_book_select())
+        self.assertNotIn('"test_app_book"."description"', self._search_book_select())
+
+    @override_settings(GLOBAL_SEARCH_HYDRATION="single_query")
+    def test_single_query_hydration(self):
+        self.assertIn('"test_app_book"."description"', self._search_book_select())
+        self.assertNotIn('"test_app_book"."description"', self._search_book_select())
+
+    @override_settings(GLOBAL_SEARCH_AUTO_DEFER_ENABLED=False)
+    def test_disabled_by_default(self):
+        self._search_book_select()
+
+        self.assertFalse(hydration.is_hydration_plan_known(Book))
+
+
+class TestGlobalSearchSelectRelated(TestCase):
+    """Test joining the relations __str__ follows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        BookFactory(title="Django for Beginners", author=cls.author)
+        BookFactory(title="Django for Professionals", author=cls.author)
+
+    def setUp(self):
+        hydration.clear_hydration_plans()
+        self.addCleanup(hydration.clear_hydration_plans)
+        patcher = mock.patch.object(Book, "__str__", lambda book: f"{book.title} ({book.author})")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _search(self):
+        book_ct = ContentType.objects.get_for_model(Book)
+        with CaptureQueriesContext(connection) as context:
+            result = GlobalSearch(admin.site).search(
+                _make_request(self.staff_user), "Django", content_type_ids=[book_ct.id]
+            )
+
+        self.assertEqual(
+            _result_texts(result),
+            {"Django for Beginners (John Doe)", "Django for Professionals (John Doe)"},
+        )
+        return len(context.captured_queries)
+
+    def test_warns_when_str_runs_a_query_per_result(self):
+        with self.assertLogs("django_global_search.hydration", "WARNING") as logs:
+            self._search()
+
+        self.assertIn("ran 2 queries for 2 objects", logs.output[0])
+
+    def test_joins_relations_after_first_search(self):
+        num_queries = self._search()
+
+        with override_settings(GLOBAL_SEARCH_AUTO_SELECT_RELATED_ENABLED=True):
+            self._search()
+            self.assertEqual(hydration.get_hydration_plan(Book).select_related, ("author",))
+            # No query per book to load its author
+            self.assertEqual(self._search(), num_queries - 2)
+
+    def test_explicit_select_related(self):
+        book_admin = admin.site._registry[Book]
+        with (
+            mock.patch.object(book_admin, "global_search_select_related", ["author"], create=True),
+            mock.patch("django_global_search.searcher.warn_n_plus_one") as mock_warn_n_plus_one,
+        ):
+            self._search()
+
+        mock_warn_n_plus_one.assert_not_called()
+
+
+@override_settings(GLOBAL_SEARCH_MAX_RESULTS_PER_MODEL=1)
+class TestGlobalSearchObjectPermissions(TestCase):
+    """Test the object level view permission check."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.hidden_book = BookFactory(title="Django for Beginners", is_active=False)
+        cls.book = BookFactory(title="Django for Professionals")
+
+    def _search_books(self):
+        book_ct = ContentType.objects.get_for_model(Book)
+        with mock.patch.object(admin.site._registry[Book], "ordering", ["pk"]):
+            result = GlobalSearch(admin.site).search(
+                _make_request(self.staff_user), "Django", content_type_ids=[book_ct.id]
+            )
+        return _result_texts(result)
+
+    def _patch_book_admin(self, name, side_effect):
+        return mock.patch.object(
+            admin.site._registry[Book], name, side_effect=side_effect, create=True
+        )
+
+    def test_has_view_permission_per_object(self):
+        with self._patch_book_admin(
+            "has_view_permission", lambda request, obj=None: obj is None or obj.is_active
+        ):
+            # The only book fetched isn't viewable
+            self.assertEqual(self._search_books(), set())
+
+    def test_permitted_queryset(self):
+        with (
+            self._patch_book_admin(
+                "get_global_search_permitted_queryset",
+                lambda request, queryset: queryset.filter(is_active=True),
+            ),
+            self._patch_book_admin("has_view_permission", lambda request, obj=None: obj is None),
+        ):
+            # The limit yields a viewable book, not checked again object by object
+            self.assertEqual(self._search_books(), {"Django for Professionals"})
+
+    def test_has_view_permission_bulk(self):
+        with self._patch_book_admin(
+            "has_view_permission_bulk",
+            lambda request, objs: [obj for obj in objs if obj.is_active],
+        ) as mock_has_view_permission_bulk:
+            self.assertEqual(self._search_books(), set())
+
+        mock_has_view_permission_bulk.assert_called_once()
+        _request, objs = mock_has_view_permission_bulk.call_args.args
+        self.assertEqual(objs, [self.hidden_book])
+
+
+@override_settings(GLOBAL_SEARCH_MAX_RESULTS_PER_MODEL=1, GLOBAL_SEARCH_PERMISSION_SCAN_LIMIT=10)
+class TestGlobalSearchPermissionScan(TestCase):
+    """Test paging through results dropped by object level permissions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        for number in range(3):
+            BookFactory(title=f"Django Hidden {number}", is_active=False)
+        BookFactory(title="Django for Professionals")
+
+    def setUp(self):
+        permit_rate._trackers.clear()
+        self.addCleanup(permit_rate._trackers.clear)
+        book_admin = admin.site._registry[Book]
+        for patcher in [
+            mock.patch.object(book_admin, "ordering", ["pk"]),
+            mock.patch.object(
+                book_admin,
+                "has_view_permission",
+                side_effect=lambda request, obj=None: obj is None or obj.is_active,
+            ),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _search_books(self):
+        book_ct = ContentType.objects.get_for_model(Book)
+        result = GlobalSearch(admin.site).search(
+            _make_request(self.staff_user), "Django", content_type_ids=[book_ct.id]
+        )
+        return result.apps[0].models[0] if result.apps else None
+
+    def test_pages_until_a_viewable_result(self):
+        book_result = self._search_books()
+
+        self.assertEqual(
+            [item.display_text for item in book_result.items], ["Django for Professionals"]
+        )
+        self.assertFalse(book_result.has_more)
+        tracker = permit_rate.get_permit_rate_tracker(admin.site.name)
+        role = get_permission_fingerprint(_make_request(self.staff_user))
+        self.assertLess(tracker.get_estimate("test_app.book", role), 1.0)
+
+    @override_settings(GLOBAL_SEARCH_HYDRATION="single_query")
+    def test_single_query_hydration(self):
+        book_result = self._search_books()
+
+        self.assertEqual(
+            [item.display_text for item in book_result.items], ["Django for Professionals"]
+        )
+
+    @override_settings(GLOBAL_SEARCH_PERMISSION_SCAN_LIMIT=2)
+    def test_scan_limit(self):
+        self.assertIsNone(self._search_books())
+
+    def test_over_fetches_by_observed_permit_rate(self):
+        self._search_books()
+
+        with CaptureQueriesContext(connection) as context:
+            self._search_books()
+
+        primary_key_queries = [
+            captured["sql"]
+            for captured in context.captured_queries
+            if captured["sql"].startswith('SELECT "test_app_book"."id" FROM')
+        ]
+        # A single batch is large enough to find a viewable book
+        self.assertEqual(len(primary_key_queries), 1)
+        self.assertNotIn("LIMIT 2", primary_key_queries[0])
+
+    def test_async_search(self):
+        book_ct = ContentType.objects.get_for_model(Book)
+        result = async_to_sync(AsyncGlobalSearch(admin.site).search)(
+            _make_request(self.staff_user), "Django", content_type_ids=[book_ct.id]
+        )
+
+        self.assertEqual(_result_texts(result), {"Django for Professionals"})
+
+
+@override_settings(GLOBAL_SEARCH_MAX_RESULTS=1)
+class TestGlobalSearchTopResults(TestCase):
+    """Test the top results mode."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_stops_searching_once_enough_results(self):
+        original_search_model = GlobalSearch._search_model
+        searched_models = []
+
+        def search_model(searcher, request, model_admin, *args, **kwargs):
+            searched_models.append(model_admin.model._meta.model_name)
+            return original_search_model(searcher, request, model_admin, *args, **kwargs)
+
+        with (
+            mock.patch.object(
+                admin.site._registry[Publisher], "global_search_priority", 10, create=True
+            ),
+            mock.patch.object(GlobalSearch, "_search_model", search_model),
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual([item.display_text for item in result.top_results], ["Django Press"])
+        self.assertEqual(_result_texts(result), {"Django Press"})
+        self.assertEqual(searched_models, ["publisher"])
+
+    @override_settings(GLOBAL_SEARCH_MAX_RESULTS=5)
+    def test_top_results_merge_models_by_priority(self):
+        book_admin = admin.site._registry[Book]
+        with mock.patch.object(book_admin, "global_search_priority", 10, create=True):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(
+            [(item.model_name, item.display_text) for item in result.top_results],
+            [("book", "Django for Beginners"), ("publisher", "Django Press")],
+        )
+
+    def test_async_stops_searching_once_enough_results(self):
+        publisher_admin = admin.site._registry[Publisher]
+        with mock.patch.object(publisher_admin, "global_search_priority", 10, create=True):
+            result = async_to_sync(AsyncGlobalSearch(admin.site).search)(
+                _make_request(self.staff_user), "Django"
+            )
+
+        self.assertEqual([item.display_text for item in result.top_results], ["Django Press"])
+
+    @override_settings(GLOBAL_SEARCH_MAX_RESULTS=None)
+    def test_disabled_by_default(self):
+        result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertEqual(result.top_results, [])
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Django Press"})
+
+
+class TestGlobalSearchPhases(TestCase):
+    """Test the indexed and full search phases."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+        cls.other_book = BookFactory(title="Two Scoops of Django", author=cls.author)
+
+    def test_indexed_phase_only_matches_prefixes(self):
+        result = GlobalSearch(admin.site).search(
+            _make_request(self.staff_user), "Django", phase=SearchPhase.INDEXED
+        )
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners"})
+
+    def test_full_phase_matches_anywhere(self):
+        result = GlobalSearch(admin.site).search(
+            _make_request(self.staff_user), "Django", phase=SearchPhase.FULL
+        )
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners", "Two Scoops of Django"})
+
+    def test_indexed_phase_keeps_model_admin_unchanged(self):
+        searcher = GlobalSearch(admin.site)
+        searcher.search(_make_request(self.staff_user), "Django", phase=SearchPhase.INDEXED)
+
+        self.assertEqual(searcher.search_phase, SearchPhase.FULL)
+        self.assertEqual(
+            admin.site._registry[Book].get_search_fields(_make_request(self.staff_user)),
+            ["title", "isbn", "description", "author__name"],
+        )
+
+    def test_async_indexed_phase(self):
+        result = async_to_sync(AsyncGlobalSearch(admin.site).search)(
+            _make_request(self.staff_user), "Django", phase=SearchPhase.INDEXED
+        )
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners"})
+
+
+@override_settings(GLOBAL_SEARCH_COALESCING_ENABLED=True)
+class TestGlobalSearchCoalescing(TestCase):
+    """Test coalescing identical concurrent searches."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory(is_superuser=False)
+        cls.other_staff_user = StaffUserFactory(is_superuser=False)
+        cls.superuser = StaffUserFactory()
+
+    def test_search_runs_through_coalescer(self):
+        searcher = GlobalSearch(admin.site)
+        with mock.patch("django_global_search.searcher.get_search_coalescer") as get_coalescer:
+            searcher.search(_make_request(self.staff_user), "  Django  ")
+
+        key, _search, timeout = get_coalescer.return_value.run.call_args.args
+        expected_key = searcher._get_coalescing_key(_make_request(self.staff_user), "Django")
+        self.assertEqual(key, expected_key)
+        self.assertEqual(timeout, searcher.settings.search_timeout_ms / 1000.0)
+
+    def test_async_search_runs_through_coalescer(self):
+        searcher = AsyncGlobalSearch(admin.site)
+        with mock.patch("django_global_search.searcher.get_search_coalescer") as get_coalescer:
+            get_coalescer.return_value.arun = mock.AsyncMock()
+            async_to_sync(searcher.search)(_make_request(self.staff_user), "  Django  ")
+
+        key, _search, timeout = get_coalescer.return_value.arun.call_args.args
+        expected_key = searcher._get_coalescing_key(_make_request(self.staff_user), "Django")
+        self.assertEqual(key, expected_key)
+        self.assertEqual(timeout, searcher.settings.search_timeout_ms / 1000.0)
+
+    def _search_concurrently(self, *users):
+        """Search concurrently as each user, returning the searches run and the results."""
+        calls = []
+        original_search = AsyncGlobalSearch._search
+
+        async def search(searcher, *args):
+            calls.append(args)
+            # Let the other searches join the flight
+            await asyncio.sleep(0.05)
+            return await original_search(searcher, *args)
+
+        async def search_all():
+            return await asyncio.gather(
+                *(
+                    AsyncGlobalSearch(admin.site).search(_make_request(user), "Django")
+                    for user in users
+                )
+            )
+
+        with mock.patch.object(AsyncGlobalSearch, "_search", search):
+            results = async_to_sync(search_all)()
+        return calls, results
+
+    def test_concurrent_async_searches_share_a_flight(self):
+        calls, results = self._search_concurrently(self.staff_user, self.staff_user)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(results[0], results[1])
+
+    def test_concurrent_searches_of_other_users_run_separately(self):
+        calls, results = self._search_concurrently(self.staff_user, self.other_staff_user)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIsNot(results[0], results[1])
+
+    @override_settings(GLOBAL_SEARCH_COALESCING_FINGERPRINT=get_permission_fingerprint)
+    def test_permission_fingerprint_shares_a_flight_between_users(self):
+        calls, results = self._search_concurrently(self.staff_user, self.other_staff_user)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(results[0], results[1])
+
+    def test_users_with_other_permissions_are_not_coalesced(self):
+        searcher = GlobalSearch(admin.site)
+
+        self.assertNotEqual(
+            searcher._get_coalescing_key(_make_request(self.staff_user), "Django"),
+            searcher._get_coalescing_key(_make_request(self.superuser), "Django"),
+        )
+
+    def test_users_with_same_permissions_are_not_coalesced(self):
+        searcher = GlobalSearch(admin.site)
+
+        self.assertNotEqual(
+            searcher._get_coalescing_key(_make_request(self.staff_user), "Django"),
+            searcher._get_coalescing_key(_make_request(self.other_staff_user), "Django"),
+        )
+
+    @override_settings(GLOBAL_SEARCH_COALESCING_FINGERPRINT=get_permission_fingerprint)
+    def test_permission_fingerprint_shares_results_between_users(self):
+        searcher = GlobalSearch(admin.site)
+
+        self.assertEqual(
+            searcher._get_coalescing_key(_make_request(self.staff_user), "Django"),
+            searcher._get_coalescing_key(_make_request(self.other_staff_user), "Django"),
+        )
+
+    @override_settings(GLOBAL_SEARCH_COALESCING_FINGERPRINT=lambda request: "shared")
+    def test_custom_fingerprint(self):
+        searcher = GlobalSearch(admin.site)
+
+        self.assertEqual(
+            searcher._get_coalescing_key(_make_request(self.staff_user), "Django"),
+            searcher._get_coalescing_key(_make_request(self.superuser), "Django"),
+        )
+
+
+@override_settings(GLOBAL_SEARCH_CANCELLATION_ENABLED=True)
+@mock.patch("django_global_search.cancellation.CANCELLATION_CHECK_INTERVAL", 0)
+class TestGlobalSearchCancellation(TestCase):
+    """Test cancelling searches superseded by a newer search of the same user."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.other_staff_user = StaffUserFactory()
+        cls.book = BookFactory(title="Django for Beginners")
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_newer_search_cancels_running_search(self):
+        model_results = GlobalSearch(admin.site).iter_search(
+            _make_request(self.staff_user), "Django"
+        )
+        next(model_results)
+
+        GlobalSearch(admin.site).search(_make_request(self.staff_user), "Python")
+
+        with self.assertRaises(SearchCancelledError):
+            list(model_results)
+
+    def test_search_of_other_user_does_not_cancel(self):
+        model_results = GlobalSearch(admin.site).iter_search(
+            _make_request(self.staff_user), "Django"
+        )
+        next(model_results)
+
+        GlobalSearch(admin.site).search(_make_request(self.other_staff_user), "Python")
+
+        self.assertTrue(list(model_results))
+
+    def test_async_newer_search_cancels_running_search(self):
+        async def search():
+            searcher = AsyncGlobalSearch(admin.site)
+            model_results = searcher.iter_search(_make_request(self.staff_user), "Django")
+            await model_results.__anext__()
+            await AsyncGlobalSearch(admin.site).search(_make_request(self.staff_user), "Python")
+            return [model_result async for model_result in model_results]
+
+        with self.assertRaises(SearchCancelledError):
+            async_to_sync(search)()
+
+    def test_async_search_cancelled_with_view(self):
+        """Cancelling the search (e.g. on client disconnect) cancels running model searches."""
+        request = _make_request(self.staff_user)
+        started_models = []
+        cancelled_models = []
+
+        async def search_model(searcher, request, model_admin, *args, **kwargs):
+            started_models.append(model_admin.model)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled_models.append(model_admin.model)
+                raise
+
+        async def cancel_search():
+            task = asyncio.ensure_future(AsyncGlobalSearch(admin.site).search(request, "Django"))
+            while Book not in started_models:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with mock.patch.object(AsyncGlobalSearch, "_search_model", search_model):
+            async_to_sync(cancel_search)()
+
+        self.assertIn(Book, cancelled_models)
+
+
+class TestGlobalSearchDatabaseRouting(TransactionTestCase):
+    """Test routing search queries to the ``replica`` database (a test mirror of default)."""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.staff_user = StaffUserFactory()
+        self.book = BookFactory(title="Django for Beginners")
+
+    def test_aliases_used_in_rotation(self):
+        request = _make_request(self.staff_user)
+        model_admin = admin.site._registry[Book]
+
+        aliases = [
+            get_search_database(["replica1", "replica2"], request, model_admin) for _ in range(3)
+        ]
+
+        self.assertEqual(aliases, ["replica1", "replica2", "replica1"])
+
+    @override_settings(GLOBAL_SEARCH_DATABASE_ALIAS="replica")
+    def test_search_queries_run_on_search_database(self):
+        with (
+            CaptureQueriesContext(connections["default"]) as default_queries,
+            CaptureQueriesContext(connections["replica"]) as replica_queries,
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertIn("Django for Beginners", _result_texts(result))
+        self.assertTrue(
+            any('"test_app_book"' in query["sql"] for query in replica_queries.captured_queries)
+        )
+        self.assertFalse(
+            any('"test_app_book"' in query["sql"] for query in default_queries.captured_queries)
+        )
+
+    def test_router_callable(self):
+        router = mock.Mock(return_value="replica")
+
+        with (
+            override_settings(GLOBAL_SEARCH_DATABASE_ALIAS=router),
+            CaptureQueriesContext(connections["replica"]) as replica_queries,
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertIn("Django for Beginners", _result_texts(result))
+        router.assert_any_call(mock.ANY, admin.site._registry[Book])
+        self.assertTrue(replica_queries.captured_queries)
+
+    @override_settings(GLOBAL_SEARCH_DATABASE_ALIAS=["default", "replica"])
+    def test_models_grouped_by_search_database(self):
+        searcher = GlobalSearch(admin.site)
+        request = _make_request(self.staff_user)
+        model_admins = searcher.get_searchable_model_admins(request)
+
+        database_groups = searcher._group_model_admins_by_database(request, model_admins)
+
+        self.assertEqual(set(database_groups), {"default", "replica"})
+        # The model searches run on the database they were grouped by
+        for using, indexes in database_groups.items():
+            for index in indexes:
+                self.assertEqual(searcher._get_search_database(request, model_admins[index]), using)
+
+    @override_settings(GLOBAL_SEARCH_DATABASE_ALIAS="replica")
+    def test_fallback_to_primary_when_replica_fails(self):
+        def fail(execute, sql, params, many, context):
+            raise OperationalError("replica unavailable")  # noqa: TRY003
+
+        with (
+            connections["replica"].execute_wrapper(fail),
+            CaptureQueriesContext(connections["default"]) as default_queries,
+            self.assertLogs("django_global_search.searcher", "WARNING"),
+        ):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertIn("Django for Beginners", _result_texts(result))
+        self.assertTrue(
+            any('"test_app_book"' in query["sql"] for query in default_queries.captured_queries)
+        )
+
+
+class TestAsyncGlobalSearch(TestCase):
+    """Test AsyncGlobalSearch."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django for Beginners", author=cls.author)
+        cls.publisher = PublisherFactory(name="Django Press")
+
+    def test_async_search_matches_sync_search(self):
+        request = _make_request(self.staff_user)
+
+        async_result = async_to_sync(AsyncGlobalSearch(admin.site).search)(request, "Django")
+        sync_result = GlobalSearch(admin.site).search(request, "Django")
+
+        self.assertFalse(async_result.is_timeout)
+        self.assertEqual(_result_summary(async_result), _result_summary(sync_result))
+
+    def test_async_search_with_content_type_filter(self):
+        book_ct = ContentType.objects.get_for_model(Book)
+
+        result = async_to_sync(AsyncGlobalSearch(admin.site).search)(
+            _make_request(self.staff_user), "Django", content_type_ids=[book_ct.id]
+        )
+
+        self.assertEqual(_result_texts(result), {"Django for Beginners"})
+
+    def test_async_iter_search_yields_every_model(self):
+        async def collect():
+            searcher = AsyncGlobalSearch(admin.site)
+            return [
+                model_result
+                async for model_result in searcher.iter_search(
+                    _make_request(self.staff_user), "Django"
+                )
+            ]
+
+        model_results = async_to_sync(collect)()
+
+        self.assertEqual(
+            sorted(
+                model_result.model_name
+                for model_result in model_results
+                if model_result.app_label == "test_app"
+            ),
+            ["author", "book", "publisher"],
+        )
+
+    @override_settings(
+        GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True,
+        GLOBAL_SEARCH_DATABASE_TIMEOUTS_MS={"default": 0},
+    )
+    def test_async_search_database_timeout(self):
+        result = async_to_sync(AsyncGlobalSearch(admin.site).search)(
+            _make_request(self.staff_user), "Django"
+        )
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(
+            {m.status for m in result.unsearched_models}, {ModelSearchStatus.TIMED_OUT}
+        )
+
+    def test_async_search_query_too_short(self):
+        with self.assertRaises(ValueError):
+            async_to_sync(AsyncGlobalSearch(admin.site).search)(_make_request(self.staff_user), "a")
+
+
+@override_settings(GLOBAL_SEARCH_MAX_WORKERS=4)
+class TestGlobalSearchConcurrent(TransactionTestCase):
+    """Test GlobalSearch with a thread pool (workers use their own connections)."""
+
+    def setUp(self):
+        self.staff_user = StaffUserFactory()
+        author = AuthorFactory(name="John Doe")
+        BookFactory(title="Django for Beginners", author=author)
+        BookFactory(title="Python Advanced", author=AuthorFactory(name="Jane Smith"))
+        PublisherFactory(name="Django Press")
+
+    def test_concurrent_search_matches_sequential_search(self):
+        request = _make_request(self.staff_user)
+
+        concurrent_result = GlobalSearch(admin.site).search(request, "Django")
+        with override_settings(GLOBAL_SEARCH_MAX_WORKERS=1):
+            sequential_result = GlobalSearch(admin.site).search(request, "Django")
+
+        self.assertFalse(concurrent_result.is_timeout)
+        self.assertEqual(_result_summary(concurrent_result), _result_summary(sequential_result))
+        self.assertEqual(_result_texts(concurrent_result), {"Django for Beginners", "Django Press"})
+
+    def test_concurrent_search_timeout(self):
+        with override_settings(GLOBAL_SEARCH_TIMEOUT_MS=0):
+            result = GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(result.apps, [])
+
+    @override_settings(
+        GLOBAL_SEARCH_MAX_WORKERS=2,
+        GLOBAL_SEARCH_TIMEOUT_MS=150,
+        GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True,
+    )
+    def test_no_model_search_starts_after_deadline(self):
+        original_search_model = GlobalSearch._search_model
+        search_start_times = []
+
+        def search_model(searcher, *args):
+            search_start_times.append(time.perf_counter())
+            time.sleep(0.1)
+            return original_search_model(searcher, *args)
+
+        with mock.patch.object(GlobalSearch, "_search_model", search_model):
+            start_time = time.perf_counter()
+            model_results = GlobalSearch(admin.site).iter_search(
+                _make_request(self.staff_user), "Django"
+            )
+            next(model_results)
+            # While the consumer is busy, the pool must not start the queued searches
+            time.sleep(0.3)
+            statuses = [model_result.status for model_result in model_results]
+
+        self.assertIn(ModelSearchStatus.SKIPPED, statuses)
+        self.assertTrue(search_start_times)
+        self.assertLess(max(search_start_times) - start_time, 0.15)
+
+    @override_settings(GLOBAL_SEARCH_MAX_WORKERS=2, GLOBAL_SEARCH_MAX_RESULTS=1)
+    def test_running_model_searches_stop_with_search(self):
+        searcher = GlobalSearch(admin.site)
+        searcher.search(_make_request(self.staff_user), "Django")
+
+        # Running model searches check it before their next query
+        self.assertTrue(searcher.search_stopped.is_set())
+        self.assertTrue(searcher._get_is_cancelled()())
+
+
+@override_settings(GLOBAL_SEARCH_DATABASE_FAN_OUT_ENABLED=True)
+class TestGlobalSearchDatabaseFanOut(TransactionTestCase):
+    """Test searching the models of each database in its own thread."""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.staff_user = StaffUserFactory()
+        BookFactory(title="Django for Beginners", author=AuthorFactory(name="John Doe"))
+        PublisherFactory(name="Django Press")
+
+    def _search_with_book_on_replica(self):
+        """Search books on the ``replica`` database and the other models on default."""
+
+        def route_books_to_replica(request, model_admin):
+            return "replica" if model_admin.model is Book else None
+
+        with override_settings(GLOBAL_SEARCH_DATABASE_ALIAS=route_books_to_replica):
+            return GlobalSearch(admin.site).search(_make_request(self.staff_user), "Django")
+
+    def test_fan_out_search_matches_sequential_search(self):
+        fan_out_result = self._search_with_book_on_replica()
+        with override_settings(GLOBAL_SEARCH_DATABASE_FAN_OUT_ENABLED=False):
+            sequential_result = GlobalSearch(admin.site).search(
+                _make_request(self.staff_user), "Django"
+            )
+
+        self.assertFalse(fan_out_result.is_timeout)
+        self.assertEqual(_result_summary(fan_out_result), _result_summary(sequential_result))
+
+    @override_settings(
+        GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True,
+        GLOBAL_SEARCH_DATABASE_TIMEOUTS_MS={"replica": 0},
+    )
+    def test_database_timeout_keeps_other_database_results(self):
+        result = self._search_with_book_on_replica()
+
+        self.assertTrue(result.is_timeout)
+        self.assertEqual(_result_texts(result), {"Django Press"})
+        self.assertEqual(
+            [(m.model_name, m.status) for m in result.unsearched_models],
+            [("book", ModelSearchStatus.SKIPPED)],
+        )
+
+    def test_error_fails_fan_out_search(self):
+        with (
+            mock.patch.object(GlobalSearch, "_search_model", side_effect=RuntimeError("broken")),
+            self.assertRaises(RuntimeError),
+        ):
+            self._search_with_book_on_replica()
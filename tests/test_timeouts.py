@@ -0,0 +1,127 @@
+"""Database deadline tests."""
+
+import time
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from django_global_search import timeouts
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.timeouts import (
+    SearchTimeoutError,
+    database_deadline,
+    restore_statement_timeout,
+)
+from tests.test_app.models import Book
+
+# Counts far enough to take minutes in SQLite unless interrupted
+SLOW_QUERY = """
+    WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter LIMIT 1000000000)
+    SELECT COUNT(*) FROM counter
+"""
+
+
+class TestDatabaseDeadline(TestCase):
+    """Test database_deadline."""
+
+    def test_query_within_deadline(self):
+        with database_deadline("default", time.perf_counter() + 10):
+            self.assertEqual(list(Book.objects.all()), [])
+
+    def test_query_refused_after_deadline(self):
+        with (
+            self.assertRaises(SearchTimeoutError),
+            database_deadline("default", time.perf_counter() - 1),
+        ):
+            list(Book.objects.all())
+
+    def test_running_query_cancelled_at_deadline(self):
+        start_time = time.perf_counter()
+
+        with (
+            self.assertRaises(SearchTimeoutError),
+            database_deadline("default", start_time + 0.05),
+            connection.cursor() as cursor,
+        ):
+            cursor.execute(SLOW_QUERY)
+            cursor.fetchone()
+
+        self.assertLess(time.perf_counter() - start_time, 5)
+
+    def test_connection_usable_after_cancel(self):
+        with (
+            self.assertRaises(SearchTimeoutError),
+            database_deadline("default", time.perf_counter() + 0.05),
+            connection.cursor() as cursor,
+        ):
+            cursor.execute(SLOW_QUERY)
+
+        self.assertEqual(Book.objects.count(), 0)
+
+    def test_query_refused_after_cancellation(self):
+        with (
+            self.assertRaises(SearchCancelledError),
+            database_deadline("default", time.perf_counter() + 10, is_cancelled=lambda: True),
+        ):
+            list(Book.objects.all())
+
+    def test_running_query_interrupted_on_cancellation(self):
+        cancel_time = time.perf_counter() + 0.1
+        start_time = time.perf_counter()
+
+        with (
+            self.assertRaises(SearchCancelledError),
+            database_deadline(
+                "default",
+                time.perf_counter() + 10,
+                is_cancelled=lambda: time.perf_counter() > cancel_time,
+            ),
+            connection.cursor() as cursor,
+        ):
+            cursor.execute(SLOW_QUERY)
+            cursor.fetchone()
+
+        self.assertLess(time.perf_counter() - start_time, 5)
+
+
+class TestRestoreStatementTimeout(SimpleTestCase):
+    """Test restore_statement_timeout with a mocked PostgreSQL connection."""
+
+    def setUp(self):
+        self.cursor = mock.MagicMock()
+        self.cursor.fetchone.return_value = ("30s",)
+        self.connection = mock.MagicMock(vendor="postgresql", in_atomic_block=True)
+        self.connection.cursor.return_value.__enter__.return_value = self.cursor
+        patch = mock.patch.object(timeouts, "connections", {"default": self.connection})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _executed_sql(self):
+        return [call.args for call in self.cursor.execute.call_args_list]
+
+    def test_restored_inside_transaction(self):
+        with restore_statement_timeout("default"):
+            self.assertEqual(
+                self._executed_sql(), [("SELECT current_setting('statement_timeout')",)]
+            )
+
+        self.assertEqual(
+            self._executed_sql()[1:],
+            [("SELECT set_config('statement_timeout', %s, true)", ["30s"])],
+        )
+
+    def test_not_restored_outside_transaction(self):
+        self.connection.in_atomic_block = False
+
+        with restore_statement_timeout("default"):
+            pass
+
+        self.cursor.execute.assert_not_called()
+
+    def test_not_restored_after_error(self):
+        # Rolling back the savepoint restores the value
+        with self.assertRaises(SearchTimeoutError), restore_statement_timeout("default"):
+            raise SearchTimeoutError
+
+        self.assertEqual(len(self._executed_sql()), 1)
@@ -0,0 +1,66 @@
+"""UNION ALL query tests."""
+
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import Count
+from django.test import SimpleTestCase
+
+from django_global_search.union import can_union, get_union_queryset, supports_union
+from tests.test_app.models import Book, Publisher
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
+
+
+class TestSupportsUnion(SimpleTestCase):
+    """Test supports_union."""
+
+    def test_not_supported_on_sqlite(self):
+        self.assertFalse(supports_union("default"))
+
+
+class TestCanUnion(SimpleTestCase):
+    """Test can_union."""
+
+    def test_plain_queryset(self):
+        self.assertTrue(can_union(Book.objects.filter(title__icontains="django")))
+
+    def test_distinct_queryset(self):
+        self.assertFalse(can_union(Book.objects.distinct()))
+
+    def test_annotated_queryset(self):
+        self.assertFalse(can_union(Book.objects.annotate(Count("pk"))))
+
+
+@skipUnless(psycopg, "psycopg is not installed")
+class TestUnionQuerySQL(SimpleTestCase):
+    """Test the SQL of the UNION ALL query, compiled for PostgreSQL without connecting."""
+
+    def _compile(self, querysets):
+        from django.db.backends.postgresql.base import DatabaseWrapper
+
+        postgresql = DatabaseWrapper(
+            {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"}, "postgresql"
+        )
+        sql, _params = (
+            get_union_queryset(querysets, 11).query.get_compiler(connection=postgresql).as_sql()
+        )
+        return sql
+
+    def test_union_ordered_by_tag_and_row_number(self):
+        sql = self._compile([Book.objects.all(), Publisher.objects.all()])
+
+        # Columns: tag, primary key, row number
+        self.assertTrue(sql.endswith(") ORDER BY 1 ASC, 3 ASC"), sql)
+
+    def test_rows_numbered_in_queryset_ordering(self):
+        sql = self._compile([Book.objects.order_by("-title"), Publisher.objects.all()])
+
+        self.assertIn(
+            'ROW_NUMBER() OVER (ORDER BY "test_app_book"."title" DESC, "test_app_book"."id" ASC)',
+            sql,
+        )
+        self.assertIn('ROW_NUMBER() OVER (ORDER BY "test_app_publisher"."id" ASC)', sql)
@@ -1,10 +1,22 @@
 """GlobalSearchView integration tests."""
 
-from django.contrib.auth.models import Permission
+import json
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib import admin
+from django.contrib.auth.models import AnonymousUser, Permission
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase, override_settings
+from django.db import OperationalError
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
+from django_global_search import circuit_breaker
+from django_global_search.admission import SearchRejectedError, clear_admission_controllers
+from django_global_search.cancellation import SearchCancelledError
+from django_global_search.searcher import GlobalSearch
+from django_global_search.timeouts import SearchTimeoutError
+from django_global_search.views import AsyncGlobalSearchView
 from tests.factories import (
     AuthorFactory,
     BookFactory,
@@ -194,6 +206,229 @@ class TestGlobalSearchView(TestCase):
             response = self.client.get(self.url, {"q": ""})
             self.assertEqual(response.status_code, 200)
 
+    @override_settings(GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True)
+    def test_search_shows_unsearched_models_with_retry_link(self):
+        self.client.force_login(self.staff_user)
+        book_ct = ContentType.objects.get_for_model(Book)
+
+        with mock.patch.object(
+            GlobalSearch, "_search_model", autospec=True, side_effect=SearchTimeoutError
+        ):
+            response = self.client.get(self.url, {"q": "Django", "content_type": book_ct.id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Search timeout exceeded")
+        self.assertEqual([m["model_name"] for m in response.context["unsearched_models"]], ["book"])
+        self.assertContains(response, f"content_type={book_ct.id}")
+
+    def test_search_cancelled_by_newer_search(self):
+        self.client.force_login(self.staff_user)
+
+        with mock.patch.object(GlobalSearch, "search", side_effect=SearchCancelledError):
+            response = self.client.get(self.url, {"q": "Django"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Search cancelled by a newer search.")
+
+    @override_settings(
+        GLOBAL_SEARCH_PARTIAL_RESULTS_ENABLED=True,
+        GLOBAL_SEARCH_CIRCUIT_BREAKER_FAILURE_THRESHOLD=1,
+    )
+    def test_models_skipped_by_circuit_breaker_in_header(self):
+        self.client.force_login(self.staff_user)
+        with mock.patch.object(GlobalSearch, "_search_model", side_effect=OperationalError):
+            self.client.get(self.url, {"q": "Django"})
+
+        try:
+            response = self.client.get(self.url, {"q": "Django"})
+        finally:
+            circuit_breaker._circuit_breakers.clear()
+
+        self.assertContains(response, "Skipped after repeated failures:")
+        self.assertContains(response, "Temporarily skipped after repeated failures")
+
+    @override_settings(GLOBAL_SEARCH_MAX_RESULTS=2)
+    def test_top_results(self):
+        self.client.force_login(self.staff_user)
+
+        response = self.client.get(self.url, {"q": "Django"})
+
+        self.assertEqual(len(response.context["top_results"]), 2)
+        self.assertContains(response, "Top results")
+
+    @override_settings(GLOBAL_SEARCH_TWO_PHASE_ENABLED=True)
+    def test_two_phase_search_fetches_full_phase_on_demand(self):
+        self.client.force_login(self.staff_user)
+
+        response = self.client.get(self.url, {"q": "Guide"})
+
+        self.assertEqual(response.context["search_results"], [])
+        self.assertEqual(response.context["full_search_url"], "?q=Guide&phase=full")
+
+        response = self.client.get(self.url, {"q": "Guide", "phase": "full"})
+
+        self.assertIsNone(response.context["full_search_url"])
+        self.assertContains(response, "Django Testing Guide")
+
+    def test_search_rejected_when_busy(self):
+        self.client.force_login(self.staff_user)
+
+        with mock.patch.object(GlobalSearch, "search", side_effect=SearchRejectedError):
+            response = self.client.get(self.url, {"q": "Django"})
+
+        self.assertContains(
+            response, "Too many searches are running. Please retry in a moment.", status_code=503
+        )
+        self.assertEqual(response["Retry-After"], "1")
+
+
+class TestGlobalSearchStreamView(TestCase):
+    """Test streaming search results."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django Book", author=cls.author)
+        cls.publisher = PublisherFactory(name="Django Press")
+        cls.url = reverse("admin:global_search")
+        cls.stream_url = reverse("admin:global_search_stream")
+
+    def _get_events(self, data):
+        response = self.client.get(self.stream_url, data)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_staff_member_required(self):
+        response = self.client.get(self.stream_url, {"q": "Django"})
+
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(GLOBAL_SEARCH_STREAMING_ENABLED=True)
+    def test_search_page_defers_to_stream(self):
+        self.client.force_login(self.staff_user)
+
+        response = self.client.get(self.url, {"q": "Django"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, f'data-stream-url="{self.stream_url}?q=Django"')
+        self.assertNotContains(response, "Django Book")
+
+    def test_stream_yields_model_events_then_done(self):
+        self.client.force_login(self.staff_user)
+
+        events = self._get_events({"q": "Django"})
+
+        self.assertEqual([event["type"] for event in events], ["model", "model", "done"])
+        self.assertIn("Django Book", events[0]["html"])
+        self.assertIn("Django Press", events[1]["html"])
+        self.assertIn('Search results for "Django"', events[-1]["header_html"])
+        self.assertFalse(events[-1]["is_timeout"])
+
+    def test_stream_no_results(self):
+        self.client.force_login(self.staff_user)
+
+        events = self._get_events({"q": "Nothing matches"})
+
+        self.assertEqual([event["type"] for event in events], ["done"])
+        self.assertIn("No results found", events[0]["header_html"])
+
+    def test_stream_invalid_query(self):
+        self.client.force_login(self.staff_user)
+
+        events = self._get_events({"q": "a"})
+
+        self.assertEqual(events, [{"type": "error", "message": "Invalid query"}])
+
+    def test_stream_reports_unsearched_models(self):
+        self.client.force_login(self.staff_user)
+
+        with mock.patch.object(
+            GlobalSearch, "_search_model", autospec=True, side_effect=SearchTimeoutError
+        ):
+            events = self._get_events({"q": "Django"})
+
+        self.assertEqual([event["type"] for event in events], ["done"])
+        self.assertTrue(events[0]["is_timeout"])
+        self.assertIn("Search these models again", events[0]["unsearched_html"])
+
+    def test_stream_cancelled_by_newer_search(self):
+        self.client.force_login(self.staff_user)
+
+        with mock.patch.object(
+            GlobalSearch, "_search_model", autospec=True, side_effect=SearchCancelledError
+        ):
+            events = self._get_events({"q": "Django"})
+
+        self.assertEqual(
+            events, [{"type": "error", "message": "Search cancelled by a newer search."}]
+        )
+
+    @override_settings(GLOBAL_SEARCH_TWO_PHASE_ENABLED=True)
+    def test_two_phase_stream(self):
+        self.client.force_login(self.staff_user)
+
+        events = self._get_events({"q": "Django"})
+
+        # Models are streamed by the indexed phase, then again by the full phase
+        self.assertEqual([event["type"] for event in events], ["model"] * 4 + ["done"])
+
+    @override_settings(GLOBAL_SEARCH_MAX_RESULTS=1)
+    def test_stream_top_results(self):
+        self.client.force_login(self.staff_user)
+
+        events = self._get_events({"q": "Django"})
+
+        self.assertIn("Top results", events[-1]["top_results_html"])
+        self.assertEqual(events[-1]["top_results_html"].count('class="result-item"'), 1)
+
+    @override_settings(
+        GLOBAL_SEARCH_MAX_CONCURRENT_SEARCHES=1,
+        GLOBAL_SEARCH_QUEUE_TIMEOUT_MS=0,
+        GLOBAL_SEARCH_DEGRADED_SEARCH_TIMEOUT_MS=1000,
+    )
+    def test_stream_reports_degraded_search(self):
+        clear_admission_controllers()
+        self.addCleanup(clear_admission_controllers)
+        self.client.force_login(self.staff_user)
+        request = RequestFactory().get("/")
+        request.user = self.staff_user
+        # A running search holds the only search slot
+        model_results = GlobalSearch(admin.site).iter_search(request, "Django")
+        next(model_results)
+
+        events = self._get_events({"q": "Django"})
+
+        list(model_results)
+        self.assertEqual(events[-1]["type"], "done")
+        self.assertIn(
+            "Too many searches are running. Showing the results of a reduced search.",
+            events[-1]["unsearched_html"],
+        )
+        self.assertEqual(events[-1]["top_results_html"].strip(), "")
+
+    def test_stream_rejected_when_busy(self):
+        self.client.force_login(self.staff_user)
+
+        with (
+            mock.patch.object(
+                GlobalSearch, "_acquire_search_slot", autospec=True, side_effect=SearchRejectedError
+            ),
+            override_settings(GLOBAL_SEARCH_MAX_CONCURRENT_SEARCHES=1),
+        ):
+            events = self._get_events({"q": "Django"})
+
+        self.assertEqual(
+            events,
+            [
+                {
+                    "type": "error",
+                    "message": "Too many searches are running. Please retry in a moment.",
+                }
+            ],
+        )
+
 
 class TestGlobalSearchViewExcludedModels(TestCase):
     """Test excluded_models configuration."""
@@ -356,3 +591,39 @@ class TestGlobalSearchViewPermissions(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Tech Publisher")
+
+
+class TestAsyncGlobalSearchView(TestCase):
+    """Test AsyncGlobalSearchView."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = StaffUserFactory()
+        cls.author = AuthorFactory(name="John Doe")
+        cls.book = BookFactory(title="Django Book", author=cls.author)
+        cls.url = reverse("admin:global_search")
+
+    def _get(self, user, data=None):
+        request = RequestFactory().get(self.url, data or {})
+        request.user = user
+        view = admin.site.async_admin_view(AsyncGlobalSearchView.as_view(admin_site=admin.site))
+        return async_to_sync(view)(request)
+
+    def test_staff_member_required(self):
+        response = self._get(AnonymousUser())
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("/admin/login/", response.url)
+
+    def test_search_with_valid_query(self):
+        response = self._get(self.staff_user, {"q": "Django"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Django Book")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_search_with_minimum_query_length(self):
+        response = self._get(self.staff_user, {"q": "a"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Invalid query")